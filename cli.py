@@ -5,6 +5,7 @@ from typing import Iterable, Sequence
 
 from bootstrap import Dependencies, load_dependencies
 from MiniDBMS import MiniDBMS
+from explain_format import format_access_path, format_io_stats
 
 
 def _print_tree_structure(node, indent="", is_last=True) -> None:
@@ -96,6 +97,13 @@ def _handle_special_command(command: str, dbms: MiniDBMS, deps: Dependencies) ->
                     print(f"    Rows: {getattr(stats, 'n_r', 'N/A')}")
                     print(f"    Blocks: {getattr(stats, 'b_r', 'N/A')}")
                     print(f"    Block factor: {getattr(stats, 'f_r', 'N/A')}")
+
+                io_stats = storage_manager.get_io_stats(table_name) if hasattr(storage_manager, 'get_io_stats') else {}
+                io_lines = format_io_stats(io_stats)
+                if io_lines:
+                    print("\n  I/O (since start):")
+                    for line in io_lines:
+                        print(f"    {line}")
             else:
                 print(f"  Table '{table_name}' not found.")
         else:
@@ -197,6 +205,11 @@ def _handle_special_command(command: str, dbms: MiniDBMS, deps: Dependencies) ->
                 if 'heuristics_applied' in info:
                     print(f"      Heuristics: {', '.join(info['heuristics_applied'])}")
             
+            if optimized and optimized.query_tree:
+                print("\n  Storage Access Paths:")
+                for path in dbms.query_processor.explain_access_paths(optimized.query_tree):
+                    print(f"      {format_access_path(path)}")
+            
             print("\n  " + "=" * 70)
             
         except Exception as e:
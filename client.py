@@ -5,6 +5,8 @@ import socket
 import sys
 from typing import Any, Dict, Optional
 
+from explain_format import format_access_path, format_io_stats
+
 
 class DBMSClient:
     def __init__(self, host: str = "127.0.0.1", port: int = 13523):
@@ -242,6 +244,12 @@ def print_result(response: Optional[Dict[str, Any]]):
                 print(f"    Blocks: {stats.get('b_r')}")
             if stats.get("f_r") is not None:
                 print(f"    Block factor: {stats.get('f_r')}")
+        
+        io_lines = format_io_stats(response.get("io", {}))
+        if io_lines:
+            print("\n  I/O (since start):")
+            for line in io_lines:
+                print(f"    {line}")
         return
     
     if response_type == "list_transactions":
@@ -317,6 +325,12 @@ def print_result(response: Optional[Dict[str, Any]]):
                 else:
                     print(f"      Heuristics: {heuristics}")
         
+        access_paths = response.get("access_paths", [])
+        if access_paths:
+            print("\n  Storage Access Paths:")
+            for path in access_paths:
+                print(f"      {format_access_path(path)}")
+        
         print("\n  " + "=" * 70)
         return
     
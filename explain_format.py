@@ -0,0 +1,33 @@
+# format teks EXPLAIN / describe yang sama untuk cli.py (lokal) dan client.py (lewat server)
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+
+def format_access_path(path: Dict[str, Any]) -> str:
+    if path.get("method") == "partitioned":
+        parts = "; ".join(format_access_path(p) for p in path.get("partitions", []))
+        return f"{path['table']}: partitioned -> {parts}"
+    text = f"{path['table']}: {path['method']}"
+    if "index" in path:
+        text += (f" (index {path['index']} on {path['column']}, {path['matches']} rows, "
+                 f"{path['pages']}/{path['total_pages']} pages, threshold {path['threshold']})")
+    elif "pages" in path:
+        text += f" ({path['pages']}/{path['total_pages']} pages)"
+    return text
+
+
+def format_io_stats(io_stats: Dict[str, Any]) -> List[str]:
+    # baris I/O hasil StorageManager.get_io_stats(table); kosong kalau belum ada I/O
+    total = io_stats.get("total")
+    if not total:
+        return []
+    lines = [
+        f"Pages read/written: {total['pages_read']} / {total['pages_written']}",
+        f"Bytes read/written: {total['bytes_read']} / {total['bytes_written']}",
+        f"Fsyncs: {total['fsyncs']}",
+        f"Time read/write/fsync: {total['read_time']:.4f}s / {total['write_time']:.4f}s / {total['fsync_time']:.4f}s",
+    ]
+    for name, counters in sorted(io_stats.get("indexes", {}).items()):
+        lines.append(f"Index {name}: {counters['pages_read']} pages read, {counters['pages_written']} pages written")
+    return lines
@@ -20,6 +20,9 @@ class CostPlanner:
         # Cache untuk menyimpan statistik temporary tables (hasil join, selection, dll)
         # Key: identifier string, Value: dict dengan n_r, b_r, f_r, v_a_r
         self.temp_table_stats = {}
+
+        # Cache statistik tabel dari SM (get_stats scan seluruh tabel), berlaku selama umur planner
+        self.storage_stats_cache = {}
         
     # =================== HELPER FUNCTIONS STATISTIK ===================
     
@@ -31,6 +34,9 @@ class CostPlanner:
         if hasattr(table_name, 'name'):
             table_name = table_name.name
         
+        if table_name in self.storage_stats_cache:
+            return self.storage_stats_cache[table_name]
+        
         if self.storage_manager:
             try:
                 stats = self.storage_manager.get_stats(table_name)
@@ -55,6 +61,7 @@ class CostPlanner:
                     }
                 result['indexes'] = normalized_indexes
                 
+                self.storage_stats_cache[table_name] = result
                 return result
                 
             except Exception as e:
@@ -277,6 +284,14 @@ class CostPlanner:
         return ((left_table, left_attr), (right_table, right_attr))
     
 
+    def _is_equi_join(self, join_condition) -> bool:
+        # natural join atau theta join "kolom = kolom"
+        if repr(join_condition) == "NATURAL":
+            return True
+        condition = getattr(join_condition, 'condition', None)
+        return (isinstance(condition, ConditionNode) and condition.op == "="
+                and isinstance(condition.value, (ColumnNode, dict)))
+
     def store_temp_stats(self, table_id: str, n_r: int, b_r: int, f_r: int, v_a_r: dict, indexes: dict = None):
         self.temp_table_stats[table_id] = {
             'n_r': n_r,
@@ -289,16 +304,16 @@ class CostPlanner:
     
     # ======================= HELPER FUNCTIONS - DISPLAY/FORMATTING =======================
     
-    def _calculate_logical_node_selectivity(self, logical_node: LogicalNode, v_a_r: dict) -> float:
+    def _calculate_logical_node_selectivity(self, logical_node: LogicalNode, v_a_r: dict, table: str = None) -> float:
         if logical_node.operator == "AND":
             # Conjunction: multiply selectivities
             result = 1.0
             for child in logical_node.childs:
                 if isinstance(child, LogicalNode):
-                    child_selectivity = self._calculate_logical_node_selectivity(child, v_a_r)
+                    child_selectivity = self._calculate_logical_node_selectivity(child, v_a_r, table)
                     result *= child_selectivity
                 elif isinstance(child, ConditionNode):
-                    child_selectivity = self.estimate_selectivity(child, v_a_r)
+                    child_selectivity = self.estimate_selectivity(child, v_a_r, table)
                     result *= child_selectivity
             return result
         
@@ -307,10 +322,10 @@ class CostPlanner:
             product = 1.0
             for child in logical_node.childs:
                 if isinstance(child, LogicalNode):
-                    child_selectivity = self._calculate_logical_node_selectivity(child, v_a_r)
+                    child_selectivity = self._calculate_logical_node_selectivity(child, v_a_r, table)
                     product *= (1.0 - child_selectivity)
                 elif isinstance(child, ConditionNode):
-                    child_selectivity = self.estimate_selectivity(child, v_a_r)
+                    child_selectivity = self.estimate_selectivity(child, v_a_r, table)
                     product *= (1.0 - child_selectivity)
             return 1.0 - product
         
@@ -350,7 +365,7 @@ class CostPlanner:
     
     # ======================= SELECTIVITY ESTIMATION =======================
     
-    def estimate_selectivity(self, condition: ConditionNode, v_a_r: dict = None) -> float:
+    def estimate_selectivity(self, condition: ConditionNode, v_a_r: dict = None, table: str = None) -> float:
         if v_a_r is None:
             v_a_r = {}
         
@@ -385,7 +400,24 @@ class CostPlanner:
             return 0.5
         
         # Pattern matching: LIKE
+        # Prefix literal ('Data%') = range [prefix, prefix + max_char) di B+ tree,
+        # substring ('%data%') = irisan posting list index trigram;
+        # fraksinya dihitung dari index kalau ada
         elif op.upper() == "LIKE":
+            pattern = str(condition.value)
+            if '%' not in pattern and '_' not in pattern:
+                # tanpa wildcard sama dengan equality
+                if attribute and attribute in v_a_r:
+                    v_a = v_a_r[attribute]
+                    return 1.0 / v_a if v_a > 0 else 0.1
+                return 0.1
+            if self.storage_manager and table and attribute:
+                try:
+                    estimate = self.storage_manager.estimate_like_selectivity(table, attribute, pattern)
+                except Exception:
+                    estimate = None
+                if estimate is not None:
+                    return estimate
             return 0.2
         
         # IN clause: σ_A IN (v1,v2,...,vn)(r)
@@ -437,12 +469,12 @@ class CostPlanner:
         # Calculate selectivity based on condition type
         if isinstance(condition, LogicalNode):
             # LogicalNode: Use recursive helper for AND/OR (handles nesting)
-            selectivity = self._calculate_logical_node_selectivity(condition, input_v_a_r)
+            selectivity = self._calculate_logical_node_selectivity(condition, input_v_a_r, input_cost.get("table"))
             condition_str = self._logical_node_to_string(condition)
         
         elif isinstance(condition, ConditionNode):
             # Single ConditionNode
-            selectivity = self.estimate_selectivity(condition, input_v_a_r)
+            selectivity = self.estimate_selectivity(condition, input_v_a_r, input_cost.get("table"))
             condition_str = self._condition_node_to_string(condition)
         
         else:
@@ -578,6 +610,12 @@ class CostPlanner:
             join_method = "hash-join"
             join_cost = 3 * (left_b_r + right_b_r)
         
+        #kanan kiri B+ index → Sort-Merge Join, kedua sisi dibaca urut key lewat leaf B+ tree
+        elif (left_index and left_index.get('type') == 'b+' and
+              right_index and right_index.get('type') == 'b+'):
+            join_method = "sort-merge (b+)"
+            join_cost = left_b_r + right_b_r
+        
         #kanan pake B+ index → Index Nested-Loop Join
         elif right_index and right_index.get('type') == 'b+':
             join_method = "index-nested-loop (b+)"
@@ -591,6 +629,11 @@ class CostPlanner:
             c_bucket = right_b_r / m if m > 0 else right_b_r
             join_cost = left_b_r + (left_n_r * c_bucket)
         
+        #equi-join / natural join tanpa index → Hash Join in-memory (build + probe)
+        elif self._is_equi_join(node.val):
+            join_method = "hash-join"
+            join_cost = 3 * (left_b_r + right_b_r)
+        
         #No index → Nested-Loop Join
         else:
             join_method = "nested-loop"
@@ -812,7 +812,7 @@ def validate_query(query: str) -> tuple:
             re.IGNORECASE
         ),
         "CREATE": re.compile(
-            r'^\s*CREATE\s+TABLE\s+\w+\s*\(.+?\)\s*;$',
+            r'^\s*CREATE\s+TABLE\s+\w+\s*\(.+?\)(\s+PARTITION\s+BY\s+.+?)?\s*;$',
             re.IGNORECASE | re.DOTALL
         ),
         "DROP": re.compile(
@@ -1300,7 +1300,14 @@ def _split_by_keyword(text, keyword):
 # parse single comparison condition string dan return ConditionNode
 def _parse_single_condition(condition_str):
     condition_str = condition_str.strip()
-    
+
+    # LIKE dicek duluan karena pola bisa berisi karakter operator ('a=b%')
+    like_parts = _split_by_keyword(condition_str, ' LIKE ')
+    if len(like_parts) == 2:
+        left = _parse_column_reference(like_parts[0])
+        right = _parse_value_or_column(like_parts[1])
+        return ConditionNode(left, 'LIKE', right)
+
     operators = ['<>', '>=', '<=', '!=', '=', '>', '<']
     
     for op in operators:
@@ -4,12 +4,15 @@ import uuid
 from typing import Any, Callable, Union, List, cast
 import re
 import os
-import copy
 
 from qp_model.ExecutionResult import ExecutionResult
 from qp_model.Rows import Rows
 from qp_helper.query_utils import *
 from qp_helper.condition_adapter import NormalizedCondition
+from qp_helper.operators import (
+    Operator, Scan, Filter, Project, NestedLoopJoin, HashJoin, IndexNestedLoopJoin, SortMergeJoin,
+    Sort, Limit, Group, SetUnion,
+)
 
 from storage_manager.StorageManager import StorageManager as sm
 from storage_manager.storagemanager_model.data_retrieval import DataRetrieval as dr
@@ -17,7 +20,9 @@ from storage_manager.storagemanager_model.data_write import DataWrite as dw
 from storage_manager.storagemanager_model.condition import Condition as cond
 from storage_manager.storagemanager_helper.schema import Schema as sch
 from storage_manager.storagemanager_helper.slotted_page import SlottedPage  
+from storage_manager.storagemanager_helper.like import like_match
 from query_optimizer.QueryOptimizer import OptimizationEngine as oe
+from query_optimizer.helper.cost import CostPlanner
 from query_optimizer.model.query_tree import QueryTree as qt
 from failure_recovery_manager.FailureRecovery import FailureRecoveryManager as frm
 from concurrency_control_manager.ConcurrencyControlManager import ConcurrencyControlManager as ccm
@@ -46,6 +51,7 @@ class QueryProcessor:
         self._transaction_active = False
         self._transaction_changes: list = []
         self._table_aliases: dict = {}
+        self._cost_planner: CostPlanner | None = None
 
     def execute_query(self, query : str) -> ExecutionResult:
 
@@ -74,6 +80,18 @@ class QueryProcessor:
             elif query_type == QueryType.DROP_TABLE:
                 result_data = self.execute_drop_table(query)
 
+            elif query_type == QueryType.ALTER_TABLE:
+                result_data = self.execute_alter_table(query)
+
+            elif query_type == QueryType.VACUUM:
+                result_data = self.execute_vacuum(query)
+
+            elif query_type == QueryType.CREATE_INDEX:
+                result_data = self.execute_create_index(query)
+
+            elif query_type == QueryType.DROP_INDEX:
+                result_data = self.execute_drop_index(query)
+
             elif query_type == QueryType.BEGIN_TRANSACTION:
                 result_data =  self.execute_begin_transaction(query)
             
@@ -106,6 +124,7 @@ class QueryProcessor:
     # 3. execute query tree dan retrieve data dari storage manager
     def execute_select(self, query: str) -> Union[Rows, int]:
         self._table_aliases = {}
+        self._cost_planner = None
         parsed_query = self.optimization_engine.parse_query(query)
         optimized_query = self.optimization_engine.optimize_query(parsed_query)
         if optimized_query.query_tree is None:
@@ -149,52 +168,53 @@ class QueryProcessor:
         
         return Rows.from_list([f"Updated {result} rows"])
 
-    # recursively execute query tree untuk SELECT operations
-    # traverse dari root ke leaf (TABLE node) dan apply operations saat return
+    # execute query tree SELECT lewat plan operator fisik (Volcano):
+    # row ditarik dari root satu per satu, hanya hasil akhir yang dikumpulkan jadi Rows
     def _execute_query_tree(self, node: qt) -> Rows:
         if node is None:
             return Rows.from_list([])
-        
-        if node.type == "TABLE":
-            val_str = str(node.val)
-            if hasattr(node.val, 'name'):
-                val_str = str(node.val.name) # type: ignore
-            parts = val_str.split()
-            table_name = parts[0]
-            return self._fetch_table_data(table_name)
-        
-        child_results = []
-        for child in node.childs:
-            child_result = self._execute_query_tree(child)
-            child_results.append(child_result)
-        
+        return Rows.from_list(list(self._build_plan(node, self._scan_columns(node))))
+
+    # query tree -> operator fisik; belum ada row yang dibaca sampai plan di-open.
+    # scan_columns: kolom yang cukup dibaca storage (None = semua), lihat _scan_columns
+    def _build_plan(self, node: qt, scan_columns: list | None = None) -> Operator:
+        if node.type in ("TABLE", "SIGMA"):
+            table_node, sigmas = self._sigma_chain(node)
+            if table_node is not None:
+                return self._build_table_access(table_node, sigmas, scan_columns)
+
+        child_plans = [self._build_plan(child, scan_columns) for child in node.childs]
+
         if node.type == "PROJECT":
-            return self._apply_projection(child_results[0], node.val)
-        
+            col_list = self._projection_columns(node.val)
+            if col_list is None:
+                return child_plans[0]
+            return Project(
+                child_plans[0],
+                lambda row: self._project_row(row, col_list),
+                lambda row: self._check_projection(row, col_list),
+            )
+
         elif node.type == "SIGMA":
-            return self._apply_selection(child_results[0], node.val)
-        
+            return Filter(child_plans[0], lambda row: self._selection_predicate(node.val, row))
+
         elif node.type == "JOIN":
-            return self._apply_join(child_results[1], child_results[0], node.val)
-        
+            return self._build_join(node, child_plans[1], child_plans[0])
+
         elif node.type == "SORT":
-            return self._apply_sort(child_results[0], node.val)
-        
+            return self._build_sort(child_plans[0], node.val)
+
         elif node.type == "LIMIT":
-            return self._apply_limit(child_results[0], node.val)
-        
+            return self._build_limit(child_plans[0], node.val)
+
         elif node.type == "GROUP":
-            return self._apply_group(child_results[0], node.val)
-        
+            return Group(child_plans[0], node.val)
+
         elif node.type == "OR":
-            combined_data = []
-            for result in child_results:
-                combined_data.extend(result.data)
-            unique_data = list(set(combined_data))
-            return Rows.from_list(unique_data)
-        
+            return SetUnion(*child_plans)
+
         else:
-            return child_results[0] if child_results else Rows.from_list([])
+            return child_plans[0] if child_plans else Scan(list)
 
     # execute UPDATE query tree
     # returns jumlah rows yang ter-update
@@ -223,19 +243,174 @@ class QueryProcessor:
         
         return 0
 
-    def _fetch_table_data(self, table_name: Any) -> Rows:
+    # rantai SIGMA tepat di atas TABLE -> (TABLE node, kondisi SIGMA dari atas ke bawah); (None, []) kalau bukan
+    def _sigma_chain(self, node: qt):
+        sigmas = []
+        while node.type == "SIGMA" and len(node.childs) == 1:
+            sigmas.append(node.val)
+            node = node.childs[0]
+        if node.type != "TABLE":
+            return None, []
+        return node, sigmas
+
+    # TABLE (+ SIGMA di atasnya): kondisi sargable dan kolom yang dibutuhkan dikirim ke read_block
+    # supaya access path storage (index, zone map, row cache) dipakai; sisanya jadi Filter executor
+    def _build_table_access(self, table_node: qt, sigmas: list, scan_columns: list | None) -> Operator:
+        table_name = self._table_node_name(table_node)
+        schema_attrs = self._table_attributes(table_name)
+
+        pushed, residual = [], []
+        for condition in sigmas:
+            condition_pushed, condition_residual = self._split_storage_conditions(
+                condition, schema_attrs, self._table_node_names(table_node)
+            )
+            pushed.extend(condition_pushed)
+            residual.extend(condition_residual)
+
+        columns = scan_columns if scan_columns is not None else "*"
+        plan: Operator = Scan(lambda: self._fetch_table_data(table_name, pushed, columns), table_name)
+        for condition in reversed(residual):
+            plan = Filter(plan, lambda row, condition=condition: self._selection_predicate(condition, row))
+        return plan
+
+    # nama tabel dan alias yang boleh muncul sebagai prefix kolom di kondisi tabel ini
+    def _table_node_names(self, table_node: qt) -> set:
+        names = {self._table_node_name(table_node)}
+        alias = getattr(table_node.val, 'alias', None)
+        if alias is None:
+            parts = str(table_node.val).split()
+            alias = parts[-1] if len(parts) > 1 else None
+        if alias:
+            names.add(alias)
+        return names
+
+    def _table_attributes(self, table_name: str) -> list | None:
+        schema = self.storage_manager.schema_manager.get_table_schema(table_name)
+        if schema is None:
+            return None
+        return [attr["name"] for attr in schema.get_attributes()]
+
+    # kolom yang dibaca storage untuk plan satu tabel (PROJECT/SORT/LIMIT/SIGMA di atas TABLE):
+    # kolom PROJECT + SORT + kondisi yang tetap dievaluasi executor. None = baca semua kolom ("*"),
+    # termasuk untuk join, GROUP, SELECT *, atau kolom yang tidak ada di schema (error tetap dari PROJECT)
+    def _scan_columns(self, node: qt) -> list | None:
+        chain = []
+        while node.type in ("PROJECT", "SORT", "LIMIT") and len(node.childs) == 1:
+            chain.append(node)
+            node = node.childs[0]
+        table_node, sigmas = self._sigma_chain(node)
+        if table_node is None or not chain or chain[0].type != "PROJECT":
+            return None
+
+        table_name = self._table_node_name(table_node)
+        schema_attrs = self._table_attributes(table_name)
+        if schema_attrs is None:
+            return None
+
+        required = set()
+        for chain_node in chain:
+            if chain_node.type == "PROJECT":
+                col_list = self._projection_columns(chain_node.val)
+                if col_list is None:
+                    return None
+                required.update(col.split('.', 1)[1] if '.' in col else col for col in col_list)
+            elif chain_node.type == "SORT":
+                required.update(str(item.column.column) for item in chain_node.val)  # type: ignore
+        if not required.issubset(schema_attrs):
+            return None
+
+        # operand string bisa dibaca executor sebagai nama kolom, jadi ikut dibaca kalau ada di schema
+        referenced = set()
+        for condition in sigmas:
+            _, residual = self._split_storage_conditions(condition, schema_attrs, self._table_node_names(table_node))
+            for residual_condition in residual:
+                referenced.update(self._condition_columns(residual_condition))
+        return [attr for attr in schema_attrs if attr in required or attr in referenced]
+
+    def _condition_columns(self, condition: Any) -> set:
+        if condition.__class__.__name__ == "LogicalNode":
+            return {col for child in condition.childs for col in self._condition_columns(child)}
+        columns = set()
+        for operand in (getattr(condition, "attr", None), getattr(condition, "value", None)):
+            if hasattr(operand, "column"):
+                columns.add(str(operand.column))
+            elif isinstance(operand, str):
+                columns.add(operand.split('.', 1)[1] if '.' in operand else operand)
+        return columns
+
+    def _fetch_table_data(self, table_name: Any, conditions: list | None = None, columns: Any = "*") -> list:
         if hasattr(table_name, 'name'):
             table_str = str(table_name.name)
         else:
             table_str = str(table_name)
         
-        data_retrieval = self._data_retrieval_factory(table=table_str, column="*", conditions=[])
+        data_retrieval = self._data_retrieval_factory(table=table_str, column=columns, conditions=conditions or [])
         result = self.storage_manager.read_block(data_retrieval)
         
         if result is not None and isinstance(result, list):
-            return Rows.from_list(result)
+            return result
         else:
-            return Rows.from_list([])
+            return []
+
+    # access path storage (bitmap index scan / seq scan / clustered / lsm) per tabel di plan, untuk EXPLAIN
+    def explain_access_paths(self, node: qt) -> list:
+        if node is None:
+            return []
+
+        paths = []
+        if node.type == "SIGMA" and node.childs and node.childs[0].type == "TABLE":
+            table_str = self._table_node_name(node.childs[0])
+            conditions = self._storage_conditions(node.val)
+            paths.append(self.storage_manager.explain_access_path(
+                self._data_retrieval_factory(table=table_str, column="*", conditions=conditions)
+            ))
+            return paths
+
+        if node.type == "TABLE":
+            paths.append(self.storage_manager.explain_access_path(
+                self._data_retrieval_factory(table=self._table_node_name(node), column="*", conditions=[])
+            ))
+            return paths
+
+        for child in node.childs:
+            paths.extend(self.explain_access_paths(child))
+        return paths
+
+    def _table_node_name(self, node: qt) -> str:
+        if hasattr(node.val, 'name'):
+            return str(node.val.name)  # type: ignore
+        return str(node.val).split()[0]
+
+    # ConditionNode / AND dengan operand literal -> Condition storage; sisanya tetap dievaluasi executor
+    def _storage_conditions(self, condition: Any) -> list:
+        return self._split_storage_conditions(condition)[0]
+
+    # (Condition storage, kondisi sisa untuk executor). schema_attrs / table_names (kalau diberikan)
+    # membatasi ke kolom yang memang ada di tabel dan prefix yang merujuk tabel ini
+    def _split_storage_conditions(self, condition: Any, schema_attrs: list | None = None, table_names: set | None = None):
+        if condition.__class__.__name__ == "LogicalNode":
+            if condition.operator != "AND":
+                return [], [condition]
+            pushed, residual = [], []
+            for child in condition.childs:
+                child_pushed, child_residual = self._split_storage_conditions(child, schema_attrs, table_names)
+                pushed.extend(child_pushed)
+                residual.extend(child_residual)
+            return pushed, residual
+
+        if condition.__class__.__name__ != "ConditionNode":
+            return [], [condition]
+        if condition.value.__class__.__name__ == "ColumnNode" or not hasattr(condition.attr, "column"):
+            return [], [condition]
+        if schema_attrs is not None and (condition.attr.column not in schema_attrs or condition.value in schema_attrs):
+            return [], [condition]
+        if table_names is not None and condition.attr.table is not None and condition.attr.table not in table_names:
+            return [], [condition]
+
+        operation = "<>" if condition.op == "!=" else condition.op.upper()
+        if operation not in ("=", "<>", ">", ">=", "<", "<=", "LIKE"):
+            return [], [condition]
+        return [self._condition_factory(column=condition.attr.column, operation=operation, operand=condition.value)], []
 
     def _resolve_column_name(self, column: str) -> str:
         if '.' in column:
@@ -244,87 +419,84 @@ class QueryProcessor:
                 return f"{self._table_aliases[prefix]}.{col_name}"
         return column
 
-    # apply PROJECT operation - select specific columns
-    def _apply_projection(self, data: Rows, columns: Any) -> Rows:
+    # kolom PROJECT sebagai list, None kalau "*" (row diteruskan apa adanya)
+    def _projection_columns(self, columns: Any) -> list | None:
         if isinstance(columns, str):
             if columns.strip() == "*":
-                return data
+                return None
             col_list = [col.strip() for col in columns.split(",") if col.strip()]
         elif isinstance(columns, (list, tuple)):
             if len(columns) == 1 and str(columns[0]).strip() == "*":
-                return data
+                return None
             col_list = [str(col).strip() for col in columns if str(col).strip()]
         else:
-            return data
+            return None
         
-        if not col_list:
-            return data
+        return col_list or None
+
+    # validasi kolom PROJECT terhadap row pertama
+    def _check_projection(self, first_row: Any, col_list: list) -> None:
+        if not isinstance(first_row, dict):
+            return
+        available_cols = set(first_row.keys())
+        # Also check for simple column names without table prefix
+        available_simple_cols = set()
+        for col in available_cols:
+            if '.' in col:
+                available_simple_cols.add(col.split('.', 1)[1])
+            else:
+                available_simple_cols.add(col)
         
-        # Validate columns exist in first row (if data exists)
-        if data.rows_count > 0:
-            first_row = list(data.data)[0] if data.data else None
-            if first_row and isinstance(first_row, dict):
-                available_cols = set(first_row.keys())
-                # Also check for simple column names without table prefix
-                available_simple_cols = set()
-                for col in available_cols:
-                    if '.' in col:
-                        available_simple_cols.add(col.split('.', 1)[1])
-                    else:
-                        available_simple_cols.add(col)
+        for req_col in col_list:
+            col_name = req_col.split('.', 1)[1] if '.' in req_col else req_col
+            if req_col not in available_cols and col_name not in available_simple_cols:
+                raise ValueError(f"Column '{req_col}' does not exist in table")
+
+    # PROJECT untuk satu row; None kalau tidak ada kolom yang ketemu (row dibuang)
+    def _project_row(self, row: Any, col_list: list) -> Any:
+        if not isinstance(row, dict):
+            return row
+
+        projected_row = {}
+        for original_col in col_list:
+            if '.' in original_col:
+                prefix, col_name = original_col.split('.', 1)
+                resolved_prefix = self._table_aliases.get(prefix, prefix)
                 
-                for req_col in col_list:
-                    col_name = req_col.split('.', 1)[1] if '.' in req_col else req_col
-                    if req_col not in available_cols and col_name not in available_simple_cols:
-                        raise ValueError(f"Column '{req_col}' does not exist in table")
-        
-        projected_data = []
-        for row in data.data:
-            if isinstance(row, dict):
-                projected_row = {}
-                for original_col in col_list:
-                    if '.' in original_col:
-                        prefix, col_name = original_col.split('.', 1)
-                        resolved_prefix = self._table_aliases.get(prefix, prefix)
-                        
-                        found = False
-                        full_col = f"{resolved_prefix}.{col_name}"
-                        if full_col in row:
-                            projected_row[original_col] = row[full_col]
-                            found = True
-                        elif original_col in row:
-                            projected_row[original_col] = row[original_col]
+                found = False
+                full_col = f"{resolved_prefix}.{col_name}"
+                if full_col in row:
+                    projected_row[original_col] = row[full_col]
+                    found = True
+                elif original_col in row:
+                    projected_row[original_col] = row[original_col]
+                    found = True
+                elif col_name in row:
+                    projected_row[original_col] = row[col_name]
+                    found = True
+                if not found:
+                    for key in row.keys():
+                        if key.endswith('.' + col_name) or key == col_name:
+                            projected_row[original_col] = row[key]
                             found = True
-                        elif col_name in row:
-                            projected_row[original_col] = row[col_name]
-                            found = True
-                        if not found:
-                            for key in row.keys():
-                                if key.endswith('.' + col_name) or key == col_name:
-                                    projected_row[original_col] = row[key]
-                                    found = True
-                                    break
-                    else:
-                        if original_col in row:
-                            projected_row[original_col] = row[original_col]
-                        else:
-                            for key in row.keys():
-                                if key.endswith('.' + original_col) or key == original_col:
-                                    projected_row[original_col] = row[key]
-                                    break
-                
-                if projected_row:
-                    projected_data.append(projected_row)
+                            break
             else:
-                projected_data.append(row)
+                if original_col in row:
+                    projected_row[original_col] = row[original_col]
+                else:
+                    for key in row.keys():
+                        if key.endswith('.' + original_col) or key == original_col:
+                            projected_row[original_col] = row[key]
+                            break
         
-        return Rows.from_list(projected_data)
+        return projected_row or None
 
-    # apply SIGMA operation - filter rows based on WHERE condition
-    def _apply_selection(self, data: Rows, condition: Any) -> Rows:
+    # predicate SIGMA (WHERE) untuk satu row; sample_row dipakai menentukan apakah
+    # operand kanan nama kolom atau literal. None = kondisi tidak dikenali, semua row lolos
+    def _selection_predicate(self, condition: Any, sample_row: Any) -> Callable[[Any], bool] | None:
         normalized = NormalizedCondition.normalize(condition)
         if not normalized:
-            return data
+            return None
         
         col_name = self._resolve_column_name(normalized.column)
         operator = normalized.operator
@@ -338,29 +510,25 @@ class QueryProcessor:
                 return col.split('.', 1)[1]
             return col
         
-        if '.' in value or (value and not value[0].isdigit() and "'" not in value and '"' not in value):
+        # operand LIKE selalu pola literal, bukan nama kolom
+        if operator != "LIKE" and ('.' in value or (value and not value[0].isdigit() and "'" not in value and '"' not in value)):
             value_col_name = self._resolve_column_name(value)
-            sample_row = list(data.data)[0] if data.rows_count > 0 else None
             if sample_row and isinstance(sample_row, dict):
                 if value_col_name in sample_row or strip_prefix(value_col_name) in sample_row or value in sample_row or strip_prefix(value) in sample_row:
                     is_column_comparison = True
         
-        filtered_data = []
-        
-        for row in data.data:
+        def predicate(row: Any) -> bool:
             if not isinstance(row, dict):
-                continue
+                return False
                 
-            left_value = None
             if col_name in row:
                 left_value = row[col_name]
             elif strip_prefix(col_name) in row:
                 left_value = row[strip_prefix(col_name)]
             else:
-                continue
+                return False
             
             if is_column_comparison:
-                right_value = None
                 if value_col_name in row:
                     right_value = row[value_col_name]
                 elif strip_prefix(value_col_name) in row:
@@ -370,137 +538,210 @@ class QueryProcessor:
                 elif strip_prefix(value) in row:
                     right_value = row[strip_prefix(value)]
                 else:
-                    continue
+                    return False
             else:
                 right_value = value
 
-                
-            if self._evaluate_condition(left_value, operator, right_value):
-                filtered_data.append(row)
-        
-        return Rows.from_list(filtered_data)
+            return self._evaluate_condition(left_value, operator, right_value)
 
-    # apply join operation - support JOIN, NATURAL_JOIN, and THETA_JOIN
-    def _apply_join(self, left_data: Rows, right_data: Rows, condition: str) -> Rows:
-        if not left_data.data or not right_data.data:
-            return Rows.from_list([])
-        
-        result = []
+        return predicate
+
+    # operator join - support JOIN (cartesian), NATURAL_JOIN, and THETA_JOIN
+    # natural join dan theta join "=" antar kolom pakai hash join, theta join lain nested loop
+    def _build_join(self, node: qt, left: Operator, right: Operator) -> Operator:
+        condition = node.val
+        left_node, right_node = node.childs[1], node.childs[0]
 
         # i know its hacky, but its 2 am and isinstance not working because of import issues
         if repr(condition) == "NATURAL":
-            join_type = "NATURAL_JOIN"
-        elif isinstance(condition, str):
-            join_type = "CARTESIAN"
-        else:
-            join_type = "THETA_JOIN"
+            # natural join: join berdasarkan kolom dengan value yang sama
+            return self._hash_join(left, right, left_node, right_node, self._natural_join)
 
-        if join_type == "CARTESIAN":
+        elif isinstance(condition, str):
             # cartesian product
-            result = self._apply_cartesian(left_data, right_data)
-        
-        elif join_type == "NATURAL_JOIN":
-            # natural join: join berdasarkan kolom dengan value yang sama
-            result = self._natural_join(left_data, right_data)
-        
-        elif join_type == "THETA_JOIN":
-            # theta join: join berdasarkan kondisi tertentu (=, <, >, <=, >=, !=)
-            result = self._theta_join(left_data, right_data, condition)
-        
-        return result
-    
+            return NestedLoopJoin(left, right, lambda first_row, inner_rows: (None, self._combine_cartesian))
+
+        # theta join: join berdasarkan kondisi tertentu (=, <, >, <=, >=, !=)
+        conds = condition.condition
+        try:
+            conds_right_table = conds.value.table
+        except AttributeError:
+            conds_right_table = ""
+
+        # hasil scan tidak membawa nama tabel sumber, jadi kondisi yang kolomnya tanpa
+        # prefix tabel dievaluasi dengan sisi kanan sebagai outer
+        if conds.attr.table is None or conds_right_table is None:
+            left, right = right, left
+            left_node, right_node = right_node, left_node
+
+        if conds.__class__.__name__ == "ConditionNode" and conds.op == "=" and conds.value.__class__.__name__ == "ColumnNode":
+            make_join = lambda left_row, right_row: self._equi_join(left_row, right_row, conds)
+            # equi-join mengikuti join_method dari CostPlanner; hash join kalau index tidak bisa dipakai
+            join_method = self._plan_cost(node).get("join_method", "")
+            if join_method.startswith("index-nested-loop"):
+                plan = self._index_nested_loop_join(left, right_node, conds)
+                if plan is not None:
+                    return plan
+            elif join_method.startswith("sort-merge"):
+                return SortMergeJoin(
+                    self._ordered_input(left, left_node, conds.attr.column),
+                    self._ordered_input(right, right_node, conds.value.column),
+                    make_join,
+                )
+            return self._hash_join(left, right, left_node, right_node, make_join)
+        return NestedLoopJoin(left, right, lambda first_row, inner_rows: self._theta_join(first_row, inner_rows[0], conds))
+
+    # sisi dengan estimasi row (CostPlanner) lebih kecil jadi build; seri -> sisi kanan seperti inner nested loop
+    def _hash_join(self, left: Operator, right: Operator, left_node: qt, right_node: qt, make_join) -> Operator:
+        if self._estimate_rows(left_node) < self._estimate_rows(right_node):
+            return HashJoin(right, left, make_join, build_is_left=True)
+        return HashJoin(left, right, make_join)
+
+    # inner (sisi kanan) harus tabel langsung dengan index hash/B+ pada kolom join; outer di-stream dan
+    # key-nya dicari per batch lewat read_many_by_key. None kalau syarat tidak terpenuhi
+    def _index_nested_loop_join(self, outer: Operator, inner_node: qt, conds: Any) -> Operator | None:
+        if inner_node.type != "TABLE":
+            return None
+        inner_table = self._table_node_name(inner_node)
+        inner_column = conds.value.column
+        if conds.value.table is not None and conds.value.table not in self._table_node_names(inner_node):
+            return None
+        if inner_column not in (self._table_attributes(inner_table) or []):
+            return None
+        index = self._cost_planner.get_table_stats(inner_table).get("indexes", {}).get(inner_column, {})
+        if index.get("type") not in ("b+", "hash"):
+            return None
+
+        outer_column = conds.attr.column
+
+        def outer_key(row: Any) -> Any:
+            return row[outer_column] if isinstance(row, dict) and outer_column in row else None
+
+        def lookup(keys: list) -> dict:
+            # key hasil storage sudah dikonversi ke tipe kolom, dicocokkan lagi lewat _join_key seperti hash join
+            found = {}
+            for key, rows in self.storage_manager.read_many_by_key(inner_table, inner_column, keys).items():
+                found.setdefault(self._join_key(key), []).extend(rows)
+            return {key: found.get(self._join_key(key), []) for key in keys}
+
+        return IndexNestedLoopJoin(
+            outer, lookup, outer_key,
+            lambda outer_row, inner_row: self._theta_combine(outer_row, inner_row, conds),
+        )
+
+    # input sort-merge: tabel langsung dibaca urut lewat leaf B+ tree kolom join (kalau ada),
+    # selain itu plan apa adanya dan SortMergeJoin yang mengurutkan
+    def _ordered_input(self, plan: Operator, node: qt, column: str) -> Operator:
+        if node.type != "TABLE":
+            return plan
+        table_name = self._table_node_name(node)
+        if column not in (self._table_attributes(table_name) or []):
+            return plan
+
+        def fetch() -> list:
+            rows = self.storage_manager.read_ordered_by_key(table_name, column)
+            return rows if rows is not None else self._fetch_table_data(table_name)
+
+        return Scan(fetch, table_name)
+
+    # cost subtree dari optimizer (n_r, join_method, ...); statistik tabel di-cache per query, {} kalau gagal
+    def _plan_cost(self, node: qt) -> dict:
+        if self._cost_planner is None:
+            self._cost_planner = CostPlanner(storage_manager=self.storage_manager)
+        try:
+            return self._cost_planner.calculate_cost(node)
+        except Exception:
+            return {}
+
+    # estimasi jumlah row hasil subtree dari optimizer
+    def _estimate_rows(self, node: qt) -> float:
+        return self._plan_cost(node).get("n_r", 0)
+
     # natural join berdasarkan kolom dengan nilai yang sama
-    def _natural_join(self, left: Rows, right: Rows) -> Rows:
-        left_rows = left.data
-        right_rows = right.data
-        result = []
-        
-        if not left_rows or not right_rows:
-            return Rows.from_list[result]
-        
-        left_first = left_rows[0]
-        right_first = right_rows[0]
-        
+    def _natural_join(self, left_first: Any, right_first: Any):
         if not isinstance(left_first, dict) or not isinstance(right_first, dict):
-            return Rows.from_list(result)
+            no_key = lambda row: None
+            return no_key, no_key, None
         
-        common_cols = set(left_first.keys()) & set(right_first.keys())
-        
-        # join rows berdasarkan common columns
-        for left_row in left_rows:
-            for right_row in right_rows:
-                # cek apakah semua common columns memiliki nilai yang sama
-                match = all(left_row.get(col) == right_row.get(col) for col in common_cols)
-                
-                if match:
-                    # combine rows, common columns dari left_row
-                    combined = {**left_row}
-                    for key, val in right_row.items():
-                        if key not in common_cols:
-                            combined[key] = val
-                    result.append(combined)
-        
-        return Rows.from_list(result)
-    
-    # theta join berdasarkan kondisi
-    def _theta_join(self, left: Rows, right: Rows, condition: str) -> Rows:
-        left_rows = left.data
-        right_rows = right.data
+        common_cols = sorted(set(left_first.keys()) & set(right_first.keys()))
 
-        # print(left_rows[0])
+        # semua common columns harus bernilai sama
+        def key(row: dict) -> tuple:
+            return tuple(row.get(col) for col in common_cols)
 
-        left_table = left.table_source
-        right_table = right.table_source
+        # combine rows, common columns dari left_row
+        def combine(left_row: dict, right_row: dict) -> dict:
+            combined = {**left_row}
+            for key, val in right_row.items():
+                if key not in common_cols:
+                    combined[key] = val
+            return combined
 
-        result = []
+        return key, key, combine
 
-        conds = condition.condition
-        conds_left_table = conds.attr.table
+    # theta join "=" antar kolom sebagai hash join
+    def _equi_join(self, left_first: dict, right_first: dict, conds: Any):
+        left_column = conds.attr.column
+        right_column = conds.value.column
+
+        def left_key(row: Any) -> Any:
+            return self._join_key(row[left_column]) if isinstance(row, dict) and left_column in row else None
+
+        def right_key(row: Any) -> Any:
+            return self._join_key(row[right_column]) if isinstance(row, dict) and right_column in row else None
+
+        return left_key, right_key, self._theta_combine(left_first, right_first, conds)
+
+    # key hash join yang setara dengan "=" di _evaluate_condition: nilai angka (termasuk string angka)
+    # dibandingkan sebagai float, sisanya apa adanya. None = tidak bisa match
+    def _join_key(self, value: Any) -> Any:
         try:
-            conds_right_table = conds.value.table
-        except:
-            conds_right_table = ""
+            return float(value)
+        except (TypeError, ValueError):
+            return value
+    
+    # theta join berdasarkan kondisi
+    def _theta_join(self, left_first: Any, right_first: Any, conds: Any):
+        left_column = conds.attr.column
+        right_column = getattr(conds.value, "column", None)
 
-        if conds_left_table == right_table or conds_right_table == left_table:
-            left_rows, right_rows = right_rows, left_rows
-
-        common_cols = set(left_rows[0].keys()) & set(right_rows[0].keys())
-
-        # join rows berdasarkan kondisi
-        for left_row in left_rows:
-            for right_row in right_rows:
-                if isinstance(left_row, dict) and isinstance(right_row, dict):
-                    if conds.attr.column in left_row:
-                        left_val = left_row[conds.attr.column]
-                        
-                        # cek apakah right_col_or_value adalah kolom di right_row
-                        try:
-                            right_val = right_row[conds.value.column]
-                        except:
-                            right_val = conds.value
-
-                        # evaluasi condition
-                        if self._evaluate_condition(left_val, conds.op, right_val):
-
-                            left_row_final = copy.deepcopy(left_row)
-                            right_row_final = copy.deepcopy(right_row)
-
-                            for col in common_cols:
-                                try:
-                                    need_new = (col != conds.attr.column or conds.attr.column != conds.value.column)
-                                except:
-                                    need_new = True
-                                if col != "_lsn" and need_new:
-                                    left_row_final[col + "_1"] = left_row_final.pop(col)
-                                    right_row_final[col + "_2"] = right_row_final.pop(col)
-
-                            combined = {**left_row_final, **right_row_final}
-                            result.append(combined)
-        
-        return Rows.from_list(result)
+        def match(left_row: Any, right_row: Any) -> bool:
+            if not isinstance(left_row, dict) or not isinstance(right_row, dict) or left_column not in left_row:
+                return False
+            # cek apakah right_col_or_value adalah kolom di right_row
+            right_val = right_row[right_column] if right_column in right_row else conds.value
+            return self._evaluate_condition(left_row[left_column], conds.op, right_val)
+
+        return match, self._theta_combine(left_first, right_first, conds)
+
+    # gabung row theta join; kolom bersama diberi suffix _1/_2, kecuali kolom join yang namanya
+    # sama di kedua sisi. nilai kolom skalar, jadi cukup dict baru tanpa deepcopy
+    def _theta_combine(self, left_first: dict, right_first: dict, conds: Any):
+        common_cols = set(left_first.keys()) & set(right_first.keys())
+        left_column = conds.attr.column
+        right_column = getattr(conds.value, "column", None)
+        renamed = [
+            col for col in common_cols
+            if col != "_lsn" and (right_column is None or col != left_column or left_column != right_column)
+        ]
+        if not renamed:
+            return lambda left_row, right_row: {**left_row, **right_row}
+
+        def combine(left_row: dict, right_row: dict) -> dict:
+            left_row_final = {key: val for key, val in left_row.items() if key not in renamed}
+            right_row_final = {key: val for key, val in right_row.items() if key not in renamed}
+            for col in renamed:
+                left_row_final[col + "_1"] = left_row[col]
+                right_row_final[col + "_2"] = right_row[col]
+            return {**left_row_final, **right_row_final}
+
+        return combine
     
     # evaluasi kondisi untuk join
     def _evaluate_condition(self, left_val, operator: str, right_val) -> bool:
+        if operator.upper() == "LIKE":
+            return like_match(left_val, right_val)
+
         try:
             row_value_num = float(left_val)
             value_num = float(right_val)
@@ -533,41 +774,24 @@ class QueryProcessor:
             
         return False
 
-    # apply CARTESIAN product
-    def _apply_cartesian(self, left_data: Rows, right_data: Rows) -> Rows:
-        result = []
-        for left_row in left_data.data:
-            for right_row in right_data.data:
-                if isinstance(left_row, dict) and isinstance(right_row, dict):
-                    combined = {**left_row, **right_row}
-                    result.append(combined)
-        
-        return Rows.from_list(result)
-
-    def _apply_sort(self, data: Rows, column: str) -> Rows:
+    def _combine_cartesian(self, left_row: dict, right_row: dict) -> dict:
+        return {**left_row, **right_row}
 
-        # column = list of OrderByItem
-        for node in reversed(column):
+    # operator SORT; column = list of OrderByItem
+    def _build_sort(self, child: Operator, column: Any) -> Operator:
+        keys = []
+        for node in column:
             column_str = node.column.column  # type: ignore
             ascending = node.direction.upper() == "ASC" # type: ignore
-            data.data.sort(key=lambda datum: datum.get(column_str), reverse=not ascending)
+            keys.append((lambda datum, column_str=column_str: datum.get(column_str), ascending))
+        return Sort(child, keys)
 
-        # NOTE : DONE yak bang -bri
-        # NOTE : dah ku benerin yak bang - kiwz
-    
-        return data
-
-    # apply LIMIT operation
-    def _apply_limit(self, data: Rows, limit: str) -> Rows:
+    # operator LIMIT
+    def _build_limit(self, child: Operator, limit: str) -> Operator:
         try:
-            limit_num = int(limit)
-            limited_data = data.data[:limit_num]
-            return Rows.from_list(limited_data)
+            return Limit(child, int(limit))
         except ValueError:
-            return data
-    # apply GROUP BY operation
-    def _apply_group(self, data: Rows, column: str) -> Rows:
-        return Rows.from_list([{"info": f"GROUP BY {column} - basic implementation"}])
+            return child
 
     # perform UPDATE operation via storage manager
     # returns number of rows updated
@@ -582,22 +806,21 @@ class QueryProcessor:
         
         cond_objs = [self._condition_factory(column=first_condition.attr.column, operation=first_condition.op, operand=first_condition.value)] if first_condition else []
 
+        # semua kolom SET dikirim dalam satu write_block supaya SM cukup satu pass
+        for update in update_operations[0]:
+            updates[update.column] = update.value
+
         try:
-            total_updated = 0
-            for update in update_operations[0]:
-                data_write = self._data_write_factory(
-                    table=repr(table_name),
-                    column=update.column,
-                    conditions=cond_objs,
-                    new_value=update.value,
-                )
-                
-                result = self.storage_manager.write_block(data_write)
-                
-                if isinstance(result, int):
-                    total_updated = max(total_updated, result)
-            
-            return total_updated
+            data_write = self._data_write_factory(
+                table=repr(table_name),
+                column=list(updates.keys()),
+                conditions=cond_objs,
+                new_value=updates,
+            )
+
+            result = self.storage_manager.write_block(data_write)
+
+            return result if isinstance(result, int) else 0
             
         except Exception as e:
             raise ValueError(f"Error calling Storage Manager write_block: {e}")
@@ -730,7 +953,15 @@ class QueryProcessor:
         """
         Executes a CREATE TABLE query.
         Format: CREATE TABLE table_name (col1 type, col2 type(size))
+                [PARTITION BY HASH(col) PARTITIONS n | PARTITION BY RANGE(col) (bound1, bound2, ...)]
         """
+        # klausa partisi dipisah dulu supaya tidak ikut tertangkap regex kolom
+        partition_spec = None
+        partition_match = re.search(r"(?is)\)\s*PARTITION\s+BY\s+(.+?)\s*;?\s*$", query)
+        if partition_match:
+            partition_spec = self._parse_partition_clause(partition_match.group(1))
+            query = query[:partition_match.start() + 1]
+
         # pattern CREATE TABLE <name> (<columns>)
         match = re.search(r"(?i)CREATE\s+TABLE\s+(\w+)\s*\((.+)\)", query)
         if not match:
@@ -756,28 +987,7 @@ class QueryProcessor:
                 continue # skip invalid definitions
                 
             col_name = parts[0]
-            raw_type = parts[1]
-            
-            col_type = raw_type.lower()
-            col_size = 1
-
-            # use regex to validate data types varchar(*)
-            if col_type not in ['int', 'integer', 'float', 'char'] and re.match(r"varchar\(\d+\)", col_type) is None:
-                raise ValueError(f"Error: Unsupported data type '{col_type}' for column '{col_name}'.")
-
-            # handle Varchar/Char with size (e.g., varchar(50))
-            if '(' in raw_type and ')' in raw_type:
-                type_match = re.match(r"(\w+)\((\d+)\)", raw_type)
-                if type_match:
-                    col_type = type_match.group(1).lower()
-                    col_size = int(type_match.group(2))
-            
-            # handle integers (fixed size 4 bytes)
-            elif col_type in ['int', 'integer', 'float']:
-                col_size = 4
-            
-            if col_type == 'integer':
-                col_type = 'int'
+            col_type, col_size = self._parse_column_type(col_name, parts[1])
 
             # add to schema
             try:
@@ -786,6 +996,9 @@ class QueryProcessor:
             except ValueError as e:
                 raise ValueError(f"Error: {str(e)}")
 
+        if partition_spec and partition_spec['column'] not in [attr['name'] for attr in new_schema.get_attributes()]:
+            raise ValueError(f"Error: Partition column '{partition_spec['column']}' not found in table '{table_name}'.")
+
         # save to Schema Manager
         self.storage_manager.schema_manager.add_table_schema(table_name, new_schema)
         self.storage_manager.schema_manager.save_schemas()
@@ -800,8 +1013,48 @@ class QueryProcessor:
             raise ValueError(f"Error creating table file: {str(e)}")
 
         self.storage_manager.schema_manager.load_schemas()
+
+        if partition_spec:
+            self.storage_manager.create_partitions(table_name, **partition_spec)
+
         return Rows.from_list([f"Table '{table_name}' created successfully."])
 
+    def _parse_column_type(self, col_name: str, raw_type: str):
+        # return (type, size) dari definisi tipe kolom, misal "int" atau "varchar(50)"
+        col_type = raw_type.lower()
+        col_size = 1
+
+        # use regex to validate data types varchar(*)
+        if col_type not in ['int', 'integer', 'float', 'char'] and re.match(r"varchar\(\d+\)", col_type) is None:
+            raise ValueError(f"Error: Unsupported data type '{col_type}' for column '{col_name}'.")
+
+        # handle Varchar/Char with size (e.g., varchar(50))
+        if '(' in raw_type and ')' in raw_type:
+            type_match = re.match(r"(\w+)\((\d+)\)", raw_type)
+            if type_match:
+                col_type = type_match.group(1).lower()
+                col_size = int(type_match.group(2))
+
+        # handle integers (fixed size 4 bytes)
+        elif col_type in ['int', 'integer', 'float']:
+            col_size = 4
+
+        if col_type == 'integer':
+            col_type = 'int'
+        return col_type, col_size
+
+    def _parse_partition_clause(self, partition_clause: str) -> dict:
+        hash_match = re.fullmatch(r"(?is)HASH\s*\(\s*(\w+)\s*\)\s+PARTITIONS\s+(\d+)", partition_clause)
+        if hash_match:
+            return {'method': 'hash', 'column': hash_match.group(1), 'partitions': int(hash_match.group(2))}
+
+        range_match = re.fullmatch(r"(?is)RANGE\s*\(\s*(\w+)\s*\)\s*\((.+)\)", partition_clause)
+        if range_match:
+            bounds = [b.strip().strip("'\"") for b in range_match.group(2).split(',')]
+            return {'method': 'range', 'column': range_match.group(1), 'bounds': bounds}
+
+        raise ValueError(f"Syntax Error: Invalid PARTITION BY clause '{partition_clause}'.")
+
     def execute_drop_table(self, query: str) -> Union[Rows, int]:
 
         # parse query
@@ -811,14 +1064,24 @@ class QueryProcessor:
 
         table_name = match.group(1)
 
+        # tabel berpartisi: file tiap partisi ikut dihapus
+        self.storage_manager.drop_partitions(table_name)
+
         # delete .dat file
         dat_path = os.path.join(self.storage_manager.base_path, f"{table_name}.dat")
+        self.storage_manager.discard_pages(dat_path)
         if os.path.exists(dat_path):
             os.remove(dat_path)
+        self.storage_manager.zone_map_manager.drop_zone_map(dat_path)
+        self.storage_manager.bloom_filter_manager.drop_filters(dat_path)
+        self.storage_manager.lsm_manager.drop_tree(dat_path)
+        self.storage_manager.row_cache.invalidate(table_name)
 
         # delete from schema
         self.storage_manager.schema_manager.schemas.pop(table_name)
         self.storage_manager.schema_manager.save_schemas()
+        self.storage_manager.schema_manager.remove_table_options(table_name)
+        self.storage_manager.schema_manager.remove_schema_versions(table_name)
         self.storage_manager.schema_manager.load_schemas()
 
         # delete from indexing (asumsikan tidak di indexing)
@@ -831,6 +1094,106 @@ class QueryProcessor:
 
 
 
+    def execute_alter_table(self, query: str) -> Union[Rows, int]:
+        """
+        Executes an ALTER TABLE query (catalog-only, existing rows are not rewritten).
+        Format: ALTER TABLE table_name ADD [COLUMN] col type [DEFAULT value]
+                ALTER TABLE table_name DROP [COLUMN] col
+        """
+        match = re.search(r"(?is)ALTER\s+TABLE\s+(\w+)\s+(ADD|DROP)\s+(?:COLUMN\s+)?(.+?)\s*;?\s*$", query)
+        if not match:
+            raise ValueError(f"Syntax Error: Invalid ALTER TABLE format.")
+
+        table_name, action, definition = match.group(1), match.group(2).upper(), match.group(3)
+        if self.storage_manager.schema_manager.get_table_schema(table_name) is None:
+            raise ValueError(f"Error: Table '{table_name}' does not exist.")
+
+        if action == 'DROP':
+            if re.fullmatch(r"\w+", definition) is None:
+                raise ValueError(f"Syntax Error: Invalid ALTER TABLE DROP COLUMN format.")
+            self.storage_manager.drop_column(table_name, definition)
+            return Rows.from_list([f"Table '{table_name}' altered: column '{definition}' dropped."])
+
+        col_match = re.fullmatch(r"(?is)(\w+)\s+(\w+(?:\s*\(\s*\d+\s*\))?)(?:\s+DEFAULT\s+(.+))?", definition)
+        if not col_match:
+            raise ValueError(f"Syntax Error: Invalid ALTER TABLE ADD COLUMN format.")
+        col_name = col_match.group(1)
+        col_type, col_size = self._parse_column_type(col_name, re.sub(r"\s+", "", col_match.group(2)))
+
+        default = col_match.group(3)
+        if default is not None:
+            default = default.strip()
+            if len(default) >= 2 and default[0] == default[-1] and default[0] in ("'", '"'):
+                default = default[1:-1]
+            elif col_type in ('int', 'float'):
+                try:
+                    default = float(default) if col_type == 'float' else int(default)
+                except ValueError:
+                    raise ValueError(f"Error: Invalid DEFAULT value '{default}' for column '{col_name}'.")
+
+        self.storage_manager.add_column(table_name, col_name, col_type, col_size, default)
+        return Rows.from_list([f"Table '{table_name}' altered: column '{col_name}' added."])
+
+    def execute_vacuum(self, query: str) -> Union[Rows, int]:
+        """
+        Executes a VACUUM query.
+        Format: VACUUM [FULL] table_name
+        """
+        match = re.search(r"(?i)VACUUM\s+(FULL\s+)?([A-Za-z_]\w*)\s*;?\s*$", query)
+        if not match:
+            raise ValueError(f"Syntax Error: Invalid VACUUM format.")
+
+        table_name = match.group(2)
+        if self.storage_manager.schema_manager.get_table_schema(table_name) is None:
+            raise ValueError(f"Error: Table '{table_name}' does not exist.")
+
+        result = self.storage_manager.vacuum_table(table_name, full=match.group(1) is not None)
+        return Rows.from_list([
+            f"Table '{table_name}' vacuumed: {result['pages_before']} -> {result['pages_after']} pages, "
+            f"{result['rows_moved']} rows moved in {result['batches']} batches."
+        ])
+
+    def execute_create_index(self, query: str) -> Union[Rows, int]:
+        """
+        Executes a CREATE INDEX query.
+        Format: CREATE INDEX [CONCURRENTLY] index_name ON table_name [USING method] (column) [USING method]
+        method: btree (default), hash, trigram
+        """
+        match = re.search(
+            r"(?i)CREATE\s+INDEX\s+(CONCURRENTLY\s+)?([A-Za-z_]\w*)\s+ON\s+([A-Za-z_]\w*)"
+            r"\s*(?:USING\s+(\w+)\s*)?\(\s*([A-Za-z_]\w*)\s*\)\s*(?:USING\s+(\w+))?\s*;?\s*$",
+            query
+        )
+        if not match:
+            raise ValueError(f"Syntax Error: Invalid CREATE INDEX format.")
+
+        concurrently = match.group(1) is not None
+        index_name, table_name, column_name = match.group(2), match.group(3), match.group(5)
+        index_type = (match.group(4) or match.group(6) or 'btree').lower()
+        if self.storage_manager.schema_manager.get_table_schema(table_name) is None:
+            raise ValueError(f"Error: Table '{table_name}' does not exist.")
+
+        self.storage_manager.create_index(index_name, table_name, column_name, index_type, concurrently=concurrently)
+        if concurrently:
+            return Rows.from_list([
+                f"Index '{index_name}' ({index_type}) on {table_name}({column_name}) is being built in the background."
+            ])
+        return Rows.from_list([f"Index '{index_name}' ({index_type}) created on {table_name}({column_name})."])
+
+    def execute_drop_index(self, query: str) -> Union[Rows, int]:
+        """
+        Executes a DROP INDEX query.
+        Format: DROP INDEX [IF EXISTS] index_name
+        """
+        match = re.search(r"(?i)DROP\s+INDEX\s+(IF\s+EXISTS\s+)?([A-Za-z_]\w*)\s*;?\s*$", query)
+        if not match:
+            raise ValueError(f"Syntax Error: Invalid DROP INDEX format.")
+
+        index_name = match.group(2)
+        if not self.storage_manager.drop_index(index_name, if_exists=match.group(1) is not None):
+            return Rows.from_list([f"Index '{index_name}' does not exist, skipped."])
+        return Rows.from_list([f"Index '{index_name}' dropped."])
+
     # placeholder BEGIN TRANSACTION
     def execute_begin_transaction(self, query: str) -> Union[Rows, int]:
 
@@ -22,6 +22,7 @@ from storagemanager_model.data_write import DataWrite
 from storagemanager_model.condition import Condition
 from storagemanager_helper.schema import Schema
 from QueryOptimizer import OptimizationEngine
+from qp_helper.operators import Scan, NestedLoopJoin, HashJoin, IndexNestedLoopJoin, SortMergeJoin, Limit
 
 
 class TestQueryProcessorWithRealData(unittest.TestCase):
@@ -203,3 +204,152 @@ class TestQueryProcessorWithRealData(unittest.TestCase):
         
         drop_result = self.query_processor.execute_query("DROP TABLE Employee;")
         print("Cleanup: Table dropped")
+
+    def test_pipelined_limit_over_join(self):
+        print("\nTEST 3: LIMIT over JOIN stops the pipeline early")
+
+        self.query_processor.execute_query("CREATE TABLE Student (StudentID int, Name varchar(50), GPA float);")
+        self.query_processor.execute_query("CREATE TABLE Attends (StudentID int, CourseID int);")
+        for i in range(20):
+            self.query_processor.execute_query(f"INSERT INTO Student (StudentID, Name, GPA) VALUES ({i}, 'S{i}', 3.0);")
+            self.query_processor.execute_query(f"INSERT INTO Attends (StudentID, CourseID) VALUES ({i}, {100 + i});")
+
+        result = self.query_processor.execute_query(
+            "SELECT Name, CourseID FROM Student s JOIN Attends a ON s.StudentID = a.StudentID ORDER BY CourseID LIMIT 3;"
+        )
+        self.assertEqual(result.message, "Success")
+        self.assertEqual(result.data.data, [
+            {"Name": "S0", "CourseID": 100}, {"Name": "S1", "CourseID": 101}, {"Name": "S2", "CourseID": 102},
+        ])
+
+        # outer yang di-stream hanya ditarik sampai LIMIT terpenuhi
+        pulled = []
+        def outer_rows():
+            for i in range(1000):
+                pulled.append(i)
+                yield {"k": i}
+        plan = Limit(NestedLoopJoin(
+            Scan(outer_rows), Scan(lambda: [{"v": 0}, {"v": 1}]),
+            lambda first_row, inner_rows: (None, lambda left_row, right_row: {**left_row, **right_row}),
+        ), 3)
+        self.assertEqual(list(plan), [{"k": 0, "v": 0}, {"k": 0, "v": 1}, {"k": 1, "v": 0}])
+        self.assertEqual(len(pulled), 2)
+
+        self.query_processor.execute_query("DROP TABLE Attends;")
+        self.query_processor.execute_query("DROP TABLE Student;")
+
+    def test_selection_pushed_into_storage(self):
+        print("\nTEST 4: sargable WHERE and projection reach read_block")
+
+        self.query_processor.execute_query("CREATE TABLE Student (StudentID int, Name varchar(50), GPA float);")
+        for i in range(200):
+            self.query_processor.execute_query(
+                f"INSERT INTO Student (StudentID, Name, GPA) VALUES ({i}, 'S{i}', {2.0 + (i % 20) / 10});"
+            )
+        result = self.query_processor.execute_query("CREATE INDEX student_name ON Student USING hash (Name);")
+        self.assertEqual(result.message, "Success")
+
+        calls = []
+        read_block = self.storage_manager.read_block
+        def recording_read_block(data_retrieval):
+            calls.append(data_retrieval)
+            return read_block(data_retrieval)
+        self.storage_manager.read_block = recording_read_block
+
+        result = self.query_processor.execute_query("SELECT Name FROM Student WHERE GPA = 3.5 AND StudentID < 100 ORDER BY StudentID;")
+        self.assertEqual(result.message, "Success")
+        self.assertEqual(result.data.data, [{"Name": f"S{i}"} for i in (15, 35, 55, 75, 95)])
+        self.assertEqual(calls[-1].column, ["StudentID", "Name"])
+        self.assertEqual(
+            sorted((c.column, c.operation, c.operand) for c in calls[-1].conditions),
+            [("GPA", "=", 3.5), ("StudentID", "<", 100)],
+        )
+
+        result = self.query_processor.execute_query("SELECT GPA FROM Student WHERE Name = 'S42';")
+        self.assertEqual(result.data.data, [{"GPA": 2.2}])
+        self.assertEqual(self.storage_manager.last_access_path["method"], "bitmap_index_scan")
+
+        # kondisi antar kolom tidak sargable: tetap dievaluasi executor, kolomnya ikut dibaca
+        result = self.query_processor.execute_query("SELECT Name FROM Student WHERE GPA > StudentID;")
+        self.assertEqual(result.data.data, [{"Name": "S0"}, {"Name": "S1"}, {"Name": "S2"}])
+        self.assertEqual(calls[-1].conditions, [])
+        self.assertEqual(calls[-1].column, ["StudentID", "Name", "GPA"])
+
+        del self.storage_manager.read_block
+        self.query_processor.execute_query("DROP TABLE Student;")
+
+    def test_hash_join_builds_on_smaller_input(self):
+        print("\nTEST 5: equi-join and natural join run as hash joins")
+
+        self.query_processor.execute_query("CREATE TABLE Student (StudentID int, Name varchar(50), GPA float);")
+        self.query_processor.execute_query("CREATE TABLE Attends (StudentID int, CourseID int);")
+        for i in range(5):
+            self.query_processor.execute_query(f"INSERT INTO Student (StudentID, Name, GPA) VALUES ({i}, 'S{i}', 3.0);")
+        for i in range(60):
+            self.query_processor.execute_query(f"INSERT INTO Attends (StudentID, CourseID) VALUES ({i % 8}, {100 + i});")
+        expected = sorted((i % 8, 100 + i) for i in range(60) if i % 8 < 5)
+
+        query = "SELECT * FROM Attends a JOIN Student s ON a.StudentID = s.StudentID;"
+        optimized = self.optimizer.optimize_query(self.optimizer.parse_query(query))
+        self.query_processor._cost_planner = None
+        plan = self.query_processor._build_plan(optimized.query_tree)
+        while not isinstance(plan, HashJoin):
+            plan = plan.childs[0]
+        probe, build = plan.childs
+        self.assertEqual((probe.table, build.table), ("Attends", "Student"))
+
+        for query in (
+            "SELECT * FROM Attends a JOIN Student s ON a.StudentID = s.StudentID;",
+            "SELECT * FROM Student s JOIN Attends a ON s.StudentID = a.StudentID;",
+            "SELECT * FROM Student NATURAL JOIN Attends;",
+        ):
+            result = self.query_processor.execute_query(query)
+            self.assertEqual(result.message, "Success", query)
+            self.assertEqual(sorted((row["StudentID"], row["CourseID"]) for row in result.data.data), expected, query)
+            self.assertTrue(all(row["Name"] == f"S{row['StudentID']}" for row in result.data.data), query)
+
+        # theta join selain "=" tetap nested loop
+        result = self.query_processor.execute_query("SELECT * FROM Student s JOIN Attends a ON s.StudentID > a.StudentID;")
+        self.assertEqual(result.data.rows_count, sum(1 for i in range(60) for j in range(5) if j > i % 8))
+
+        self.query_processor.execute_query("DROP TABLE Attends;")
+        self.query_processor.execute_query("DROP TABLE Student;")
+
+    def test_join_follows_cost_planner_method(self):
+        print("\nTEST 6: index nested-loop and sort-merge join follow join_method")
+
+        self.query_processor.execute_query("CREATE TABLE Student (StudentID int, Name varchar(50), GPA float);")
+        self.query_processor.execute_query("CREATE TABLE Attends (StudentID int, CourseID int);")
+        for i in range(5):
+            self.query_processor.execute_query(f"INSERT INTO Student (StudentID, Name, GPA) VALUES ({i}, 'S{i}', 3.0);")
+        for i in range(60):
+            self.query_processor.execute_query(f"INSERT INTO Attends (StudentID, CourseID) VALUES ({(i * 7) % 8}, {100 + i});")
+        expected = sorted(((i * 7) % 8, 100 + i) for i in range(60) if (i * 7) % 8 < 5)
+        query = "SELECT * FROM Attends JOIN Student ON Attends.StudentID = Student.StudentID;"
+
+        def run(join_class):
+            optimized = self.optimizer.optimize_query(self.optimizer.parse_query(query))
+            self.query_processor._cost_planner = None
+            plan = self.query_processor._build_plan(optimized.query_tree)
+            while not isinstance(plan, join_class):
+                plan = plan.childs[0]
+            result = self.query_processor.execute_query(query)
+            self.assertEqual(sorted((row["StudentID"], row["CourseID"]) for row in result.data.data), expected)
+            self.assertTrue(all(row["Name"] == f"S{row['StudentID']}" for row in result.data.data))
+            return plan
+
+        # hanya Student yang punya index B+: Attends di-stream, Student dicari lewat index per batch
+        self.query_processor.execute_query("CREATE INDEX student_id ON Student USING btree (StudentID);")
+        plan = run(IndexNestedLoopJoin)
+        self.assertEqual(plan.childs[0].table, "Attends")
+
+        # kedua sisi punya index B+: kedua input dibaca urut key lewat leaf B+ tree
+        self.query_processor.execute_query("CREATE INDEX attends_id ON Attends USING btree (StudentID);")
+        run(SortMergeJoin)
+        ordered = self.storage_manager.read_ordered_by_key("Attends", "StudentID")
+        self.assertEqual([row["StudentID"] for row in ordered], sorted((i * 7) % 8 for i in range(60)))
+
+        self.query_processor.execute_query("DROP INDEX attends_id;")
+        self.query_processor.execute_query("DROP INDEX student_id;")
+        self.query_processor.execute_query("DROP TABLE Attends;")
+        self.query_processor.execute_query("DROP TABLE Student;")
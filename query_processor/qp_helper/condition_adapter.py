@@ -1,4 +1,5 @@
 from __future__ import annotations
+import re
 from dataclasses import dataclass
 from typing import Any
 
@@ -6,7 +7,7 @@ from typing import Any
 @dataclass(frozen=True)
 class NormalizedCondition:
     column: str
-    operator: str  # '=', '!=', '>', '<', '>=', '<='
+    operator: str  # '=', '!=', '>', '<', '>=', '<=', 'LIKE'
     value: str
     
     @classmethod
@@ -34,6 +35,10 @@ class NormalizedCondition:
     
     @classmethod
     def from_string(cls, condition_str: str) -> NormalizedCondition | None:
+        like_parts = re.split(r"\s+LIKE\s+", condition_str, maxsplit=1, flags=re.IGNORECASE)
+        if len(like_parts) == 2:
+            return cls(column=like_parts[0].strip(), operator="LIKE", value=like_parts[1].strip().strip("'\""))
+
         operators = [">=", "<=", "!=", "=", ">", "<"]
         
         for op in operators:
@@ -0,0 +1,331 @@
+from __future__ import annotations
+from typing import Any, Callable, Iterable, Iterator, List
+
+INDEX_JOIN_BATCH = 64  # jumlah row outer per lookup index inner
+
+
+class Operator:
+    """
+    Operator fisik gaya Volcano: open() menyiapkan state, next() memberi satu
+    row (None kalau sudah habis), close() melepas state dan menutup child.
+    Row mengalir satu per satu dari TABLE ke root, jadi operator seperti LIMIT
+    bisa berhenti lebih awal tanpa child menghasilkan seluruh hasilnya. Hanya
+    operator blocking (Sort, sisi inner join) yang menampung row di memori.
+    """
+
+    def __init__(self, *childs: "Operator") -> None:
+        self.childs = list(childs)
+        self._rows_iter = None
+
+    def open(self) -> None:
+        for child in self.childs:
+            child.open()
+        self._rows_iter = self._rows()
+
+    def next(self) -> Any:
+        if self._rows_iter is None:
+            return None
+        return next(self._rows_iter, None)
+
+    def close(self) -> None:
+        if self._rows_iter is not None:
+            self._rows_iter.close()
+            self._rows_iter = None
+        for child in self.childs:
+            child.close()
+
+    def _rows(self) -> Iterator[Any]:
+        raise NotImplementedError
+
+    def __iter__(self) -> Iterator[Any]:
+        self.open()
+        try:
+            while True:
+                row = self.next()
+                if row is None:
+                    return
+                yield row
+        finally:
+            self.close()
+
+
+def pull(child: Operator) -> Iterator[Any]:
+    # iterasi row child yang sudah di-open (tanpa open/close ulang)
+    while True:
+        row = child.next()
+        if row is None:
+            return
+        yield row
+
+
+class Scan(Operator):
+    # sumber row dari storage; fetch dipanggil saat open, bukan saat plan dibangun
+    def __init__(self, fetch: Callable[[], Iterable[Any]], table: str = None) -> None:
+        super().__init__()
+        self.fetch = fetch
+        self.table = table
+
+    def _rows(self) -> Iterator[Any]:
+        yield from self.fetch()
+
+
+class Filter(Operator):
+    # make_predicate(row pertama) -> fungsi row -> bool, atau None kalau semua row lolos
+    def __init__(self, child: Operator, make_predicate: Callable[[Any], Any]) -> None:
+        super().__init__(child)
+        self.make_predicate = make_predicate
+
+    def _rows(self) -> Iterator[Any]:
+        predicate = None
+        first = True
+        for row in pull(self.childs[0]):
+            if first:
+                predicate = self.make_predicate(row)
+                first = False
+            if predicate is None or predicate(row):
+                yield row
+
+
+class Project(Operator):
+    # check(row pertama) memvalidasi kolom, project(row) membentuk row hasil (None = dibuang)
+    def __init__(self, child: Operator, project: Callable[[Any], Any], check: Callable[[Any], None] = None) -> None:
+        super().__init__(child)
+        self.project = project
+        self.check = check
+
+    def _rows(self) -> Iterator[Any]:
+        first = True
+        for row in pull(self.childs[0]):
+            if first and self.check is not None:
+                self.check(row)
+            first = False
+            projected = self.project(row)
+            if projected is not None:
+                yield projected
+
+
+class NestedLoopJoin(Operator):
+    """
+    Nested loop join: outer di-stream, inner ditampung sekali di memori.
+
+    make_join(row outer pertama, rows inner) -> (match, combine), dipanggil
+    sekali supaya kolom bersama dihitung dari row pertama seperti sebelumnya.
+    match None berarti cartesian product.
+    """
+
+    def __init__(self, outer: Operator, inner: Operator, make_join: Callable[[Any, List[Any]], Any]) -> None:
+        super().__init__(outer, inner)
+        self.make_join = make_join
+
+    def _rows(self) -> Iterator[Any]:
+        outer, inner = self.childs
+        inner_rows = list(pull(inner))
+        if not inner_rows:
+            return
+        match = combine = None
+        first = True
+        for outer_row in pull(outer):
+            if first:
+                match, combine = self.make_join(outer_row, inner_rows)
+                first = False
+            for inner_row in inner_rows:
+                if match is None or match(outer_row, inner_row):
+                    yield combine(outer_row, inner_row)
+
+
+class HashJoin(Operator):
+    """
+    Hash join untuk equi-join dan natural join.
+
+    Sisi build (yang estimasinya lebih kecil) ditampung sebagai hash table
+    key -> rows, sisi probe di-stream dan tiap row cukup sekali lookup.
+    make_join(row kiri pertama, row kanan pertama) -> (left_key, right_key,
+    combine) dipanggil sekali sebelum hash table dibangun; key None berarti
+    row tidak bisa match. combine selalu menerima (row kiri, row kanan),
+    apa pun sisi yang jadi build.
+    """
+
+    def __init__(self, probe: Operator, build: Operator, make_join: Callable[[Any, Any], Any], build_is_left: bool = False) -> None:
+        super().__init__(probe, build)
+        self.make_join = make_join
+        self.build_is_left = build_is_left
+
+    def _rows(self) -> Iterator[Any]:
+        probe, build = self.childs
+        build_rows = list(pull(build))
+        if not build_rows:
+            return
+        table = None
+        probe_key = combine = None
+        for probe_row in pull(probe):
+            if table is None:
+                if self.build_is_left:
+                    build_key, probe_key, combine = self.make_join(build_rows[0], probe_row)
+                else:
+                    probe_key, build_key, combine = self.make_join(probe_row, build_rows[0])
+                table = {}
+                for build_row in build_rows:
+                    key = build_key(build_row)
+                    if key is not None:
+                        table.setdefault(key, []).append(build_row)
+                build_rows = None
+
+            key = probe_key(probe_row)
+            if key is None:
+                continue
+            for build_row in table.get(key, ()):
+                if self.build_is_left:
+                    yield combine(build_row, probe_row)
+                else:
+                    yield combine(probe_row, build_row)
+
+
+class IndexNestedLoopJoin(Operator):
+    """
+    Index nested-loop join: outer di-stream, inner tidak pernah ditampung utuh.
+
+    Row outer dikumpulkan per batch, lalu semua key batch dicari sekaligus
+    lewat lookup(keys) -> dict key -> rows inner (index inner, heap dibaca
+    sekali per page). outer_key(row) -> key, None berarti tidak bisa match.
+    make_combine(row outer, row inner) dipanggil sekali pada pasangan pertama
+    yang match; hasil tetap keluar sesuai urutan outer.
+    """
+
+    def __init__(self, outer: Operator, lookup: Callable[[List[Any]], dict], outer_key: Callable[[Any], Any],
+                 make_combine: Callable[[Any, Any], Any], batch_size: int = INDEX_JOIN_BATCH) -> None:
+        super().__init__(outer)
+        self.lookup = lookup
+        self.outer_key = outer_key
+        self.make_combine = make_combine
+        self.batch_size = batch_size
+
+    def _rows(self) -> Iterator[Any]:
+        combine = None
+        batch = []
+        outer_rows = pull(self.childs[0])
+        while True:
+            outer_row = next(outer_rows, None)
+            if outer_row is not None:
+                key = self.outer_key(outer_row)
+                if key is not None:
+                    batch.append((outer_row, key))
+                if len(batch) < self.batch_size:
+                    continue
+            if batch:
+                matches = self.lookup(list({key for _, key in batch}))
+                for row, key in batch:
+                    for inner_row in matches.get(key, ()):
+                        if combine is None:
+                            combine = self.make_combine(row, inner_row)
+                        yield combine(row, inner_row)
+                batch = []
+            if outer_row is None:
+                return
+
+
+def _merge_order(key: Any) -> tuple:
+    # urutan total untuk key campuran: angka dulu, lalu sisanya sebagai string
+    return (0, key) if isinstance(key, (int, float)) else (1, str(key))
+
+
+class SortMergeJoin(Operator):
+    """
+    Sort-merge join untuk equi-join.
+
+    Kedua sisi diurutkan berdasarkan key lalu digabung sekali jalan; setiap
+    kelompok key yang sama di kiri dipasangkan dengan kelompok yang sama di
+    kanan. Input dari scan leaf B+ tree sudah urut, jadi sort di sini hanya
+    satu lintasan (Timsort linear untuk data yang sudah urut).
+    make_join sama dengan HashJoin: (row kiri pertama, row kanan pertama) ->
+    (left_key, right_key, combine).
+    """
+
+    def __init__(self, left: Operator, right: Operator, make_join: Callable[[Any, Any], Any]) -> None:
+        super().__init__(left, right)
+        self.make_join = make_join
+
+    def _rows(self) -> Iterator[Any]:
+        left_rows = list(pull(self.childs[0]))
+        right_rows = list(pull(self.childs[1])) if left_rows else []
+        if not right_rows:
+            return
+        left_key, right_key, combine = self.make_join(left_rows[0], right_rows[0])
+        left_sorted = self._sorted(left_rows, left_key)
+        right_sorted = self._sorted(right_rows, right_key)
+
+        i = j = 0
+        while i < len(left_sorted) and j < len(right_sorted):
+            left_order, right_order = left_sorted[i][0], right_sorted[j][0]
+            if left_order < right_order:
+                i += 1
+            elif left_order > right_order:
+                j += 1
+            else:
+                group_end = j
+                while group_end < len(right_sorted) and right_sorted[group_end][0] == left_order:
+                    group_end += 1
+                while i < len(left_sorted) and left_sorted[i][0] == left_order:
+                    for _, right_row in right_sorted[j:group_end]:
+                        yield combine(left_sorted[i][1], right_row)
+                    i += 1
+                j = group_end
+
+    @staticmethod
+    def _sorted(rows: List[Any], key_fn: Callable[[Any], Any]) -> List[Any]:
+        keyed = [(_merge_order(key), row) for row in rows for key in (key_fn(row),) if key is not None]
+        keyed.sort(key=lambda item: item[0])
+        return keyed
+
+
+class Sort(Operator):
+    # blocking: semua row child dikumpulkan dulu; keys = [(key_fn, ascending)] dari prioritas tertinggi
+    def __init__(self, child: Operator, keys: List[Any]) -> None:
+        super().__init__(child)
+        self.keys = keys
+
+    def _rows(self) -> Iterator[Any]:
+        rows = list(pull(self.childs[0]))
+        for key, ascending in reversed(self.keys):
+            rows.sort(key=key, reverse=not ascending)
+        yield from rows
+
+
+class Limit(Operator):
+    # berhenti menarik child setelah limit row
+    def __init__(self, child: Operator, limit: int) -> None:
+        super().__init__(child)
+        self.limit = limit
+
+    def _rows(self) -> Iterator[Any]:
+        if self.limit <= 0:
+            return
+        count = 0
+        for row in pull(self.childs[0]):
+            yield row
+            count += 1
+            if count >= self.limit:
+                return
+
+
+class Group(Operator):
+    # GROUP BY belum mengagregasi; child tetap dihabiskan supaya error (mis. tabel tidak ada) tetap muncul
+    def __init__(self, child: Operator, column: Any) -> None:
+        super().__init__(child)
+        self.column = column
+
+    def _rows(self) -> Iterator[Any]:
+        for _ in pull(self.childs[0]):
+            pass
+        yield {"info": f"GROUP BY {self.column} - basic implementation"}
+
+
+class SetUnion(Operator):
+    # gabungan hasil semua child tanpa duplikat
+    def _rows(self) -> Iterator[Any]:
+        seen = set()
+        for child in self.childs:
+            for row in pull(child):
+                key = tuple(sorted(row.items())) if isinstance(row, dict) else row
+                if key not in seen:
+                    seen.add(key)
+                    yield row
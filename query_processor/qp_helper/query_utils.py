@@ -12,6 +12,10 @@ class QueryType(Enum):
     INSERT_INTO = auto() # Bonus
     CREATE_TABLE = auto() # Bonus
     DROP_TABLE = auto() # Bonus
+    ALTER_TABLE = auto()
+    VACUUM = auto()
+    CREATE_INDEX = auto()
+    DROP_INDEX = auto()
     
     # transaction queries
     BEGIN_TRANSACTION = auto()
@@ -29,6 +33,10 @@ DATA_QUERIES = {
     QueryType.INSERT_INTO,
     QueryType.CREATE_TABLE,
     QueryType.DROP_TABLE,
+    QueryType.ALTER_TABLE,
+    QueryType.VACUUM,
+    QueryType.CREATE_INDEX,
+    QueryType.DROP_INDEX,
 }
 
 TRANSACTION_QUERIES = {
@@ -50,10 +58,18 @@ def get_query_type(query: str) -> QueryType:
     
     if q.startswith("INSERT INTO"):
         return QueryType.INSERT_INTO
+    elif q.startswith("CREATE INDEX"):
+        return QueryType.CREATE_INDEX
     elif q.startswith("CREATE TABLE"):
         return QueryType.CREATE_TABLE
+    elif q.startswith("DROP INDEX"):
+        return QueryType.DROP_INDEX
     elif q.startswith("DROP TABLE"):
         return QueryType.DROP_TABLE
+    elif q.startswith("ALTER TABLE"):
+        return QueryType.ALTER_TABLE
+    elif q.startswith("VACUUM"):
+        return QueryType.VACUUM
     elif q.startswith("BEGIN TRANSACTION"):
         return QueryType.BEGIN_TRANSACTION
     elif q.startswith("SELECT"):
@@ -27,6 +27,12 @@ class DBMSServer:
         self.deps = load_dependencies()
         self.dbms = MiniDBMS(self.deps)
         print("[Server] MiniDBMS initialized successfully.")
+
+        # cache diisi ulang dari hot set terakhir di background, server tetap langsung menerima koneksi
+        storage_manager = getattr(self.dbms.query_processor, 'storage_manager', None)
+        if storage_manager is not None and hasattr(storage_manager, 'prewarm'):
+            storage_manager.prewarm(background=True)
+            storage_manager.start_hot_set_dumps()
         
     def start(self):
         try:
@@ -241,11 +247,16 @@ class DBMSServer:
                                 "f_r": getattr(stats, 'f_r', None)
                             }
                         
+                        io_stats = {}
+                        if hasattr(storage_manager, 'get_io_stats'):
+                            io_stats = storage_manager.get_io_stats(table_name)
+                        
                         return {
                             "type": "describe_table",
                             "table_name": table_name,
                             "attributes": attributes,
-                            "stats": stats_dict
+                            "stats": stats_dict,
+                            "io": io_stats
                         }
                     else:
                         return {
@@ -349,6 +360,10 @@ class DBMSServer:
                         else:
                             optimization_info[key] = value
                 
+                access_paths = []
+                if optimized and optimized.query_tree:
+                    access_paths = self.dbms.query_processor.explain_access_paths(optimized.query_tree)
+                
                 return {
                     "type": "explain",
                     "query": query.rstrip(";"),
@@ -357,7 +372,8 @@ class DBMSServer:
                     "improvement_percent": improvement,
                     "optimization_info": optimization_info,
                     "original_tree": original_tree,
-                    "optimized_tree": optimized_tree
+                    "optimized_tree": optimized_tree,
+                    "access_paths": access_paths
                 }
             except Exception as e:
                 return {
@@ -444,6 +460,10 @@ class DBMSServer:
         self.running = False
         if self.server_socket:
             self.server_socket.close()
+        # page write-behind yang masih antri ditulis sebelum proses berhenti
+        storage_manager = getattr(getattr(self.dbms, 'query_processor', None), 'storage_manager', None)
+        if storage_manager is not None and hasattr(storage_manager, 'close'):
+            storage_manager.close()
         print("[Server] Server stopped")
 
 
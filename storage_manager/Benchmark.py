@@ -0,0 +1,88 @@
+#run pake python storage_manager/Benchmark.py [jumlah_row]
+# bandingkan filter lama (deserialize semua record lalu _match_all) dengan predicate yang di-bind ke byte record
+# dan filter numpy (kolom int/float, hanya kalau numpy terpasang)
+import shutil
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "storage_manager"))
+
+from StorageManager import StorageManager
+from storagemanager_model.condition import Condition
+from storagemanager_model.data_write import DataWrite
+from storagemanager_helper.schema import Schema
+from storagemanager_helper.slotted_page import SlottedPage
+from storagemanager_helper.predicate import bind_conditions
+from storagemanager_helper.vectorized import bind_vector_filter
+
+CASES = [
+    ("int =", [Condition("StudentID", "=", 4242)]),
+    ("int >=", [Condition("StudentID", ">=", 9000)]),
+    ("char =", [Condition("Code", "=", "K7")]),
+    ("varchar =", [Condition("Name", "=", "Student777")]),
+    ("varchar LIKE", [Condition("Name", "LIKE", "Student12%")]),
+    ("float <", [Condition("GPA", "<", 2.2)]),
+]
+
+
+def build_records(sm, n_rows):
+    schema = Schema()
+    schema.add_attribute("StudentID", "int", 4)
+    schema.add_attribute("Code", "char", 4)
+    schema.add_attribute("Name", "varchar", 50)
+    schema.add_attribute("GPA", "float", 4)
+    sm.schema_manager.add_table_schema("Student", schema)
+    sm.schema_manager.save_schemas()
+    with open(sm._get_table_file_path("Student"), "wb") as f:
+        f.write(SlottedPage().serialize())
+    for i in range(n_rows):
+        row = {"StudentID": i, "Code": f"K{i % 10}", "Name": f"Student{i}", "GPA": round(2.0 + (i % 20) / 10, 2)}
+        sm.write_block(DataWrite("Student", None, [], row))
+    table_path = sm._get_table_file_path("Student")
+    with open(table_path, "rb") as f:
+        return schema, [page.get_record(slot) for _, page, slots in sm._iter_target_pages(f) for slot in slots]
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    base_path = tempfile.mkdtemp(prefix="sm_bench_")
+    try:
+        sm = StorageManager(base_path)
+        schema, records = build_records(sm, n_rows)
+        deserialize = sm.row_serializer.deserialize
+
+        print(f"{len(records)} record, waktu per scan (ms)")
+        print(f"{'kondisi':<14}{'decode+match':>14}{'bound bytes':>14}{'speedup':>10}{'numpy':>10}{'speedup':>10}")
+        for name, conditions in CASES:
+            def decoded_path():
+                rows = (deserialize(schema, record) for record in records)
+                return [row for row in rows if sm._match_all(row, conditions)]
+
+            def bound_path():
+                matches = bind_conditions(schema, conditions, sm.row_serializer.with_lsn, sm._match)
+                return [deserialize(schema, record) for record in records if matches(record)]
+
+            vector_filter = bind_vector_filter(schema, conditions, sm.row_serializer.with_lsn, sm._match)
+
+            def vector_path():
+                return [deserialize(schema, records[i]) for i in vector_filter.filter(records)]
+
+            assert decoded_path() == bound_path()
+            old = min(timeit.repeat(decoded_path, number=1, repeat=5)) * 1000
+            new = min(timeit.repeat(bound_path, number=1, repeat=5)) * 1000
+            line = f"{name:<14}{old:>14.2f}{new:>14.2f}{old / new:>9.1f}x"
+            if vector_filter is not None:
+                assert vector_path() == bound_path()
+                vec = min(timeit.repeat(vector_path, number=1, repeat=5)) * 1000
+                line += f"{vec:>10.2f}{old / vec:>9.1f}x"
+            print(line)
+    finally:
+        shutil.rmtree(base_path, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,66 @@
 import os
 import math
+import shutil
+import threading
+import time
 from storagemanager_helper.row_serializer import RowSerializer
 from storagemanager_model.statistic import Statistic
 from storagemanager_helper.schema_manager import SchemaManager
-from storagemanager_helper.slotted_page import SlottedPage, PAGE_SIZE
+from storagemanager_helper.schema import Schema
+from storagemanager_helper.slotted_page import SlottedPage, PAGE_SIZE, SLOT_SIZE, SLOT_FLAG_DELETED
 from storagemanager_model.condition import Condition
 from storagemanager_model.data_retrieval import DataRetrieval
 from storagemanager_model.data_write import DataWrite
 from storagemanager_model.index import HashIndexEntry
-from storagemanager_helper.index import HashIndexManager, BPlusTreeIndexManager
+from storagemanager_helper.index import HashIndexManager, BPlusTreeIndexManager, TrigramIndexManager
+from storagemanager_helper.zone_map import ZoneMapManager
+from storagemanager_helper.bloom_filter import BloomFilterManager
+from storagemanager_helper.partition import PartitionScheme, partition_name, split_partition_name
+from storagemanager_helper.lsm import LSMManager
+from storagemanager_helper.like import like_match, like_prefix_range
+from storagemanager_helper.predicate import bind_conditions
+from storagemanager_helper.row_cache import RowCache, ROW_CACHE_SIZE
+from storagemanager_helper.latch import LatchManager
+from storagemanager_helper.io_stats import IOStats, IO_FIELDS
+from storagemanager_helper.index_build import IndexBuild, INDEX_BUILD_TYPES, INDEX_BUILD_BATCH
+from storagemanager_helper.page_writer import PageWriter
+from storagemanager_helper.vectorized import bind_vector_filter, VECTOR_MIN_ROWS
+from storagemanager_helper.prewarm import Prewarmer, PREWARM_FILE
+from storagemanager_model.data_deletion import DataDeletion
+
+VACUUM_BATCH_SIZE = 64  # jumlah page (compact) atau row (FULL) per batch vacuum
+INDEX_SCAN_THRESHOLD = 0.3  # porsi page tabel maksimal yang boleh disentuh index scan sebelum pindah ke seq scan
 
 
 class StorageManager:
-    def __init__(self, base_path='data', frm_instance=None, recovery_enabled=True):
+    def __init__(self, base_path='data', frm_instance=None, recovery_enabled=True, row_cache_size=ROW_CACHE_SIZE,
+                 write_behind=False):
         self.base_path = base_path
         self.storage_path = base_path
         self.row_serializer = RowSerializer(with_lsn=(frm_instance is not None or recovery_enabled))
         self.schema_manager = SchemaManager(base_path)
         self.hash_index_manager = HashIndexManager(base_path)
         self.bplus_tree_index_manager = BPlusTreeIndexManager(base_path)
+        self.trigram_index_manager = TrigramIndexManager(base_path)
+        self.zone_map_manager = ZoneMapManager(base_path)
+        self.bloom_filter_manager = BloomFilterManager(base_path)
+        self.lsm_manager = LSMManager(base_path)
+        self.row_cache = RowCache(row_cache_size)
+        self.latches = LatchManager()
+        self.io_stats = IOStats()  # key = nama file tabel/partisi tanpa .dat
+        self._index_builds = {}  # path tabel -> IndexBuild yang sedang berjalan (CREATE INDEX CONCURRENTLY)
+        self._index_build_threads = {}  # nama index -> (thread, [IndexBuild])
+        self._index_build_errors = {}
+        self._index_catalog_lock = threading.RLock()
+        self.index_scan_threshold = INDEX_SCAN_THRESHOLD
+        self.vectorized_scan = True  # filter full scan pakai numpy kalau tersedia
+        self.last_access_path = None
         self.frm_instance = frm_instance
         self.recovery_enabled = recovery_enabled
+        # write-behind: page hasil DML diantrikan dan ditulis thread background (lihat PageWriter)
+        self._dml_lsn = threading.local()
+        self.page_writer = PageWriter(self._flush_pages) if write_behind else None
+        self.prewarmer = Prewarmer(self, os.path.join(self.storage_path, PREWARM_FILE))
 
         if self.frm_instance is not None:
             self._configure_frm_integration()
@@ -64,6 +104,41 @@ class StorageManager:
 
         return lower_path
 
+    def _logical_table(self, table_name):
+        # partisi ({table}__p{i}) memakai schema dan opsi milik tabel induknya
+        parent, _ = split_partition_name(table_name)
+        if parent is not None and self._get_partition_scheme(parent) is not None:
+            return parent
+        return table_name
+
+    def _get_table_schema(self, table_name):
+        return self.schema_manager.get_table_schema(self._logical_table(table_name))
+
+    def _get_table_options(self, table_name):
+        return self.schema_manager.get_table_options(self._logical_table(table_name))
+
+    def _get_partition_scheme(self, table_name):
+        return PartitionScheme.from_options(self.schema_manager.get_table_options(table_name))
+
+    def _get_lsm_tree(self, table_name):
+        # None kalau tabel memakai slotted page biasa
+        if self._get_table_options(table_name).get('engine') != 'lsm':
+            return None
+        return self.lsm_manager.get_tree(self._get_table_file_path(table_name))
+
+    def get_partitions(self, table_name, conditions=None):
+        # unit fisik tabel (untuk scan paralel / vacuum per partisi), sudah dipangkas menurut kondisi.
+        # tabel biasa hanya punya satu unit, yaitu tabel itu sendiri.
+        scheme = self._get_partition_scheme(table_name)
+        if scheme is None:
+            return [table_name]
+
+        schema = self._get_table_schema(table_name)
+        partition_ids = scheme.prune(
+            conditions, lambda column, operand: self._coerce_operand(schema, column, operand)
+        )
+        return [partition_name(table_name, i) for i in partition_ids]
+
     def _read_row_by_pk(self, table_name: str, pk_column: str, pk_value) -> dict:
         try:
             retrieval_request = DataRetrieval(
@@ -84,7 +159,7 @@ class StorageManager:
         columns = data_retrieval.column
         conditions = data_retrieval.conditions or []
 
-        schema = self.schema_manager.get_table_schema(table)
+        schema = self._get_table_schema(table)
         if schema is None:
             raise ValueError(f"Tabel '{table}' tidak ditemukan")
 
@@ -101,139 +176,951 @@ class StorageManager:
             if cond.column not in schema_attrs:
                 raise ValueError(f"Kolom '{cond.column}' tidak ada di tabel '{table}'")
 
-        index_used = False
+        pk = self._row_cache_key(table, schema, conditions)
+        if pk is None:
+            return self._read_rows(table, schema, columns, conditions)
+
+        # lookup primary key: row hasil decode diambil dari row cache kalau ada
+        rows = self.row_cache.get(table, pk)
+        if rows is None:
+            generation = self.row_cache.generation(table)
+            rows = self._read_rows(table, schema, "*", conditions)
+            self.row_cache.put(table, pk, rows, generation)
+        else:
+            self.last_access_path = {'table': table, 'method': 'row_cache'}
+        return [self._project(dict(row), columns) for row in rows]
+
+    def _row_cache_key(self, table, schema, conditions):
+        # hanya kondisi tunggal "pk = nilai" pada tabel induk (bukan partisi) yang di-cache
+        if self.row_cache.capacity <= 0 or len(conditions) != 1 or self._logical_table(table) != table:
+            return None
+        cond = conditions[0]
+        pk_column = schema.get_attributes()[0]['name']
+        if cond.column != pk_column or cond.operation != "=":
+            return None
+        pk = self._coerce_operand(schema, pk_column, cond.operand)
+        return pk if isinstance(pk, (int, float, str)) else None
+
+    def _invalidate_row_cache(self, table, conditions, new_value=None, column=None, insert=False):
+        # buang key yang disentuh tulisan; kalau key-nya tidak bisa dipastikan, buang satu tabel
+        table = self._logical_table(table)
+        schema = self._get_table_schema(table)
+        if schema is not None:
+            pk_column = schema.get_attributes()[0]['name']
+            if insert:
+                if isinstance(new_value, dict) and pk_column in new_value:
+                    self.row_cache.invalidate(table, [self._coerce_operand(schema, pk_column, new_value[pk_column])])
+                    return
+            else:
+                changed = [column] if isinstance(column, str) else column
+                if (changed is None or "*" in changed) and isinstance(new_value, dict):
+                    changed = list(new_value)
+                pk = self._row_cache_key(table, schema, conditions or [])
+                if pk is not None and pk_column not in (changed or []):
+                    self.row_cache.invalidate(table, [pk])
+                    return
+        self.row_cache.invalidate(table)
+
+    def get_row_cache_stats(self):
+        return self.row_cache.get_stats()
+
+    def _read_rows(self, table, schema, columns, conditions):
+        if self._get_partition_scheme(table) is not None:
+            results = []
+            for partition in self.get_partitions(table, conditions):
+                results.extend(self.read_block(DataRetrieval(table=partition, column=columns, conditions=conditions)))
+            return results
+
+        tree = self._get_lsm_tree(table)
+        if tree is not None:
+            return [self._project(row, columns) for row in self._read_lsm(tree, schema, conditions)]
+
+        table_path = self._get_table_file_path(table)
+        if not os.path.exists(table_path):
+            raise FileNotFoundError(f"File data '{table_path}' tidak ditemukan")
+
+        with self.latches.table(table_path).shared():
+            return self._read_heap(table, table_path, schema, columns, conditions)
+
+    def _read_heap(self, table, table_path, schema, columns, conditions):
         results = []
+        index_locations, clustered_pages, self.last_access_path = self._plan_access_path(
+            table, table_path, schema, conditions
+        )
+        index_used = index_locations is not None
+
+        # operand di-bind sekali ke tipe kolom, record yang tidak cocok tidak perlu didecode
+        matches = self._bind_conditions(schema, conditions)
+
+        if index_used:
+            with self._open_table(table_path, "rb") as f:
+                for page_id, page, slot_ids in self._iter_target_pages(f, index_locations):
+                    for slot_id in slot_ids:
+                        try:
+                            row = self._read_slot(schema, page, slot_id, matches, conditions)
+                        except Exception:
+                            continue
 
-        if len(conditions) == 1:
-            cond = conditions[0]
-            if cond.operation == "=":
-                index_locations = self.hash_index_manager.search(table, cond.column, cond.operand)
-                
-                if not index_locations:
-                    index_locations = self.bplus_tree_index_manager.search(table, cond.column, cond.operand)
-
-                if index_locations:
-                    index_used = True
-                    table_path = self._get_table_file_path(table)
-                    
-                    with open(table_path, "rb") as f:
-                        for page_id, slot_id in index_locations:
-                            f.seek(page_id * PAGE_SIZE)
-                            page_bytes = f.read(PAGE_SIZE)
-                            
-                            if len(page_bytes) < PAGE_SIZE:
-                                page_bytes = page_bytes.ljust(PAGE_SIZE, b"\x00")
-                            
-                            page = SlottedPage()
-                            page.load(page_bytes)
-                            
-                            try:
-                                record_bytes = page.get_record(slot_id)
-                                row = self.row_serializer.deserialize(schema, record_bytes)
-                                results.append(self._project(row, columns))
-                            except:
-                                pass 
-            
-            elif cond.operation in (">", "<", ">=", "<="):
-                btree_indexes = self.bplus_tree_index_manager.list_indexes(table)
-                has_btree = any(idx['column'] == cond.column for idx in btree_indexes)
-                
-                if has_btree:
-                    index_used = True
-                    table_path = self._get_table_file_path(table)
-                    
-                    if cond.operation in (">", ">="):
-                        index_data = self.bplus_tree_index_manager.load_index(table, cond.column)
-                        if index_data and index_data['root']:
-                            node = index_data['root']
-                            while not node.is_leaf:
-                                node = node.children[-1]
-                            max_key = node.keys[-1] if node.keys else cond.operand
-                            
-                            if cond.operation == ">":
-                                range_results = self.bplus_tree_index_manager.range_search(
-                                    table, cond.column, cond.operand, max_key
-                                )
-                                range_results = [(k, v) for k, v in range_results if k > cond.operand]
-                            else:  # >=
-                                range_results = self.bplus_tree_index_manager.range_search(
-                                    table, cond.column, cond.operand, max_key
-                                )
-                        else:
-                            range_results = []
-                    
-                    else:  # < or <=
-                        index_data = self.bplus_tree_index_manager.load_index(table, cond.column)
-                        if index_data and index_data['root']:
-                            node = index_data['root']
-                            while not node.is_leaf:
-                                node = node.children[0]
-                            min_key = node.keys[0] if node.keys else cond.operand
-                            
-                            if cond.operation == "<":
-                                range_results = self.bplus_tree_index_manager.range_search(
-                                    table, cond.column, min_key, cond.operand
-                                )
-                                range_results = [(k, v) for k, v in range_results if k < cond.operand]
-                            else:  # <=
-                                range_results = self.bplus_tree_index_manager.range_search(
-                                    table, cond.column, min_key, cond.operand
-                                )
-                        else:
-                            range_results = []
-                    
-                    with open(table_path, "rb") as f:
-                        for key, (page_id, slot_id) in range_results:
-                            f.seek(page_id * PAGE_SIZE)
-                            page_bytes = f.read(PAGE_SIZE)
-                            
-                            if len(page_bytes) < PAGE_SIZE:
-                                page_bytes = page_bytes.ljust(PAGE_SIZE, b"\x00")
-                            
-                            page = SlottedPage()
-                            page.load(page_bytes)
-                            
-                            try:
-                                record_bytes = page.get_record(slot_id)
-                                row = self.row_serializer.deserialize(schema, record_bytes)
-                                results.append(self._project(row, columns))
-                            except:
-                                pass
-    
-        # Full table scan
-        if not index_used:
+                        if row is not None:
+                            results.append(self._project(row, columns))
 
-            table_path = self._get_table_file_path(table)
-            if not os.path.exists(table_path):
-                raise FileNotFoundError(f"File data '{table_path}' tidak ditemukan")
+        # Clustered table: binary search fence key untuk kondisi pada kolom key
+        if clustered_pages is not None:
+            with self._open_table(table_path, "rb") as f:
+                for page_id, page, slot_ids in self._iter_target_pages(f, page_ids=clustered_pages):
+                    for slot_id in slot_ids:
+                        row = self._read_slot(schema, page, slot_id, matches, conditions)
+                        if row is not None:
+                            results.append(self._project(row, columns))
+
+        # Full table scan
+        if not index_used and clustered_pages is None:
 
             results = []
 
-            with open(table_path, "rb") as f:
+            # zone map: lewati page yang batas min/max-nya tidak mungkin memenuhi kondisi.
+            # kalau belum ada (atau stale), bangun ulang sambil scan karena semua row didecode.
+            zone_map = self.zone_map_manager.get_zone_map(table_path)
+            zone_pages = {} if zone_map is None else None
+
+            # bloom filter: buktikan nilai equality tidak ada di page sebelum decode
+            blooms = self._get_bloom_filters(table, table_path, schema) if conditions else {}
+            vector_filter = self._bind_vector_filter(schema, conditions) if zone_pages is None else None
+
+            # bloom filter tetap dipakai walaupun zone map sedang dibangun; page yang dilewati tidak punya
+            # batas, jadi zone map hasil scan itu tidak dipasang (fence clustered butuh semua page)
+            zone_pages_complete = True
+
+            with self._open_table(table_path, "rb") as f:
+                page_id = 0
                 while True:
-                    page_bytes = f.read(PAGE_SIZE)
+                    if conditions and (
+                        (zone_map is not None and not self.zone_map_manager.page_may_match(zone_map, page_id, conditions))
+                        or not self.bloom_filter_manager.page_may_match(blooms, page_id, conditions, schema)
+                    ):
+                        if zone_pages is not None:
+                            zone_pages_complete = False
+                        page_id += 1
+                        continue
+
+                    page_bytes = self._read_page_bytes(f, page_id)
                     if not page_bytes:
                         break
-                    if len(page_bytes) < PAGE_SIZE:
-                        page_bytes = page_bytes.ljust(PAGE_SIZE, b"\x00")
+                    page = self._load_page(page_bytes)
+
+                    if vector_filter is not None:
+                        results.extend(self._read_page_vectorized(schema, page, vector_filter, matches, conditions, columns))
+                        page_id += 1
+                        continue
 
-                    page = SlottedPage()
-                    page.load(page_bytes)
+                    if zone_pages is None:
+                        for slot_idx in page.live_slots():
+                            try:
+                                row = self._read_slot(schema, page, slot_idx, matches, conditions)
+                            except Exception as e:
+                                raise ValueError(f"Gagal decode record: {e}")
+
+                            if row is not None:
+                                results.append(self._project(row, columns))
+
+                        page_id += 1
+                        continue
 
-                    for slot_idx in range(page.record_count):
+                    # zone map sedang dibangun: semua row tetap didecode untuk batas min/max page
+                    page_rows = []
+                    for slot_idx in page.live_slots():
                         try:
-                            record_bytes = page.get_record(slot_idx)
-                            row = self.row_serializer.deserialize(schema, record_bytes)
+                            row = self._decode_slot(schema, page, slot_idx)
                         except Exception as e:
                             raise ValueError(f"Gagal decode record: {e}")
 
+                        page_rows.append(row)
+
                         if not self._match_all(row, conditions):
                             continue
 
                         results.append(self._project(row, columns))
 
+                    if zone_pages is not None:
+                        zone_pages[page_id] = self.zone_map_manager.compute_page_bounds(page_rows)
+
+                    page_id += 1
+
+            if zone_pages is not None and zone_pages_complete:
+                self.zone_map_manager.install(table_path, zone_pages)
+
         return results
 
+    def read_many_by_key(self, table, column, keys, columns="*"):
+        # lookup banyak key sekaligus (dipakai index nested-loop join): RID semua key dikumpulkan
+        # dulu lalu heap dibaca sekali per page. return dict key -> list row (key sesuai tipe kolom).
+        schema = self._get_table_schema(table)
+        if schema is None:
+            raise ValueError(f"Tabel '{table}' tidak ditemukan")
+
+        schema_attrs = [attr["name"] for attr in schema.get_attributes()]
+        if column not in schema_attrs:
+            raise ValueError(f"Kolom '{column}' tidak ada di tabel '{table}'")
+
+        results = {self._coerce_operand(schema, column, key): [] for key in keys}
+        if not results:
+            return results
+
+        scheme = self._get_partition_scheme(table)
+        if scheme is not None:
+            # key pada kolom partisi langsung diarahkan ke partisinya
+            keys_by_partition = {}
+            for key in results:
+                targets = [scheme.route(key)] if scheme.column == column else range(scheme.num_partitions)
+                for partition_id in targets:
+                    keys_by_partition.setdefault(partition_id, []).append(key)
+            for partition_id, partition_keys in sorted(keys_by_partition.items()):
+                partition_rows = self.read_many_by_key(partition_name(table, partition_id), column, partition_keys, columns)
+                for key, rows in partition_rows.items():
+                    results[key].extend(rows)
+            return results
+
+        tree = self._get_lsm_tree(table)
+        if tree is not None:
+            if column == schema_attrs[0]:
+                records = [record for record in (tree.get(key) for key in results) if record is not None]
+            else:
+                records = [record_bytes for _, record_bytes in tree.scan()]
+            for record_bytes in records:
+                row = self.row_serializer.deserialize(schema, record_bytes)
+                if row.get(column) in results:
+                    results[row[column]].append(self._project(row, columns))
+            return results
+
+        table_path = self._get_table_file_path(table)
+        with self.latches.table(table_path).shared():
+            locations = None
+            with self.latches.index(table_path).shared():
+                for manager in (self.hash_index_manager, self.bplus_tree_index_manager):
+                    if manager.load_index(table, column) is not None:
+                        locations = [location for key in results for location in manager.search(table, column, key)]
+                        break
+
+            with self._open_table(table_path, "rb") as f:
+                for _, page, slot_ids in self._iter_target_pages(f, locations):
+                    for slot_id in slot_ids:
+                        row = self._decode_slot(schema, page, slot_id)
+                        if row.get(column) in results:
+                            results[row[column]].append(self._project(row, columns))
+        return results
+
+    def read_ordered_by_key(self, table, column, columns="*"):
+        # semua row urut kolom lewat leaf B+ tree (dipakai sort-merge join): heap dibaca sekali per page
+        # (bitmap heap scan), row dikelompokkan per key lalu dikeluarkan sesuai urutan leaf.
+        # None kalau tidak ada index B+ (atau tabel partisi/LSM), caller sort sendiri.
+        schema = self._get_table_schema(table)
+        if schema is None:
+            raise ValueError(f"Tabel '{table}' tidak ditemukan")
+
+        schema_attrs = [attr["name"] for attr in schema.get_attributes()]
+        if column not in schema_attrs:
+            raise ValueError(f"Kolom '{column}' tidak ada di tabel '{table}'")
+
+        if self._get_partition_scheme(table) is not None or self._get_lsm_tree(table) is not None:
+            return None
+
+        table_path = self._get_table_file_path(table)
+        with self.latches.table(table_path).shared():
+            with self.latches.index(table_path).shared():
+                entries = self.bplus_tree_index_manager.scan_entries(table, column)
+            if entries is None:
+                return None
+
+            rows_by_key = {}
+            for key, _ in entries:
+                rows_by_key.setdefault(key, [])
+            with self._open_table(table_path, "rb") as f:
+                for _, page, slot_ids in self._iter_target_pages(f, [location for _, location in entries]):
+                    for slot_id in slot_ids:
+                        row = self._decode_slot(schema, page, slot_id)
+                        rows = rows_by_key.get(row.get(column))
+                        if rows is None:
+                            # index tidak sinkron dengan heap, lebih aman caller sort sendiri
+                            return None
+                        rows.append(self._project(row, columns))
+
+        return [row for rows in rows_by_key.values() for row in rows]
+
+    def _read_lsm(self, tree, schema, conditions):
+        # equality pada key cukup satu lookup (memtable, lalu run dari yang terbaru)
+        key_column = schema.get_attributes()[0]['name']
+        key_conds = [cond for cond in conditions if cond.column == key_column and cond.operation == "="]
+        if key_conds:
+            record_bytes = tree.get(self._coerce_operand(schema, key_column, key_conds[0].operand))
+            records = [record_bytes] if record_bytes is not None else []
+        else:
+            records = [record_bytes for _, record_bytes in tree.scan()]
+
+        matches = self._bind_conditions(schema, conditions)
+        return [self.row_serializer.deserialize(schema, record_bytes) for record_bytes in records if matches(record_bytes)]
+
+    def _coerce_operand(self, schema, column, operand):
+        # samakan tipe operand dengan tipe kolom supaya cocok dengan key index
+        attr_type = schema.get_attribute(column)['type']
+        try:
+            if attr_type == 'int':
+                if isinstance(operand, str):
+                    s = operand.strip()
+                    operand = float(s) if '.' in s else int(s)
+                if isinstance(operand, float) and operand.is_integer():
+                    operand = int(operand)
+            elif attr_type == 'float':
+                if isinstance(operand, str):
+                    operand = float(operand.strip())
+                if isinstance(operand, (int, float)):
+                    operand = round(float(operand), 2)
+        except ValueError:
+            pass
+        return operand
+
+    def _index_lookup(self, table, schema, conditions):
+        # return list (page_id, slot_id) dari index, atau None kalau tidak ada index yang bisa dipakai.
+        # semua kondisi tetap dicek ulang pada row hasil index.
+        return self._index_candidates(table, schema, conditions)[0]
+
+    def _index_candidates(self, table, schema, conditions):
+        # return (locations, jenis index, kolom) atau (None, None, None)
+        for cond in conditions:
+            if cond.operation != "=":
+                continue
+            operand = self._coerce_operand(schema, cond.column, cond.operand)
+            if self.hash_index_manager.load_index(table, cond.column) is not None:
+                return self.hash_index_manager.search(table, cond.column, operand), 'hash', cond.column
+            if self.bplus_tree_index_manager.load_index(table, cond.column) is not None:
+                return self.bplus_tree_index_manager.search(table, cond.column, operand), 'btree', cond.column
+
+        for cond in conditions:
+            if cond.operation not in (">", "<", ">=", "<="):
+                continue
+            index_data = self.bplus_tree_index_manager.load_index(table, cond.column)
+            if index_data is None:
+                continue
+            bounds = self._tree_key_bounds(index_data['root']) if index_data['root'] else None
+            if bounds is None:
+                return [], 'btree', cond.column
+
+            operand = self._coerce_operand(schema, cond.column, cond.operand)
+            min_key, max_key = bounds
+            if cond.operation in (">", ">="):
+                range_results = self.bplus_tree_index_manager.range_search(table, cond.column, operand, max_key)
+            else:
+                range_results = self.bplus_tree_index_manager.range_search(table, cond.column, min_key, operand)
+            return [location for _, location in range_results], 'btree', cond.column
+
+        # LIKE dengan prefix literal jadi range scan [prefix, prefix + max_char], pola dicek ulang per row
+        for cond in conditions:
+            if cond.operation != "LIKE" or not self._is_string_column(schema, cond.column):
+                continue
+            bounds = like_prefix_range(cond.operand)
+            if bounds is None:
+                continue
+            if self.bplus_tree_index_manager.load_index(table, cond.column) is None:
+                continue
+            range_results = self.bplus_tree_index_manager.range_search(table, cond.column, *bounds)
+            return [location for _, location in range_results], 'btree', cond.column
+
+        # LIKE substring/infix: irisan posting list trigram, pola dicek ulang per row
+        for cond in conditions:
+            if cond.operation != "LIKE":
+                continue
+            candidates = self.trigram_index_manager.search_pattern(table, cond.column, cond.operand)
+            if candidates is not None:
+                return candidates, 'trigram', cond.column
+
+        return None, None, None
+
+    def _plan_access_path(self, table, table_path, schema, conditions):
+        # pilih access path yang sama untuk read, update, dan delete.
+        # return (locations, page_ids, plan): locations untuk bitmap index scan, page_ids untuk
+        # clustered table, keduanya None berarti sequential scan. plan dicatat untuk EXPLAIN.
+        plan = {'table': table, 'method': 'seq_scan'}
+        total_pages = max(1, self._table_size(table_path) // PAGE_SIZE)
+
+        with self.latches.index(table_path).shared():
+            locations, index_type, column = self._index_candidates(table, schema, conditions)
+        if locations is not None:
+            # index dibayar dengan baca page acak; kalau porsi page yang disentuh besar,
+            # scan berurutan (plus zone map / bloom filter) lebih murah
+            pages = len({page_id for page_id, _ in locations})
+            fraction = pages / total_pages
+            plan.update({
+                'index': index_type, 'column': column, 'matches': len(locations),
+                'pages': pages, 'total_pages': total_pages,
+                'fraction': round(fraction, 4), 'threshold': self.index_scan_threshold,
+            })
+            if fraction <= self.index_scan_threshold:
+                plan['method'] = 'bitmap_index_scan'
+                return locations, None, plan
+
+        page_ids = self._clustered_pages(table, table_path, schema, conditions) if os.path.exists(table_path) else None
+        if page_ids is not None:
+            plan.update({'method': 'clustered_scan', 'pages': len(page_ids), 'total_pages': total_pages})
+        return None, page_ids, plan
+
+    def explain_access_path(self, data_retrieval: DataRetrieval):
+        # access path yang akan dipakai read_block, tanpa membaca heap
+        table = data_retrieval.table
+        conditions = data_retrieval.conditions or []
+        schema = self._get_table_schema(table)
+        if schema is None:
+            raise ValueError(f"Tabel '{table}' tidak ditemukan")
+
+        if self._get_partition_scheme(table) is not None:
+            return {
+                'table': table, 'method': 'partitioned',
+                'partitions': [
+                    self.explain_access_path(DataRetrieval(table=partition, column="*", conditions=conditions))
+                    for partition in self.get_partitions(table, conditions)
+                ],
+            }
+
+        if self._get_lsm_tree(table) is not None:
+            key_column = schema.get_attributes()[0]['name']
+            point = any(cond.column == key_column and cond.operation == "=" for cond in conditions)
+            return {'table': table, 'method': 'lsm_get' if point else 'lsm_scan'}
+
+        table_path = self._get_table_file_path(table)
+        return self._plan_access_path(table, table_path, schema, conditions)[2]
+
+    def _is_string_column(self, schema, column):
+        return schema.get_attribute(column)['type'] in ('char', 'varchar')
+
+    def _index_managers(self):
+        # index yang menyimpan RID (page_id, slot_id) dan harus ikut diubah setiap DML
+        return [self.hash_index_manager, self.bplus_tree_index_manager, self.trigram_index_manager]
+
+    def _indexed_columns(self, table_name, columns=None):
+        # return list (manager, kolom ber-index); columns membatasi ke kolom yang berubah
+        return [
+            (manager, [idx['column'] for idx in manager.list_indexes(table_name)
+                       if columns is None or idx['column'] in columns])
+            for manager in self._index_managers()
+        ]
+
+    def _tree_key_bounds(self, node):
+        # leaf bisa kosong setelah delete, jadi cari key terkecil/terbesar lewat rantai leaf
+        while not node.is_leaf:
+            node = node.children[0]
+        min_key = max_key = None
+        found = False
+        while node is not None:
+            if node.keys:
+                if not found:
+                    min_key = node.keys[0]
+                    found = True
+                max_key = node.keys[-1]
+            node = node.next_leaf
+        return (min_key, max_key) if found else None
+
+    def _iter_target_pages(self, f, locations=None, page_ids=None):
+        # locations None: semua page (full scan) atau hanya page_ids kalau diberikan;
+        # selain itu hanya page yang ditunjuk index.
+        # selalu seek ulang supaya caller boleh menulis page di antara iterasi.
+        if locations is None and page_ids is not None:
+            for page_id in page_ids:
+                page_bytes = self._read_page_bytes(f, page_id)
+                if not page_bytes:
+                    continue
+                page = self._load_page(page_bytes)
+                yield page_id, page, page.live_slots()
+            return
+
+        if locations is None:
+            page_id = 0
+            while True:
+                page_bytes = self._read_page_bytes(f, page_id)
+                if not page_bytes:
+                    break
+                page = self._load_page(page_bytes)
+                yield page_id, page, page.live_slots()
+                page_id += 1
+            return
+
+        # bitmap heap scan: RID dari index dikelompokkan per page lalu dibaca urut page_id,
+        # jadi setiap page cukup dibaca dan di-parse sekali walaupun berisi banyak RID.
+        # RID index selalu RID asal (home); row yang sudah pindah diambil di putaran kedua.
+        forwarded = {}
+        for page_id, slot_ids in self._rid_bitmap(locations):
+            page_bytes = self._read_page_bytes(f, page_id)
+            if not page_bytes:
+                continue
+            page = self._load_page(page_bytes)
+            live = []
+            for slot_id in slot_ids:
+                if slot_id >= page.record_count:
+                    continue
+                forward = page.get_forward(slot_id)
+                if forward is not None:
+                    forwarded.setdefault(forward[0], set()).add(forward[1])
+                elif page.is_live(slot_id):
+                    live.append(slot_id)
+            if live:
+                yield page_id, page, live
+
+        for page_id, slot_ids in self._rid_bitmap(forwarded):
+            page_bytes = self._read_page_bytes(f, page_id)
+            if not page_bytes:
+                continue
+            page = self._load_page(page_bytes)
+            yield page_id, page, [s for s in slot_ids if s < page.record_count and page.is_live(s)]
+
+    def _rid_bitmap(self, locations):
+        # return list (page_id, slot_id terurut) terurut per page; locations boleh list RID
+        # atau dict page_id -> kumpulan slot_id
+        if isinstance(locations, dict):
+            slots_by_page = locations
+        else:
+            slots_by_page = {}
+            for page_id, slot_id in locations:
+                slots_by_page.setdefault(page_id, set()).add(slot_id)
+        return [(page_id, sorted(slots_by_page[page_id])) for page_id in sorted(slots_by_page)]
+
+    def _get_or_build_zone_map(self, table_path, schema):
+        zone_map = self.zone_map_manager.get_zone_map(table_path)
+        if zone_map is None:
+            pages = {
+                page_id: self.zone_map_manager.compute_page_bounds(rows)
+                for page_id, rows in self._scan_pages(table_path, schema)
+            }
+            zone_map = self.zone_map_manager.install(table_path, pages)
+        return zone_map
+
+    def _clustered_pages(self, table, table_path, schema, conditions):
+        # return page yang mungkin berisi row untuk kondisi pada kolom cluster key,
+        # atau None kalau tabel tidak clustered / tidak ada kondisi pada key
+        key_column = self._get_table_options(table).get('clustered_by')
+        if key_column is None:
+            return None
+
+        low = high = None
+        has_bound = False
+        for cond in conditions:
+            if cond.column != key_column:
+                continue
+            if cond.operation == "LIKE":
+                bounds = like_prefix_range(cond.operand) if self._is_string_column(schema, key_column) else None
+                if bounds is None:
+                    continue
+                cond_low, cond_high = bounds
+            elif cond.operation in ("=", ">", ">=", "<", "<="):
+                operand = self._coerce_operand(schema, key_column, cond.operand)
+                cond_low = operand if cond.operation in ("=", ">", ">=") else None
+                cond_high = operand if cond.operation in ("=", "<", "<=") else None
+            else:
+                continue
+            try:
+                if cond_low is not None and (low is None or cond_low > low):
+                    low = cond_low
+                if cond_high is not None and (high is None or cond_high < high):
+                    high = cond_high
+            except TypeError:
+                return None
+            has_bound = True
+
+        if not has_bound:
+            return None
+
+        zone_map = self._get_or_build_zone_map(table_path, schema)
+        directory = self.zone_map_manager.get_fence_directory(zone_map, key_column)
+        try:
+            page_ids = directory.pages_in_range(low, high)
+        except TypeError:
+            return None
+
+        # page yang belum tercatat di zone map tidak bisa dibuktikan kosong
+        num_pages = self._table_size(table_path) // PAGE_SIZE
+        if len(zone_map['pages']) < num_pages:
+            page_ids = sorted(set(page_ids) | {p for p in range(num_pages) if p not in zone_map['pages']})
+        return page_ids
+
+    def _place_clustered_record(self, f, table_name, table_path, schema, record_bytes, key_column, blooms):
+        # cari page lewat fence key; kalau penuh, split seperti leaf B+ tree
+        zone_map = self.zone_map_manager.get_zone_map(table_path)
+        row = self.row_serializer.deserialize(schema, record_bytes)
+        key = row[key_column]
+
+        page_id = None
+        if zone_map is not None:
+            page_id = self.zone_map_manager.get_fence_directory(zone_map, key_column).page_for_key(key)
+        if page_id is None:
+            return self._place_record(f, record_bytes, version=schema.version)
+
+        page = self._read_page(f, page_id)
+        try:
+            slot_id = page.add_record(record_bytes, version=schema.version)
+        except Exception:
+            return self._split_clustered_page(
+                f, table_name, table_path, schema, page, page_id, record_bytes, key_column, blooms
+            )
+
+        self._write_page(f, page_id, page)
+        return page_id, slot_id
+
+    def _split_clustered_page(self, f, table_name, table_path, schema, page, page_id, record_bytes, key_column, blooms):
+        new_row = self.row_serializer.deserialize(schema, record_bytes)
+        key = new_row[key_column]
+
+        entries = []
+        for slot_id in page.live_slots():
+            slot_bytes = page.get_record(slot_id)
+            slot_row = self._decode_slot(schema, page, slot_id)
+            entries.append((slot_row[key_column], slot_id, slot_bytes, slot_row))
+        entries.sort(key=lambda entry: entry[0])
+
+        new_page_id = (self._file_size(f) + PAGE_SIZE - 1) // PAGE_SIZE
+        new_page = SlottedPage()
+
+        # append berurutan (key >= key terbesar di page) cukup buka page baru tanpa memindah row
+        if not entries or key >= entries[-1][0]:
+            slot_id = new_page.add_record(record_bytes, version=schema.version)
+            self._write_page(f, new_page_id, new_page)
+            self.zone_map_manager.set_page_bounds(table_path, new_page_id, [new_row])
+            return new_page_id, slot_id
+
+        index_managers = self._indexed_columns(table_name)
+
+        moved = entries[len(entries) // 2:]
+        kept_rows = [entry[3] for entry in entries[:len(entries) // 2]]
+        moved_rows = [entry[3] for entry in moved]
+        # filter bloom page lama tetap berisi nilai yang pindah (konservatif), page baru harus ikut memuatnya
+        for slot_row in moved_rows:
+            self.bloom_filter_manager.add_value(blooms, new_page_id, slot_row)
+
+        for _, slot_id, slot_bytes, slot_row in moved:
+            home = page.get_home(slot_id)
+            version = page.get_version(slot_id)
+            page.delete_record(slot_id)
+            new_slot_id = new_page.add_record(slot_bytes, home=home, version=version)
+
+            if home is not None:
+                self._update_home_slot(f, page, page_id, home, (new_page_id, new_slot_id))
+                continue
+            self._record_index_change(table_path, (page_id, slot_id))
+            self._record_index_change(table_path, (new_page_id, new_slot_id), slot_row)
+            with self.latches.index(table_path).exclusive():
+                for manager, index_columns in index_managers:
+                    for column_name in index_columns:
+                        manager.delete_entry(table_name, column_name, slot_row.get(column_name), page_id, slot_id)
+                        manager.insert_entry(table_name, column_name, slot_row.get(column_name), new_page_id, new_slot_id)
+
+        if key >= moved[0][0]:
+            target_page_id, slot_id = new_page_id, new_page.add_record(record_bytes, version=schema.version)
+            moved_rows.append(new_row)
+        else:
+            target_page_id, slot_id = page_id, page.add_record(record_bytes, version=schema.version)
+            kept_rows.append(new_row)
+
+        self._write_page(f, page_id, page)
+        self._write_page(f, new_page_id, new_page)
+
+        self.zone_map_manager.set_page_bounds(table_path, page_id, kept_rows)
+        self.zone_map_manager.set_page_bounds(table_path, new_page_id, moved_rows)
+        return target_page_id, slot_id
+
+    def _place_record(self, f, record_bytes, home=None, version=0):
+        # taruh record di page terakhir, atau page baru kalau tidak muat
+        file_size = self._file_size(f)
+
+        if file_size == 0:
+            page = SlottedPage()
+            page_id = 0
+        else:
+            page_id = (file_size // PAGE_SIZE) - 1
+            page = self._read_page(f, page_id)
+
+        try:
+            slot_id = page.add_record(record_bytes, home=home, version=version)
+        except Exception:
+            page = SlottedPage()
+            page_id = (file_size + PAGE_SIZE - 1) // PAGE_SIZE
+            slot_id = page.add_record(record_bytes, home=home, version=version)
+
+        self._write_page(f, page_id, page)
+        return page_id, slot_id
+
+    def _relocate_record(self, f, page, page_id, slot_id, record_bytes, version=0):
+        # row tidak muat lagi di page-nya: pindah ke page lain, slot asal jadi forwarding pointer.
+        # page yang sedang diproses ditulis dulu supaya _place_record membaca versi terbaru.
+        home = page.get_home(slot_id) or (page_id, slot_id)
+        self._write_page(f, page_id, page)
+
+        new_page_id, new_slot_id = self._place_record(f, record_bytes, home=home, version=version)
+
+        if home == (page_id, slot_id):
+            page.set_forward(slot_id, new_page_id, new_slot_id)
+        else:
+            page.delete_record(slot_id)
+            self._update_home_slot(f, page, page_id, home, (new_page_id, new_slot_id))
+        return new_page_id, new_slot_id
+
+    def _update_home_slot(self, f, page, page_id, home, forward=None):
+        # forward None: row dihapus, slot asal jadi tombstone
+        home_page_id, home_slot_id = home
+        if home_page_id == page_id:
+            home_page = page
+        else:
+            home_page = self._read_page(f, home_page_id)
+
+        if forward is None:
+            home_page.delete_record(home_slot_id)
+        else:
+            home_page.set_forward(home_slot_id, *forward)
+
+        if home_page is not page:
+            self._write_page(f, home_page_id, home_page)
+
+    def _open_table(self, table_path, mode):
+        # tanpa buffer: setiap page dibaca/ditulis langsung ke file di bawah latch page-nya,
+        # jadi handle lain tidak membaca sisa readahead yang sudah basi
+        return open(table_path, mode, buffering=0)
+
+    def _read_page_bytes(self, f, page_id):
+        # b"" kalau page_id di luar ujung file
+        name = self._io_name(f.name)
+        if self.page_writer is not None:
+            page_bytes = self.page_writer.get(f.name, page_id)
+            if page_bytes is not None:
+                self.prewarmer.touch_page(name, page_id)
+                return page_bytes
+        with self.latches.page(f.name, page_id).shared():
+            start = time.perf_counter()
+            f.seek(page_id * PAGE_SIZE)
+            page_bytes = f.read(PAGE_SIZE)
+        if page_bytes:
+            self.io_stats.record_read(name, len(page_bytes), time.perf_counter() - start, pages=1)
+            self.prewarmer.touch_page(name, page_id)
+        return page_bytes
+
+    def _read_page(self, f, page_id):
+        return self._load_page(self._read_page_bytes(f, page_id))
+
+    def _write_page(self, f, page_id, page):
+        page_bytes = page.serialize()
+        if self.page_writer is None:
+            self._write_page_bytes(f, page_id, page_bytes)
+            return
+        # caller memegang mutex writer (DML) atau latch tabel exclusive, jadi boleh flush sendiri
+        pending = self.page_writer.put(f.name, page_id, page_bytes, getattr(self._dml_lsn, 'value', 0))
+        if pending >= self.page_writer.max_pages:
+            self._flush_pages(f.name)
+
+    def _write_page_bytes(self, f, page_id, page_bytes):
+        with self.latches.page(f.name, page_id).exclusive():
+            start = time.perf_counter()
+            f.seek(page_id * PAGE_SIZE)
+            f.write(page_bytes)
+        self.io_stats.record_write(self._io_name(f.name), len(page_bytes), time.perf_counter() - start, pages=1)
+
+    def _write_pages(self, table_path, pages):
+        # tulis ulang seluruh file tabel; caller memegang latch tabel exclusive
+        if self.page_writer is not None:
+            self.page_writer.discard(table_path)
+        start = time.perf_counter()
+        with open(table_path, "wb") as f:
+            for page in pages:
+                f.write(page.serialize())
+        self.io_stats.record_write(
+            self._io_name(table_path), len(pages) * PAGE_SIZE, time.perf_counter() - start, pages=len(pages)
+        )
+
+    def _sync_table(self, table_name):
+        # fsync semua file fisik tabel, dipakai checkpoint setelah buffer FRM di-flush
+        for unit in self.get_partitions(table_name):
+            table_path = self._get_table_file_path(unit)
+            if not os.path.exists(table_path):
+                continue
+            self._flush_pages(table_path)
+            with self.latches.table(table_path).shared(), self._open_table(table_path, "rb+") as f:
+                start = time.perf_counter()
+                os.fsync(f.fileno())
+            self.io_stats.record_fsync(self._io_name(table_path), time.perf_counter() - start)
+
+    def _file_size(self, f):
+        # ukuran file logis: page baru di ujung file bisa masih di antrian write-behind
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        if self.page_writer is not None:
+            size = max(size, self.page_writer.page_count(f.name) * PAGE_SIZE)
+        return size
+
+    def _table_size(self, table_path):
+        size = os.path.getsize(table_path) if os.path.exists(table_path) else 0
+        if self.page_writer is not None:
+            size = max(size, self.page_writer.page_count(table_path) * PAGE_SIZE)
+        return size
+
+    def _flush_pages(self, table_path):
+        # tulis page write-behind satu file tabel urut page_id, setelah WAL sampai page LSN-nya aman.
+        # dipegang mutex writer supaya tidak ada DML yang menaruh versi baru di tengah flush.
+        if self.page_writer is None:
+            return 0
+        with self.latches.table_writer(table_path):
+            pages, index_saves = self.page_writer.pending(table_path)
+            if pages and not os.path.exists(table_path):
+                self.page_writer.discard(table_path)
+                pages = []
+            try:
+                if pages:
+                    self._flush_wal(max(lsn for _, _, lsn in pages))
+                    self.zone_map_manager.get_zone_map(table_path)
+                    blooms = self.bloom_filter_manager.get_filters(table_path)
+                    with self._open_table(table_path, "rb+") as f:
+                        for page_id, page_bytes, _ in pages:
+                            self._write_page_bytes(f, page_id, page_bytes)
+                    self.page_writer.done(table_path, pages)
+                    self.zone_map_manager.touch(table_path)
+                    self.bloom_filter_manager.touch(table_path, blooms)
+            except Exception:
+                # page masih di antrian; index yang tertunda ikut diantrikan lagi
+                for manager, table, column in index_saves:
+                    self.page_writer.save_index_later(table_path, manager, table, column)
+                raise
+            for manager, table, column in index_saves:
+                manager.save_index(table, column)
+        return len(pages)
+
+    def _flush_wal(self, lsn):
+        # aturan WAL: log sampai page LSN harus sudah di disk sebelum page-nya ditulis
+        if lsn <= self.page_writer.flushed_lsn:
+            return
+        if self.frm_instance is not None and hasattr(self.frm_instance, 'flush_logs_to_disk'):
+            self.frm_instance.flush_logs_to_disk()
+        self.page_writer.flushed_lsn = max(self.page_writer.flushed_lsn, lsn)
+
+    def _save_index(self, manager, table, column, table_path):
+        # dengan write-behind file .idx ditulis bersama page tabelnya, isi di memori sudah terbaru
+        if self.page_writer is None:
+            manager.save_index(table, column)
+        else:
+            self.page_writer.save_index_later(table_path, manager, table, column)
+
+    def flush_pages(self):
+        # kosongkan antrian write-behind (checkpoint / shutdown)
+        if self.page_writer is None:
+            return 0
+        return sum(self._flush_pages(path) for path in self.page_writer.paths())
+
+    def discard_pages(self, table_path):
+        # file tabel dihapus dari luar (DROP TABLE): page yang masih antri dibuang
+        if self.page_writer is not None:
+            with self.latches.table_writer(table_path):
+                self.page_writer.discard(table_path)
+
+    def close(self):
+        if self.page_writer is not None:
+            self.page_writer.stop()
+            self.flush_pages()
+        self.prewarmer.stop()
+        try:
+            self.prewarmer.dump()
+        except OSError as e:
+            print(f"[SM ERROR] Prewarm dump failed: {e}")
+
+    def prewarm(self, background=True, report=print):
+        # isi ulang cache dari hot set dump terakhir; background=True tidak menahan startup
+        if not background:
+            return self.prewarmer.warm(report)
+        thread = threading.Thread(target=self.prewarmer.warm, args=(report,), name="prewarm", daemon=True)
+        thread.start()
+        return thread
+
+    def save_hot_set(self):
+        return self.prewarmer.dump()
+
+    def start_hot_set_dumps(self):
+        self.prewarmer.start_dumping()
+
+    def get_prewarm_progress(self):
+        return dict(self.prewarmer.progress)
+
+    def _prewarm_row(self, table, pk):
+        # lookup primary key biasa, hasilnya masuk row cache
+        schema = self._get_table_schema(table)
+        if schema is None:
+            return
+        pk_column = schema.get_attributes()[0]['name']
+        self.read_block(DataRetrieval(table, "*", [Condition(pk_column, "=", pk)]))
+
+    def get_write_behind_stats(self):
+        if self.page_writer is None:
+            return None
+        return dict(self.page_writer.stats, pending=self.page_writer.pending_pages())
+
+    def _io_name(self, table_path):
+        return os.path.splitext(os.path.basename(table_path))[0].lower()
+
+    def _load_page(self, page_bytes):
+        if len(page_bytes) < PAGE_SIZE:
+            page_bytes = page_bytes.ljust(PAGE_SIZE, b"\x00")
+        page = SlottedPage()
+        page.load(page_bytes)
+        return page
+
+    def _decode_slot(self, schema, page, slot_id):
+        # decode record sesuai versi schema yang tercatat di slot
+        return self.row_serializer.deserialize(schema, page.get_record(slot_id), page.get_version(slot_id))
+
+    def _current_record(self, schema, page, slot_id):
+        # (row, record_bytes) dalam layout schema sekarang, dipakai saat tabel ditulis ulang
+        record_bytes = page.get_record(slot_id)
+        version = page.get_version(slot_id)
+        row = self.row_serializer.deserialize(schema, record_bytes, version)
+        if version != schema.version:
+            record_bytes = self.row_serializer.serialize(schema, row)
+        return row, record_bytes
+
+    def _read_slot(self, schema, page, slot_id, matches, conditions):
+        # return row kalau memenuhi kondisi, None kalau tidak. predicate byte hanya berlaku
+        # untuk layout versi sekarang; record versi lama dicek setelah decode + upgrade
+        record_bytes = page.get_record(slot_id)
+        version = page.get_version(slot_id)
+        if version == schema.version:
+            return self.row_serializer.deserialize(schema, record_bytes) if matches(record_bytes) else None
+        row = self.row_serializer.deserialize(schema, record_bytes, version)
+        return row if self._match_all(row, conditions) else None
+
+    def _bind_vector_filter(self, schema, conditions):
+        # None = pakai jalur row-at-a-time (numpy tidak ada / tidak ada kondisi int-float)
+        if not self.vectorized_scan:
+            return None
+        return bind_vector_filter(schema, conditions, self.row_serializer.with_lsn, self._match)
+
+    def _read_page_vectorized(self, schema, page, vector_filter, matches, conditions, columns):
+        # record versi schema sekarang difilter sekaligus; record versi lama lewat _read_slot
+        slot_ids = page.live_slots()
+        current = [slot_id for slot_id in slot_ids if page.get_version(slot_id) == schema.version]
+        if len(current) < VECTOR_MIN_ROWS:
+            rows = (self._read_slot(schema, page, slot_id, matches, conditions) for slot_id in slot_ids)
+            return [self._project(row, columns) for row in rows if row is not None]
+
+        records = [page.get_record(slot_id) for slot_id in current]
+        decoders = vector_filter.column_decoders(columns)
+        selected = {}
+        for i in vector_filter.filter(records):
+            if decoders is None:
+                selected[current[i]] = self.row_serializer.deserialize(schema, records[i])
+            else:
+                selected[current[i]] = {column: decode(records[i]) for column, decode in decoders}
+
+        results = []
+        for slot_id in slot_ids:
+            if slot_id in selected:
+                results.append(selected[slot_id])
+            elif page.get_version(slot_id) != schema.version:
+                row = self._read_slot(schema, page, slot_id, matches, conditions)
+                if row is not None:
+                    results.append(self._project(row, columns))
+        return results
+
+    def _bind_conditions(self, schema, conditions):
+        # return fungsi record_bytes -> bool; kondisi dicek pada byte record sebelum deserialize
+        return bind_conditions(schema, conditions, self.row_serializer.with_lsn, self._match)
+
     def _match_all(self, row, conditions):
         for cond in conditions:
             if not self._match(row, cond):
@@ -256,6 +1143,7 @@ class StorageManager:
         if op == ">=": return a >= b
         if op == "<": return a < b
         if op == "<=": return a <= b
+        if op == "LIKE": return like_match(a, b)
         return False
 
     def _project(self, row, columns):
@@ -267,21 +1155,42 @@ class StorageManager:
 
 
     def write_block(self, data_write):
+        # LSN WAL perubahan ini jadi page LSN untuk page yang diantrikan write-behind
+        new_value = data_write.new_value
+        self._dml_lsn.value = new_value.get('_lsn', 0) if isinstance(new_value, dict) else 0
+        try:
+            return self._write_block(data_write)
+        finally:
+            self._dml_lsn.value = 0
+            self._invalidate_row_cache(
+                data_write.table, data_write.conditions, data_write.new_value, data_write.column,
+                insert=data_write.column is None and not data_write.conditions,
+            )
+
+    def _write_block(self, data_write):
         table = data_write.table
         column = data_write.column
         conditions = data_write.conditions
         new_value = data_write.new_value
 
-        schema = self.schema_manager.get_table_schema(table)
+        schema = self._get_table_schema(table)
         if schema is None:
             raise ValueError(f"Tabel '{table}' tidak ditemukan")
 
+        scheme = self._get_partition_scheme(table)
+        if scheme is not None:
+            return self._write_partitions(table, schema, scheme, data_write)
+
         table_path = self._get_table_file_path(table)
         if not os.path.exists(table_path):
             raise FileNotFoundError(f"File data '{table_path}' tidak ditemukan")
 
         if column is None and not conditions:
-            return self._insert_record(table_path, schema, new_value)
+            with self.latches.table_writer(table_path):
+                # validasi zone map sebelum menulis, supaya stamp ulang tidak menutupi perubahan dari luar.
+                # di bawah mutex writer, jadi tulisan writer lain tidak terbaca sebagai perubahan luar
+                self.zone_map_manager.get_zone_map(table_path)
+                return self._insert_record(table, table_path, schema, new_value)
         else:
             schema_attrs = [attr["name"] for attr in schema.get_attributes()] 
             if column != "*" and column is not None:
@@ -295,65 +1204,105 @@ class StorageManager:
                 for cond in conditions:
                     if cond.column not in schema_attrs:
                         raise ValueError(f"Kolom '{cond.column}' tidak ada di tabel '{table}'")   
-            return self._update_record(table_path, schema, conditions, column, new_value)
+            with self.latches.table_writer(table_path):
+                self.zone_map_manager.get_zone_map(table_path)
+                return self._update_record(table, table_path, schema, conditions, column, new_value)
+
+    def _write_partitions(self, table, schema, scheme, data_write):
+        column = data_write.column
+        conditions = data_write.conditions
+        new_value = data_write.new_value
+
+        if column is None and not conditions:
+            # insert diarahkan ke satu partisi menurut nilai kolom partisi
+            key = self._coerce_operand(schema, scheme.column, new_value.get(scheme.column))
+            target = partition_name(table, scheme.route(key))
+            return self.write_block(DataWrite(table=target, column=None, conditions=[], new_value=new_value))
+
+        schema_attrs = [attr["name"] for attr in schema.get_attributes()]
+        columns = [column] if isinstance(column, str) else column
+        for col in columns or []:
+            if col != "*" and col not in schema_attrs:
+                raise ValueError(f"Kolom '{col}' tidak ada di tabel '{table}'")
+        for cond in conditions:
+            if cond.column not in schema_attrs:
+                raise ValueError(f"Kolom '{cond.column}' tidak ada di tabel '{table}'")
+
+        if not isinstance(new_value, dict):
+            if isinstance(columns, list) and len(columns) == 1:
+                new_value = {columns[0]: new_value}
+            else:
+                raise ValueError("new_value must be a dictionary")
+
+        if columns is None or columns == ["*"]:
+            columns = [col for col in new_value if col != '_lsn']
 
-    def _insert_record(self, table_path, schema, new_record):
+        if scheme.column not in columns:
+            return sum(
+                self.write_block(DataWrite(table=partition, column=columns, conditions=conditions, new_value=new_value))
+                for partition in self.get_partitions(table, conditions)
+            )
+
+        # kolom partisi ikut berubah: row bisa pindah partisi, jadi hapus lalu insert ulang lewat routing
+        rows = self.read_block(DataRetrieval(table=table, column="*", conditions=conditions))
+        self.delete_block(DataDeletion(table=table, conditions=conditions))
+        for row in rows:
+            for col in columns:
+                row[col] = new_value[col]
+            if '_lsn' in new_value:
+                row['_lsn'] = new_value['_lsn']
+            self.write_block(DataWrite(table=table, column=None, conditions=[], new_value=row))
+        return len(rows)
+
+    def _insert_record(self, table_name, table_path, schema, new_record):
         sanitized_record = {k: v for k, v in new_record.items() if k != '_lsn'}
         if '_lsn' in new_record and hasattr(self, 'frm_instance') and self.frm_instance:
             sanitized_record['_lsn'] = new_record['_lsn']
+        # kolom yang tidak disebut INSERT (mis. hasil ADD COLUMN) diisi default kolomnya
+        for attr in schema.get_attributes():
+            if attr['name'] not in sanitized_record:
+                sanitized_record[attr['name']] = schema.default_value(attr)
 
         record_bytes = self.row_serializer.serialize(schema, sanitized_record)
-        table_name = os.path.basename(table_path)[:-4]
 
-        with open(table_path, "rb+") as f:
-            f.seek(0, os.SEEK_END)
-            file_size = f.tell()
-
-            if file_size == 0:
-                page = SlottedPage()
-                page_id = 0
-                slot_id= page.add_record(record_bytes)
-                f.seek(0)
-                f.write(page.serialize())
-            else:
-                page_id = (file_size // PAGE_SIZE) - 1
-                f.seek(page_id * PAGE_SIZE)
-                page_bytes = f.read(PAGE_SIZE)
+        tree = self._get_lsm_tree(table_name)
+        if tree is not None:
+            stored_record = self.row_serializer.deserialize(schema, record_bytes)
+            tree.put(stored_record[schema.get_attributes()[0]['name']], record_bytes)
+            return 1
 
-                page = SlottedPage()
-                page.load(page_bytes)
+        blooms = self.bloom_filter_manager.get_filters(table_path)
+        key_column = self._get_table_options(table_name).get('clustered_by')
+        if key_column is not None:
+            self._get_or_build_zone_map(table_path, schema)
 
-            try:
-                slot_id = page.add_record(record_bytes)
-                f.seek(page_id * PAGE_SIZE)
-                f.write(page.serialize())
-            except Exception:
-                f.seek(0, os.SEEK_END)
-                page = SlottedPage()
-                page_id = file_size // PAGE_SIZE
-                slot_id = page.add_record(record_bytes)
-                f.write(page.serialize())
-        
-        hash_indexes = self.hash_index_manager.list_indexes(table_name)
-        for idx in hash_indexes:
-            column_name = idx['column']
-            key_value = new_record.get(column_name)
-            self.hash_index_manager.insert_entry(table_name, column_name, key_value, page_id, slot_id)
-            self.hash_index_manager.save_index(table_name, column_name)
+        with self._open_table(table_path, "rb+") as f:
+            if key_column is not None:
+                page_id, slot_id = self._place_clustered_record(
+                    f, table_name, table_path, schema, record_bytes, key_column, blooms
+                )
+            else:
+                page_id, slot_id = self._place_record(f, record_bytes, version=schema.version)
+
+        stored_record = self.row_serializer.deserialize(schema, record_bytes)
+        self._record_index_change(table_path, (page_id, slot_id), stored_record)
+        self.zone_map_manager.extend(table_path, page_id, stored_record)
+        self.zone_map_manager.touch(table_path)
+        self.bloom_filter_manager.add_value(blooms, page_id, stored_record)
+        self.bloom_filter_manager.touch(table_path, blooms)
         
-        btree_indexes = self.bplus_tree_index_manager.list_indexes(table_name)
-        for idx in btree_indexes:
-            column_name = idx['column']
-            key_value = new_record.get(column_name)
-            self.bplus_tree_index_manager.insert_entry(table_name, column_name, key_value, page_id, slot_id)
-            self.bplus_tree_index_manager.save_index(table_name, column_name)
+        for manager, index_columns in self._indexed_columns(table_name):
+            for column_name in index_columns:
+                key_value = stored_record.get(column_name)
+                with self.latches.index(table_path).exclusive():
+                    manager.insert_entry(table_name, column_name, key_value, page_id, slot_id)
+                self._save_index(manager, table_name, column_name, table_path)
         
         
         return 1
 
-    def _update_record(self, table_path, schema, conditions, column, new_value):
+    def _update_record(self, table_name, table_path, schema, conditions, column, new_value):
         rows_affected = 0
-        table_name = os.path.basename(table_path)[:-4]
 
         if not isinstance(new_value, dict):
             if isinstance(column, list) and len(column) == 1:
@@ -372,86 +1321,114 @@ class StorageManager:
         if frm_lsn is not None:
             sanitized_new_value['_lsn'] = frm_lsn
         new_value = sanitized_new_value
-        
-        with open(table_path, "rb+") as f:
-            page_id = 0
+        blooms = self.bloom_filter_manager.get_filters(table_path)
 
-            while True:
-                page_start = page_id * PAGE_SIZE
-                f.seek(page_start)
-                page_bytes = f.read(PAGE_SIZE)
-                if not page_bytes:
-                    break
-                
-                if len(page_bytes) < PAGE_SIZE:
-                    page_bytes = page_bytes.ljust(PAGE_SIZE, b"\x00")
-                
-                page = SlottedPage()
-                page.load(page_bytes)
-                
+        if isinstance(column, str) and column != "*":
+            column = [column]
+        elif column is None or column == "*":
+            column = [col for col in new_value if col != '_lsn']
+
+        tree = self._get_lsm_tree(table_name)
+        if tree is not None:
+            return self._update_lsm(tree, schema, conditions, column, new_value)
+
+        index_managers = self._indexed_columns(table_name, new_value)
+
+        # cari RID lewat index kalau ada, jadi hanya page yang relevan yang dibaca dan ditulis
+        locations, page_ids, _ = self._plan_access_path(table_name, table_path, schema, conditions)
+        relocated = set()
+        matches = self._bind_conditions(schema, conditions)
+        
+        with self._open_table(table_path, "rb+") as f:
+            for page_id, page, slot_ids in self._iter_target_pages(f, locations, page_ids):
                 page_modified = False 
 
-                for slot_id in range(page.record_count):
+                for slot_id in slot_ids:
+                    if (page_id, slot_id) in relocated:
+                        continue
                     try:  
-                        record_bytes = page.get_record(slot_id)
-                        record = self.row_serializer.deserialize(schema, record_bytes)
+                        record = self._read_slot(schema, page, slot_id, matches, conditions)
                     except:
                         continue  
-
-                    if self._match_all(record, conditions):
-                      
-                        hash_indexes = self.hash_index_manager.list_indexes(table_name)
-                        for idx in hash_indexes:
-                            column_name = idx['column']
-                            if column_name in new_value:
-                                old_key = record[column_name]
-                                new_key = new_value[column_name]
-                                self.hash_index_manager.update_entry(
-                                    table_name, column_name, old_key, new_key, page_id, slot_id
-                                )
-                        btree_indexes = self.bplus_tree_index_manager.list_indexes(table_name)
-                        for idx in btree_indexes:
-                            column_name = idx['column']
-                            if column_name in new_value:
-                                old_key = record[column_name]
-                                new_key = new_value[column_name]
-                                self.bplus_tree_index_manager.update_entry(
-                                    table_name, column_name, old_key, new_key, page_id, slot_id
+                    if record is None:
+                        continue
+
+                    old_record = dict(record)
+
+                    for col in column:
+                        record[col] = new_value[col]
+
+                    # FIX #2: Preserve _lsn explicitly if present in new_value
+                    if '_lsn' in new_value:
+                        record['_lsn'] = new_value['_lsn']
+
+                    # index selalu menunjuk RID asal, walaupun row sudah pindah page
+                    home_page_id, home_slot_id = page.get_home(slot_id) or (page_id, slot_id)
+
+                    # row versi schema lama ikut dinaikkan ke layout sekarang saat ditulis
+                    new_record_bytes = self.row_serializer.serialize(schema, record)
+                    target_page_id = page_id
+                    if not page.update_record(slot_id, new_record_bytes, version=schema.version):
+                        target_page_id, target_slot_id = self._relocate_record(
+                            f, page, page_id, slot_id, new_record_bytes, version=schema.version
+                        )
+                        relocated.add((target_page_id, target_slot_id))
+                    page_modified = True 
+                    rows_affected += 1
+
+                    stored_record = self.row_serializer.deserialize(schema, new_record_bytes)
+                    self._record_index_change(table_path, (home_page_id, home_slot_id), stored_record)
+                    self.zone_map_manager.extend(table_path, target_page_id, stored_record)
+                    self.bloom_filter_manager.add_value(blooms, target_page_id, stored_record)
+
+                    with self.latches.index(table_path).exclusive():
+                        for manager, index_columns in index_managers:
+                            for column_name in index_columns:
+                                manager.update_entry(
+                                    table_name, column_name, old_record[column_name], stored_record[column_name],
+                                    home_page_id, home_slot_id
                                 )
-
-                        for col in column:
-                            record[col] = new_value[col]
-
-                        # FIX #2: Preserve _lsn explicitly if present in new_value
-                        if '_lsn' in new_value:
-                            record['_lsn'] = new_value['_lsn']
-
-                        new_record_bytes = self.row_serializer.serialize(schema, record)
-                        page.update_record(slot_id, new_record_bytes)
-                        page_modified = True 
-                        rows_affected += 1
                 
                 if page_modified:
-                    f.seek(page_start)
-                    f.write(page.serialize())
-                
-                page_id += 1
+                    self._write_page(f, page_id, page)
+
+        self.zone_map_manager.touch(table_path)
+        self.bloom_filter_manager.touch(table_path, blooms)
        
-        hash_indexes = self.hash_index_manager.list_indexes(table_name)
-        for idx in hash_indexes:
-            self.hash_index_manager.save_index(table_name, idx['column'])
-        
-        btree_indexes = self.bplus_tree_index_manager.list_indexes(table_name)
-        for idx in btree_indexes:
-            self.bplus_tree_index_manager.save_index(table_name, idx['column'])
+        for manager, index_columns in index_managers:
+            for column_name in index_columns:
+                self._save_index(manager, table_name, column_name, table_path)
         
         return rows_affected
 
+    def _update_lsm(self, tree, schema, conditions, column, new_value):
+        key_column = schema.get_attributes()[0]['name']
+        rows = self._read_lsm(tree, schema, conditions)
+        for record in rows:
+            old_key = record[key_column]
+            for col in column:
+                record[col] = new_value[col]
+            if '_lsn' in new_value:
+                record['_lsn'] = new_value['_lsn']
+
+            record_bytes = self.row_serializer.serialize(schema, record)
+            new_key = self.row_serializer.deserialize(schema, record_bytes)[key_column]
+            if new_key != old_key:
+                tree.delete(old_key)
+            tree.put(new_key, record_bytes)
+        return len(rows)
+
     def delete_block(self, data_deletion):
+        try:
+            return self._delete_block(data_deletion)
+        finally:
+            self._invalidate_row_cache(data_deletion.table, data_deletion.conditions)
+
+    def _delete_block(self, data_deletion):
         table = data_deletion.table
         conditions = data_deletion.conditions
 
-        schema = self.schema_manager.get_table_schema(table)
+        schema = self._get_table_schema(table)
         if schema is None:
             raise ValueError(f"Tabel '{table}' tidak ditemukan")
 
@@ -460,59 +1437,861 @@ class StorageManager:
             if cond.column not in schema_attrs:
                 raise ValueError(f"Kolom '{cond.column}' tidak ada di tabel '{table}'")
 
-        table_path = os.path.join(self.base_path, f"{table}.dat")
+        if self._get_partition_scheme(table) is not None:
+            return sum(
+                self.delete_block(DataDeletion(table=partition, conditions=conditions))
+                for partition in self.get_partitions(table, conditions)
+            )
+
+        tree = self._get_lsm_tree(table)
+        if tree is not None:
+            key_column = schema.get_attributes()[0]['name']
+            rows = self._read_lsm(tree, schema, conditions)
+            for row in rows:
+                tree.delete(row[key_column])
+            return len(rows)
+
+        table_path = self._get_table_file_path(table)
         if not os.path.exists(table_path):
             raise FileNotFoundError(f"File data '{table_path}' tidak ditemukan")
 
-        rows_deleted = 0
-        pages = []
+        with self.latches.table_writer(table_path):
+            return self._delete_heap(table, table_path, schema, conditions)
 
-        with open(table_path, "rb+") as f:
-            while page_bytes := f.read(PAGE_SIZE):
-                page = SlottedPage()
-                page.load(page_bytes)
+    def _delete_heap(self, table, table_path, schema, conditions):
+        self.zone_map_manager.get_zone_map(table_path)
+        blooms = self.bloom_filter_manager.get_filters(table_path)
 
-                i = 0
-                while i < page.record_count:
-                    record_bytes = page.get_record(i)
-                    record = self.row_serializer.deserialize(schema, record_bytes)
+        index_managers = self._indexed_columns(table)
 
-                    if self._match_all(record, conditions):
-                        page.delete_record(i)
-                        rows_deleted += 1
-                        continue     
-                    else:
-                        i += 1
+        locations, page_ids, _ = self._plan_access_path(table, table_path, schema, conditions)
+        rows_deleted = 0
+        matches = self._bind_conditions(schema, conditions)
+
+        with self._open_table(table_path, "rb+") as f:
+            for page_id, page, slot_ids in self._iter_target_pages(f, locations, page_ids):
+                page_modified = False
+
+                for slot_id in slot_ids:
+                    record = self._read_slot(schema, page, slot_id, matches, conditions)
+                    if record is None:
+                        continue
+
+                    # slot lain tidak bergeser, cukup hapus entry index milik RID asal row ini
+                    home = page.get_home(slot_id)
+                    home_page_id, home_slot_id = home or (page_id, slot_id)
+                    page.delete_record(slot_id)
+                    if home is not None:
+                        self._update_home_slot(f, page, page_id, home)
+                    self._record_index_change(table_path, (home_page_id, home_slot_id))
+
+                    with self.latches.index(table_path).exclusive():
+                        for manager, index_columns in index_managers:
+                            for column_name in index_columns:
+                                manager.delete_entry(
+                                    table, column_name, record.get(column_name), home_page_id, home_slot_id
+                                )
 
-                pages.append(page)
+                    page_modified = True
+                    rows_deleted += 1
 
-            f.seek(0)
-            for page in pages:
-                f.write(page.serialize())
+                if page_modified:
+                    self._write_page(f, page_id, page)
+
+        # batas zone map tetap valid setelah delete (hanya jadi lebih longgar)
+        self.zone_map_manager.touch(table_path)
+        self.bloom_filter_manager.touch(table_path, blooms)
 
-            f.truncate(len(pages) * PAGE_SIZE)
+        if rows_deleted:
+            for manager, index_columns in index_managers:
+                for column_name in index_columns:
+                    self._save_index(manager, table, column_name, table_path)
 
         return rows_deleted
 
 
     def _set_index(self, table, column, index_type):
-        schema = self.schema_manager.get_table_schema(table)
+        schema = self._get_table_schema(table)
         if schema is None:
             raise ValueError(f"Tabel '{table}' tidak ditemukan")
         
         schema_attrs = [attr["name"] for attr in schema.get_attributes()]
         if column not in schema_attrs:
             raise ValueError(f"Kolom '{column}' tidak ada di tabel '{table}'")
+
+        if index_type.lower() != 'lsm' and self._get_lsm_tree(table) is not None:
+            raise ValueError(f"Index type '{index_type}' tidak didukung untuk tabel LSM '{table}'.")
+
+        # tabel berpartisi: setiap partisi punya index sendiri
+        partitions = self.get_partitions(table)
+        if partitions != [table]:
+            return all([self._set_index(partition, column, index_type) for partition in partitions])
     
+        # rebuild mengosongkan index dulu, jadi tabel ditahan exclusive sampai index lengkap
+        table_latch = self.latches.table(self._get_table_file_path(table))
         if index_type.lower() == 'hash':
-            self.hash_index_manager.rebuild_index(table, column, self)
+            with table_latch.exclusive():
+                self.hash_index_manager.rebuild_index(table, column, self)
             return True
         elif index_type.lower() == 'btree':
-            self.bplus_tree_index_manager.rebuild_index(table, column, self)
+            with table_latch.exclusive():
+                self.bplus_tree_index_manager.rebuild_index(table, column, self)
             return True
+        elif index_type.lower() == 'trigram':
+            if not self._is_string_column(schema, column):
+                raise ValueError(f"Index trigram hanya untuk kolom char/varchar, '{column}' bukan string")
+            with table_latch.exclusive():
+                self.trigram_index_manager.rebuild_index(table, column, self)
+            return True
+        elif index_type.lower() == 'bloom':
+            self.create_bloom_filter(table, column)
+            return True
+        elif index_type.lower() == 'clustered':
+            return self.cluster_table(table, column)
+        elif index_type.lower() == 'lsm':
+            return self.set_table_engine(table, 'lsm')
         else:
             raise ValueError(f"Index type '{index_type}' tidak tersedia.")        
 
+    def create_index(self, name, table, column, index_type='btree', concurrently=False):
+        # CREATE INDEX [CONCURRENTLY]: index bernama dicatat di opsi tabel 'indexes' {nama: {column, type, valid}}.
+        # tanpa CONCURRENTLY tabel ditahan exclusive sampai index selesai; dengan CONCURRENTLY
+        # scan berjalan di thread background dan index baru valid setelah side log diputar.
+        index_type = index_type.lower()
+        schema = self._get_table_schema(table)
+        if schema is None:
+            raise ValueError(f"Tabel '{table}' tidak ditemukan")
+        if column not in [attr["name"] for attr in schema.get_attributes()]:
+            raise ValueError(f"Kolom '{column}' tidak ada di tabel '{table}'")
+        if index_type not in INDEX_BUILD_TYPES:
+            raise ValueError(f"Index type '{index_type}' tidak didukung CREATE INDEX.")
+        if index_type == 'trigram' and not self._is_string_column(schema, column):
+            raise ValueError(f"Index trigram hanya untuk kolom char/varchar, '{column}' bukan string")
+        if self._get_lsm_tree(table) is not None:
+            raise ValueError(f"Index type '{index_type}' tidak didukung untuk tabel LSM '{table}'.")
+
+        manager = self._index_manager_for(index_type)
+        units = self.get_partitions(table)
+        with self._index_catalog_lock:
+            if self._find_named_index(name) is not None:
+                raise ValueError(f"Index '{name}' sudah ada")
+            if manager.load_index(units[0], column) is not None:
+                raise ValueError(f"Kolom '{column}' tabel '{table}' sudah punya index {index_type}")
+            self._set_named_index(table, name, {'column': column, 'type': index_type, 'valid': False})
+
+        if not concurrently:
+            try:
+                self._set_index(table, column, index_type)
+            except Exception:
+                self._set_named_index(table, name, None)
+                raise
+            self._set_named_index(table, name, {'column': column, 'type': index_type, 'valid': True})
+            return True
+
+        builds = [IndexBuild(name, unit, column, index_type, self._get_table_file_path(unit)) for unit in units]
+        thread = threading.Thread(
+            target=self._run_index_builds, args=(name, table, builds), name=f"index-build-{name}", daemon=True
+        )
+        self._index_build_threads[name] = (thread, builds)
+        thread.start()
+        return True
+
+    def drop_index(self, name, if_exists=False):
+        found = self._find_named_index(name)
+        if found is None:
+            if if_exists:
+                return False
+            raise ValueError(f"Index '{name}' tidak ditemukan")
+        table, info = found
+
+        running = self._index_build_threads.pop(name, None)
+        if running is not None:
+            thread, builds = running
+            for build in builds:
+                build.abort(f"index '{name}' di-drop")
+            thread.join()
+        self._index_build_errors.pop(name, None)
+
+        manager = self._index_manager_for(info['type'])
+        for unit in self.get_partitions(table):
+            table_path = self._get_table_file_path(unit)
+            with self.latches.table_writer(table_path), self.latches.index(table_path).exclusive():
+                manager.drop_index(unit, info['column'])
+        self._set_named_index(table, name, None)
+        return True
+
+    def wait_for_index(self, name, timeout=None):
+        # tunggu build CONCURRENTLY selesai; return True kalau index sudah valid
+        running = self._index_build_threads.get(name)
+        if running is not None:
+            running[0].join(timeout)
+        error = self._index_build_errors.get(name)
+        if error is not None:
+            raise ValueError(f"Build index '{name}' gagal: {error}")
+        found = self._find_named_index(name)
+        return found is not None and found[1]['valid']
+
+    def list_named_indexes(self, table=None):
+        # return dict nama -> {table, column, type, valid}
+        tables = [table] if table is not None else self.schema_manager.list_tables()
+        return {
+            name: dict(info, table=table_name)
+            for table_name in tables
+            for name, info in self.schema_manager.get_table_options(table_name).get('indexes', {}).items()
+        }
+
+    def _find_named_index(self, name):
+        for table_name in self.schema_manager.list_tables():
+            info = self.schema_manager.get_table_options(table_name).get('indexes', {}).get(name)
+            if info is not None:
+                return table_name, info
+        return None
+
+    def _set_named_index(self, table, name, info):
+        # info None = hapus dari katalog
+        with self._index_catalog_lock:
+            indexes = dict(self.schema_manager.get_table_options(table).get('indexes', {}))
+            if info is None:
+                indexes.pop(name, None)
+            else:
+                indexes[name] = info
+            self.schema_manager.set_table_option(table, 'indexes', indexes or None)
+
+    def _index_manager_for(self, index_type):
+        return {type_name: manager for manager, type_name in self._index_io_managers()}[index_type]
+
+    def _run_index_builds(self, name, table, builds):
+        scratch_path = os.path.join(self.base_path, '_index_build', name)
+        try:
+            for build in builds:
+                self._build_index_concurrently(build, scratch_path)
+        except Exception as e:
+            self._index_build_errors[name] = e
+            return
+        finally:
+            shutil.rmtree(scratch_path, ignore_errors=True)
+
+        with self._index_catalog_lock:
+            found = self._find_named_index(name)
+            if found is not None:
+                self._set_named_index(table, name, dict(found[1], valid=True))
+
+    def _build_index_concurrently(self, build, scratch_path):
+        table_path = build.table_path
+        build_key = os.path.abspath(table_path)
+        # didaftarkan di bawah mutex writer: tidak ada DML yang sedang setengah jalan
+        with self.latches.table_writer(table_path):
+            self._index_builds.setdefault(build_key, []).append(build)
+        try:
+            self._scan_for_index_build(build)
+            self._apply_build_log(build, build.drain())
+
+            # index dibangun di manager terpisah supaya belum terlihat reader/writer
+            manager = self._index_manager_for(build.index_type)
+            scratch = type(manager)(scratch_path)
+            scratch.create_index(build.table, build.column)
+            for rid, key in build.entries.items():
+                scratch.insert_entry(build.table, build.column, key, *rid)
+            while build.pending() > INDEX_BUILD_BATCH:
+                self._apply_build_log(build, build.drain(), scratch)
+
+            # sisa log diputar di bawah mutex writer, lalu index dipasang
+            with self.latches.table_writer(table_path):
+                if build.aborted:
+                    raise RuntimeError(build.aborted)
+                self._apply_build_log(build, build.drain(), scratch)
+                cache_key = (build.table, build.column)
+                with self.latches.index(table_path).exclusive():
+                    manager.loaded_indexes[cache_key] = scratch.loaded_indexes[cache_key]
+                    manager.save_index(build.table, build.column)
+        finally:
+            with self.latches.table_writer(table_path):
+                self._index_builds[build_key].remove(build)
+
+    def _scan_for_index_build(self, build):
+        # latch tabel shared hanya per batch page, jadi vacuum/cluster tidak tertahan seluruh scan
+        schema = self._get_table_schema(build.table)
+        table_latch = self.latches.table(build.table_path)
+        first_page_id = 0
+        done = False
+        while not done:
+            with table_latch.shared():
+                if build.aborted:
+                    raise RuntimeError(build.aborted)
+                if not os.path.exists(build.table_path):
+                    raise RuntimeError(f"File data '{build.table_path}' tidak ditemukan")
+                with self._open_table(build.table_path, "rb") as f:
+                    page_ids = range(first_page_id, first_page_id + INDEX_BUILD_BATCH)
+                    for page_id, page, slot_ids in self._iter_target_pages(f, page_ids=page_ids):
+                        for slot_id in slot_ids:
+                            row = self._decode_slot(schema, page, slot_id)
+                            build.entries[page.get_home(slot_id) or (page_id, slot_id)] = row.get(build.column)
+                    done = page_ids.stop * PAGE_SIZE >= self._table_size(build.table_path)
+            first_page_id += INDEX_BUILD_BATCH
+
+    def _apply_build_log(self, build, ops, index=None):
+        for rid, deleted, key in ops:
+            if rid in build.entries:
+                old_key = build.entries.pop(rid)
+                if index is not None:
+                    index.delete_entry(build.table, build.column, old_key, *rid)
+            if not deleted:
+                build.entries[rid] = key
+                if index is not None:
+                    index.insert_entry(build.table, build.column, key, *rid)
+
+    def _record_index_change(self, table_path, rid, row=None):
+        # dipanggil writer setiap isi index berubah; row None = RID dihapus
+        for build in self._index_builds.get(os.path.abspath(table_path), ()):
+            build.record(rid, row)
+
+    def _abort_index_builds(self, table_path, reason):
+        # file ditulis ulang (RID berubah semua): build yang sedang jalan dibatalkan
+        for build in self._index_builds.get(os.path.abspath(table_path), ()):
+            build.abort(reason)
+
+    def cluster_table(self, table, column):
+        # opt-in: susun ulang tabel terurut menurut `column`, insert berikutnya menjaga urutan per page
+        schema = self._get_table_schema(table)
+        if schema is None:
+            raise ValueError(f"Tabel '{table}' tidak ditemukan")
+
+        schema_attrs = [attr["name"] for attr in schema.get_attributes()]
+        if column not in schema_attrs:
+            raise ValueError(f"Kolom '{column}' tidak ada di tabel '{table}'")
+
+        partitions = self.get_partitions(table)
+        if partitions != [table]:
+            return all([self.cluster_table(partition, column) for partition in partitions])
+
+        table_path = self._get_table_file_path(table)
+        if not os.path.exists(table_path):
+            raise FileNotFoundError(f"File data '{table_path}' tidak ditemukan")
+
+        with self.latches.table(table_path).exclusive():
+            return self._cluster_heap(table, table_path, schema, column)
+
+    def _cluster_heap(self, table, table_path, schema, column):
+        self._abort_index_builds(table_path, f"tabel '{table}' di-cluster ulang")
+        records = []
+        with self._open_table(table_path, "rb") as f:
+            for _, page, slot_ids in self._iter_target_pages(f):
+                for slot_id in slot_ids:
+                    row, record_bytes = self._current_record(schema, page, slot_id)
+                    records.append((row[column], record_bytes, row))
+        records.sort(key=lambda record: record[0])
+
+        pages = [SlottedPage()]
+        page_rows = [[]]
+        for _, record_bytes, row in records:
+            try:
+                pages[-1].add_record(record_bytes, version=schema.version)
+            except Exception:
+                pages.append(SlottedPage())
+                page_rows.append([])
+                pages[-1].add_record(record_bytes, version=schema.version)
+            page_rows[-1].append(row)
+
+        self._write_pages(table_path, pages)
+
+        self.schema_manager.set_table_option(self._logical_table(table), 'clustered_by', column)
+
+        # semua RID berubah: zone map, index, dan bloom filter dibangun ulang
+        self.zone_map_manager.drop_zone_map(table_path)
+        self.zone_map_manager.install(table_path, {
+            page_id: self.zone_map_manager.compute_page_bounds(rows) for page_id, rows in enumerate(page_rows)
+        })
+        for manager, index_columns in self._indexed_columns(table):
+            for column_name in index_columns:
+                manager.rebuild_index(table, column_name, self)
+        self.rebuild_bloom_filters(table)
+        return True
+
+    def set_table_engine(self, table, engine):
+        # 'lsm': write-optimized (memtable + sorted run), 'heap': slotted page biasa.
+        # row yang sudah ada dipindah ke format baru.
+        schema = self._get_table_schema(table)
+        if schema is None:
+            raise ValueError(f"Tabel '{table}' tidak ditemukan")
+        if engine not in ('heap', 'lsm'):
+            raise ValueError(f"Storage engine '{engine}' tidak tersedia.")
+        if self._get_partition_scheme(table) is not None:
+            raise ValueError(f"Tabel berpartisi '{table}' tidak bisa memakai engine '{engine}'")
+
+        if self._get_table_options(table).get('engine', 'heap') == engine:
+            return True
+
+        table_path = self._get_table_file_path(table)
+        with self.latches.table(table_path).exclusive():
+            return self._convert_engine(table, table_path, schema, engine)
+
+    def _convert_engine(self, table, table_path, schema, engine):
+        self._abort_index_builds(table_path, f"engine tabel '{table}' diganti")
+        key_column = schema.get_attributes()[0]['name']
+
+        if engine == 'lsm':
+            if any(index_columns for _, index_columns in self._indexed_columns(table)):
+                raise ValueError(f"Drop index tabel '{table}' dulu sebelum memakai engine LSM")
+
+            tree = self.lsm_manager.get_tree(table_path)
+            if os.path.exists(table_path):
+                with self._open_table(table_path, "rb") as f:
+                    for _, page, slot_ids in self._iter_target_pages(f):
+                        for slot_id in slot_ids:
+                            row, record_bytes = self._current_record(schema, page, slot_id)
+                            tree.put(row[key_column], record_bytes)
+            tree.flush()
+
+            # file .dat tetap ada (kosong) supaya DROP TABLE dan pengecekan keberadaan tabel tetap jalan
+            self._write_pages(table_path, [SlottedPage()])
+            self.zone_map_manager.drop_zone_map(table_path)
+            self.bloom_filter_manager.drop_filters(table_path)
+            self.schema_manager.set_table_option(table, 'engine', 'lsm')
+            return True
+
+        tree = self.lsm_manager.get_tree(table_path)
+        pages = [SlottedPage()]
+        for _, record_bytes in tree.scan():
+            try:
+                pages[-1].add_record(record_bytes, version=schema.version)
+            except Exception:
+                pages.append(SlottedPage())
+                pages[-1].add_record(record_bytes, version=schema.version)
+
+        self._write_pages(table_path, pages)
+        self.lsm_manager.drop_tree(table_path)
+        self.schema_manager.set_table_option(table, 'engine', None)
+        return True
+
+    def create_partitions(self, table, method, column, partitions=None, bounds=None):
+        # ubah tabel jadi berpartisi (hash: jumlah partisi, range: daftar batas);
+        # row yang sudah ada disebar ke file {table}__p{i}.dat
+        schema = self._get_table_schema(table)
+        if schema is None:
+            raise ValueError(f"Tabel '{table}' tidak ditemukan")
+
+        schema_attrs = [attr["name"] for attr in schema.get_attributes()]
+        if column not in schema_attrs:
+            raise ValueError(f"Kolom '{column}' tidak ada di tabel '{table}'")
+
+        if self._get_partition_scheme(table) is not None:
+            raise ValueError(f"Tabel '{table}' sudah berpartisi")
+
+        if bounds is not None:
+            bounds = [self._coerce_operand(schema, column, bound) for bound in bounds]
+        scheme = PartitionScheme(method, column, partitions, bounds)
+
+        table_path = self._get_table_file_path(table)
+        with self.latches.table(table_path).exclusive():
+            self._abort_index_builds(table_path, f"tabel '{table}' dipartisi")
+            partition_records = [[] for _ in range(scheme.num_partitions)]
+            if os.path.exists(table_path):
+                with self._open_table(table_path, "rb") as f:
+                    for _, page, slot_ids in self._iter_target_pages(f):
+                        for slot_id in slot_ids:
+                            row, record_bytes = self._current_record(schema, page, slot_id)
+                            partition_records[scheme.route(row[column])].append(record_bytes)
+
+            base_path = os.path.splitext(table_path)[0]
+            for partition_id, records in enumerate(partition_records):
+                pages = [SlottedPage()]
+                for record_bytes in records:
+                    try:
+                        pages[-1].add_record(record_bytes, version=schema.version)
+                    except Exception:
+                        pages.append(SlottedPage())
+                        pages[-1].add_record(record_bytes, version=schema.version)
+
+                self._write_pages(f"{base_path}__p{partition_id}.dat", pages)
+
+            # struktur akses milik tabel lama dipindah ke setiap partisi
+            indexes = [idx for manager in self._index_managers() for idx in manager.list_indexes(table)]
+            bloom_columns = self.bloom_filter_manager.list_filters(table_path)
+            for manager, index_columns in self._indexed_columns(table):
+                for column_name in index_columns:
+                    manager.drop_index(table, column_name)
+            self.bloom_filter_manager.drop_filters(table_path)
+            self.zone_map_manager.drop_zone_map(table_path)
+            if self.page_writer is not None:
+                self.page_writer.discard(table_path)
+            if os.path.exists(table_path):
+                os.remove(table_path)
+
+        self.schema_manager.set_table_option(table, 'partition_by', scheme.to_option())
+
+        for idx in indexes:
+            self._set_index(table, idx['column'], idx['type'])
+        for column_name in bloom_columns:
+            self.create_bloom_filter(table, column_name)
+        key_column = self._get_table_options(table).get('clustered_by')
+        if key_column is not None:
+            self.cluster_table(table, key_column)
+        return True
+
+    def drop_partitions(self, table):
+        # hapus semua file partisi beserta index, zone map, dan bloom filter-nya
+        scheme = self._get_partition_scheme(table)
+        if scheme is None:
+            return False
+
+        for partition in scheme.partition_names(table):
+            table_path = self._get_table_file_path(partition)
+            with self.latches.table(table_path).exclusive():
+                self._abort_index_builds(table_path, f"partisi '{partition}' dihapus")
+                for manager, index_columns in self._indexed_columns(partition):
+                    for column_name in index_columns:
+                        manager.drop_index(partition, column_name)
+                self.zone_map_manager.drop_zone_map(table_path)
+                self.bloom_filter_manager.drop_filters(table_path)
+                if self.page_writer is not None:
+                    self.page_writer.discard(table_path)
+                if os.path.exists(table_path):
+                    os.remove(table_path)
+
+        self.schema_manager.set_table_option(table, 'partition_by', None)
+        return True
+
+    def add_column(self, table, column, attr_type, size, default=None):
+        # ALTER TABLE ADD COLUMN: hanya katalog yang berubah. row lama tetap di layout versinya
+        # dan dibaca dengan nilai default; row baru ditulis ulang ke layout baru saat di-update
+        schema = self._get_schema_for_alter(table)
+        if any(attr['name'] == column for attr in schema.get_attributes()):
+            raise ValueError(f"Kolom '{column}' sudah ada di tabel '{table}'")
+        if attr_type not in ('int', 'float', 'char', 'varchar'):
+            raise ValueError(f"Tipe data '{attr_type}' tidak didukung")
+
+        new_attr = {'name': column, 'type': attr_type, 'size': 4 if attr_type in ('int', 'float') else size}
+        new_schema = Schema([dict(attr) for attr in schema.get_attributes()] + [new_attr])
+        defaults = {}
+        if default is not None:
+            # simpan default dalam bentuk yang sama dengan hasil decode (dibulatkan / dipotong)
+            column_schema = Schema([dict(new_attr)])
+            encoder = RowSerializer(with_lsn=False)
+            defaults[column] = encoder.deserialize(column_schema, encoder.serialize(column_schema, {column: default}))[column]
+
+        self.schema_manager.alter_table_schema(table, new_schema, defaults)
+        self._after_alter(table)
+
+        # batas min/max page belum mencakup default kolom baru, zone map dibangun ulang saat scan berikutnya
+        for partition in self.get_partitions(table):
+            self.zone_map_manager.drop_zone_map(self._get_table_file_path(partition))
+        return True
+
+    def drop_column(self, table, column):
+        # ALTER TABLE DROP COLUMN: byte kolom di row lama baru dibuang saat row itu ditulis ulang
+        schema = self._get_schema_for_alter(table)
+        attributes = schema.get_attributes()
+        if column not in [attr['name'] for attr in attributes]:
+            raise ValueError(f"Kolom '{column}' tidak ada di tabel '{table}'")
+        if attributes[0]['name'] == column:
+            raise ValueError(f"Kolom '{column}' adalah primary key tabel '{table}'")
+        options = self._get_table_options(table)
+        scheme = self._get_partition_scheme(table)
+        if options.get('clustered_by') == column or (scheme is not None and scheme.column == column):
+            raise ValueError(f"Kolom '{column}' dipakai sebagai key clustered/partisi tabel '{table}'")
+
+        for name, info in self.list_named_indexes(table).items():
+            if info['column'] == column:
+                self.drop_index(name)
+        for partition in self.get_partitions(table):
+            for manager, index_columns in self._indexed_columns(partition, [column]):
+                for column_name in index_columns:
+                    manager.drop_index(partition, column_name)
+        self.drop_bloom_filter(table, column)
+
+        new_schema = Schema([dict(attr) for attr in attributes if attr['name'] != column])
+        self.schema_manager.alter_table_schema(table, new_schema)
+        self._after_alter(table)
+        return True
+
+    def _get_schema_for_alter(self, table):
+        schema = self.schema_manager.get_table_schema(table)
+        if schema is None:
+            raise ValueError(f"Tabel '{table}' tidak ditemukan")
+        return schema
+
+    def _after_alter(self, table):
+        self.row_cache.invalidate(table)
+
+        # LSM tidak punya slot untuk versi schema: isi tree ditulis ulang dengan layout baru
+        tree = self._get_lsm_tree(table)
+        if tree is None:
+            return
+        schema = self._get_table_schema(table)
+        key_column = schema.get_attributes()[0]['name']
+        for _, record_bytes in list(tree.scan()):
+            row = self.row_serializer.deserialize(schema, record_bytes, schema.version - 1)
+            tree.put(row[key_column], self.row_serializer.serialize(schema, row))
+        tree.flush()
+
+    def vacuum_table(self, table, full=False, batch_size=VACUUM_BATCH_SIZE):
+        # jalankan semua batch vacuum lalu kembalikan ringkasan + statistik terbaru
+        units = self.get_partitions(table)
+        pages_before = self._count_pages(units)
+        rows_moved = 0
+        batches = 0
+        for progress in self.iter_vacuum(table, full, batch_size):
+            rows_moved += progress['rows_moved']
+            batches += 1
+
+        return {
+            'table': table,
+            'full': full,
+            'batches': batches,
+            'rows_moved': rows_moved,
+            'pages_before': pages_before,
+            'pages_after': self._count_pages(units),
+            'stats': self._get_table_stats(table),
+        }
+
+    def _count_pages(self, units):
+        total = 0
+        for unit in units:
+            table_path = self._get_table_file_path(unit)
+            if os.path.exists(table_path):
+                total += self._table_size(table_path) // PAGE_SIZE
+        return total
+
+    def iter_vacuum(self, table, full=False, batch_size=VACUUM_BATCH_SIZE):
+        """
+        VACUUM     : compact page yang terfragmentasi dan potong page kosong di ujung file.
+                     RID tidak berubah, jadi index tidak disentuh.
+        VACUUM FULL: pindahkan row dari page terakhir ke ruang kosong di page awal,
+                     remap RID di semua index hash/B+ tree, lalu potong file.
+
+        Generator: setiap batch membuka dan menutup file sendiri (index dan zone map
+        sudah konsisten di akhir batch), jadi tabel tidak tertahan lebih lama dari satu batch.
+        Tabel berpartisi di-vacuum per partisi. Tabel clustered tidak dipindah row-nya
+        pada FULL supaya urutan key antar page tetap terjaga.
+        """
+        schema = self._get_table_schema(table)
+        if schema is None:
+            raise ValueError(f"Tabel '{table}' tidak ditemukan")
+        if batch_size < 1:
+            raise ValueError("Ukuran batch vacuum minimal 1")
+
+        tree = self._get_lsm_tree(table)
+        if tree is not None:
+            # tabel LSM: vacuum = flush memtable lalu merge semua sorted run
+            tree.flush()
+            tree.wait_for_compaction()
+            tree.compact()
+            yield {'table': table, 'phase': 'compact', 'rows_moved': 0}
+            return
+
+        clustered = self._get_table_options(table).get('clustered_by') is not None
+
+        for unit in self.get_partitions(table):
+            table_path = self._get_table_file_path(unit)
+            if not os.path.exists(table_path):
+                continue
+
+            page_id = 0
+            while page_id is not None:
+                with self.latches.table(table_path).exclusive():
+                    page_id = self._vacuum_compact_batch(table_path, page_id, batch_size)
+                yield {'table': unit, 'phase': 'compact', 'rows_moved': 0}
+
+            if not full or clustered:
+                continue
+
+            while True:
+                with self.latches.table(table_path).exclusive():
+                    rows_moved = self._vacuum_move_batch(unit, table_path, schema, batch_size)
+                if not rows_moved:
+                    break
+                yield {'table': unit, 'phase': 'move', 'rows_moved': rows_moved}
+
+    def _vacuum_compact_batch(self, table_path, first_page_id, batch_size):
+        # return page_id awal batch berikutnya, atau None kalau sudah sampai ujung file
+        self.zone_map_manager.get_zone_map(table_path)
+        blooms = self.bloom_filter_manager.get_filters(table_path)
+
+        with self._open_table(table_path, "rb+") as f:
+            num_pages = self._file_size(f) // PAGE_SIZE
+            last_page_id = min(first_page_id + batch_size, num_pages)
+
+            for page_id in range(first_page_id, last_page_id):
+                page = self._read_page(f, page_id)
+                if page.reclaimable_space() > page.free_space():
+                    page.compact()
+                    self._write_page(f, page_id, page)
+
+            done = last_page_id >= num_pages
+            if done:
+                self._truncate_empty_tail(f, table_path)
+
+        # isi page tidak berubah, cukup stamp ulang
+        self.zone_map_manager.touch(table_path)
+        self.bloom_filter_manager.touch(table_path, blooms)
+        return None if done else last_page_id
+
+    def _truncate_empty_tail(self, f, table_path):
+        # page kosong di ujung file dibuang, minimal satu page disisakan.
+        # page yang masih antri ditulis dulu supaya tidak memperpanjang file lagi setelah truncate
+        self._flush_pages(table_path)
+        f.seek(0, os.SEEK_END)
+        num_pages = f.tell() // PAGE_SIZE
+        keep = num_pages
+        while keep > 1:
+            if self._read_page(f, keep - 1).record_count:
+                break
+            keep -= 1
+
+        if keep < num_pages:
+            f.truncate(keep * PAGE_SIZE)
+            self.zone_map_manager.forget_pages_from(table_path, keep)
+        return num_pages - keep
+
+    def _vacuum_move_batch(self, table_name, table_path, schema, batch_size):
+        # pindahkan maksimal batch_size row dari page terakhir; return jumlah RID yang di-remap
+        self.zone_map_manager.get_zone_map(table_path)
+        blooms = self.bloom_filter_manager.get_filters(table_path)
+        index_managers = self._indexed_columns(table_name)
+
+        moved = []  # (RID lama yang dipegang index, RID baru, row)
+
+        with self._open_table(table_path, "rb+") as f:
+            last_page_id = self._file_size(f) // PAGE_SIZE - 1
+            if last_page_id <= 0:
+                return 0
+
+            pages = {}
+            dirty = set()
+            free = {}
+
+            def load(page_id):
+                if page_id not in pages:
+                    pages[page_id] = self._read_page(f, page_id)
+                return pages[page_id]
+
+            last_page = load(last_page_id)
+            slot_id = 0
+            while slot_id < last_page.record_count and len(moved) < batch_size:
+                flags = last_page.slots[slot_id][2]
+                if flags & SLOT_FLAG_DELETED:
+                    slot_id += 1
+                    continue
+
+                forward = last_page.get_forward(slot_id)
+                if forward is not None:
+                    # slot asal di page terakhir: row tetap di tempatnya, index diarahkan langsung ke row
+                    target_page_id, target_slot_id = forward
+                    target_page = load(target_page_id)
+                    row = self._decode_slot(schema, target_page, target_slot_id)
+                    target_page.clear_home(target_slot_id)
+                    last_page.delete_record(slot_id)
+                    dirty.update((target_page_id, last_page_id))
+                    moved.append(((last_page_id, slot_id), (target_page_id, target_slot_id), row))
+                    slot_id += 1
+                    continue
+
+                # row yang dipindah sekalian dinaikkan ke versi schema sekarang
+                row, record_bytes = self._current_record(schema, last_page, slot_id)
+                dest_page_id = self._vacuum_destination(load, free, last_page_id, len(record_bytes))
+                if dest_page_id is None:
+                    break
+
+                dest_page = load(dest_page_id)
+                new_slot_id = dest_page.add_record(record_bytes, version=schema.version)
+                free[dest_page_id] = dest_page.reclaimable_space()
+
+                home = last_page.get_home(slot_id)
+                if home is not None:
+                    load(home[0]).delete_record(home[1])
+                    dirty.add(home[0])
+                last_page.delete_record(slot_id)
+                dirty.update((dest_page_id, last_page_id))
+                moved.append((home or (last_page_id, slot_id), (dest_page_id, new_slot_id), row))
+                slot_id += 1
+
+            for page_id in sorted(dirty):
+                self._write_page(f, page_id, pages[page_id])
+            self._truncate_empty_tail(f, table_path)
+
+        for old_rid, new_rid, row in moved:
+            self._record_index_change(table_path, old_rid)
+            self._record_index_change(table_path, new_rid, row)
+            for manager, index_columns in index_managers:
+                for column_name in index_columns:
+                    manager.delete_entry(table_name, column_name, row.get(column_name), *old_rid)
+                    manager.insert_entry(table_name, column_name, row.get(column_name), *new_rid)
+            self.zone_map_manager.extend(table_path, new_rid[0], row)
+            self.bloom_filter_manager.add_value(blooms, new_rid[0], row)
+
+        self.zone_map_manager.touch(table_path)
+        self.bloom_filter_manager.touch(table_path, blooms)
+
+        if moved:
+            for manager, index_columns in index_managers:
+                for column_name in index_columns:
+                    self._save_index(manager, table_name, column_name, table_path)
+        return len(moved)
+
+    def _vacuum_destination(self, load, free, last_page_id, record_length):
+        # first fit: page paling awal yang masih punya ruang (setelah compact) untuk record + slot baru
+        needed = record_length + SLOT_SIZE
+        for page_id in range(last_page_id):
+            if page_id not in free:
+                free[page_id] = load(page_id).reclaimable_space()
+            if free[page_id] >= needed:
+                return page_id
+        return None
+
+    def create_bloom_filter(self, table, column, false_positive_rate=None):
+        schema = self._get_table_schema(table)
+        if schema is None:
+            raise ValueError(f"Tabel '{table}' tidak ditemukan")
+
+        schema_attrs = [attr["name"] for attr in schema.get_attributes()]
+        if column not in schema_attrs:
+            raise ValueError(f"Kolom '{column}' tidak ada di tabel '{table}'")
+
+        partitions = self.get_partitions(table)
+        if partitions != [table]:
+            return all([self.create_bloom_filter(partition, column, false_positive_rate) for partition in partitions])
+
+        table_path = self._get_table_file_path(table)
+        if not os.path.exists(table_path):
+            raise FileNotFoundError(f"File data '{table_path}' tidak ditemukan")
+
+        # ukuran filter per page diambil dari blocking factor statistik tabel
+        stats = self._get_table_stats(table)
+        pages = {
+            page_id: [row.get(column) for row in rows]
+            for page_id, rows in self._scan_pages(table_path, schema)
+        }
+        self.bloom_filter_manager.build_filter(table_path, column, pages, stats.f_r, false_positive_rate)
+        return True
+
+    def rebuild_bloom_filters(self, table):
+        for partition in self.get_partitions(table):
+            table_path = self._get_table_file_path(partition)
+            for column in self.bloom_filter_manager.list_filters(table_path):
+                self.create_bloom_filter(partition, column)
+
+    def drop_bloom_filter(self, table, column):
+        for partition in self.get_partitions(table):
+            self.bloom_filter_manager.drop_filter(self._get_table_file_path(partition), column)
+        return True
+
+    def _get_bloom_filters(self, table, table_path, schema):
+        # filter yang stale (file tabel diubah di luar StorageManager) dibangun ulang dulu
+        stale = self.bloom_filter_manager.get_stale_filters(table_path)
+        if stale:
+            schema_attrs = [attr["name"] for attr in schema.get_attributes()]
+            for column in stale:
+                if column in schema_attrs:
+                    self.create_bloom_filter(table, column)
+                else:
+                    self.bloom_filter_manager.drop_filter(table_path, column)
+        return self.bloom_filter_manager.get_filters(table_path)
+
+    def _scan_pages(self, table_path, schema):
+        with self._open_table(table_path, "rb") as f:
+            for page_id, page, slot_ids in self._iter_target_pages(f):
+                yield page_id, [self._decode_slot(schema, page, slot_idx) for slot_idx in slot_ids]
+
     def _calculate_tree_depth(self, node):
         if node is None:
             return 0
@@ -526,12 +2305,85 @@ class StorageManager:
         
         return 1
     
+    def estimate_like_selectivity(self, table_name, column, pattern):
+        # fraksi row yang mungkin cocok dengan pola: range prefix di B+ tree index, atau
+        # kandidat dari index trigram. return None kalau tidak ada index yang bisa dipakai
+        # (optimizer pakai default).
+        schema = self._get_table_schema(table_name)
+        if schema is None or column not in [attr['name'] for attr in schema.get_attributes()]:
+            return None
+        if not self._is_string_column(schema, column):
+            return None
+        bounds = like_prefix_range(pattern)
+
+        matched = total = 0
+        for partition in self.get_partitions(table_name):
+            btree = self.bplus_tree_index_manager.load_index(partition, column)
+            trigram = self.trigram_index_manager.load_index(partition, column)
+            if btree is not None and bounds is not None:
+                total += btree['metadata']['num_entries']
+                matched += len(self.bplus_tree_index_manager.range_search(partition, column, *bounds))
+                continue
+            candidates = self.trigram_index_manager.search_pattern(partition, column, pattern) if trigram else None
+            if candidates is None:
+                return None
+            total += trigram['metadata']['num_entries']
+            matched += len(candidates)
+
+        if total == 0:
+            return None
+        return matched / total
+
     def get_stats(self, table_name=None):
         if table_name is None or table_name == '':
             return self._get_all_stats()
         else:
             return self._get_table_stats(table_name)
     
+    def get_io_stats(self, table_name=None):
+        # counter I/O kumulatif sejak start (atau reset terakhir): page/byte dibaca dan ditulis,
+        # fsync, dan waktu (detik). tables per file fisik (partisi terpisah), indexes per file .idx.
+        # dengan table_name: hanya tabel itu (+ partisinya) dan total gabungannya.
+        tables = self.io_stats.snapshot()
+        indexes = {}
+        for manager, index_type in self._index_io_managers():
+            for (table, column), counters in manager.io_stats.snapshot().items():
+                indexes[f"{table.lower()}.{column}:{index_type}"] = dict(
+                    counters, table=table.lower(), column=column, type=index_type
+                )
+
+        if table_name is None:
+            return {'tables': tables, 'indexes': indexes}
+
+        units = {unit.lower() for unit in self.get_partitions(table_name)}
+        tables = {name: counters for name, counters in tables.items() if name in units}
+        indexes = {name: counters for name, counters in indexes.items() if counters['table'] in units}
+        total = dict.fromkeys(IO_FIELDS, 0)
+        for counters in list(tables.values()) + list(indexes.values()):
+            for field in IO_FIELDS:
+                total[field] += counters[field]
+        total = {field: round(value, 6) if field.endswith('_time') else value for field, value in total.items()}
+        return {'tables': tables, 'indexes': indexes, 'total': total}
+
+    def reset_io_stats(self, table_name=None):
+        units = None if table_name is None else {unit.lower() for unit in self.get_partitions(table_name)}
+        if units is None:
+            self.io_stats.reset()
+        else:
+            for unit in units:
+                self.io_stats.reset(unit)
+        for manager, _ in self._index_io_managers():
+            for table, column in list(manager.io_stats.snapshot()):
+                if units is None or table.lower() in units:
+                    manager.io_stats.reset((table, column))
+
+    def _index_io_managers(self):
+        return [
+            (self.hash_index_manager, 'hash'),
+            (self.bplus_tree_index_manager, 'btree'),
+            (self.trigram_index_manager, 'trigram'),
+        ]
+
     def _get_all_stats(self):
         all_stats = {}
         tables = self.schema_manager.list_tables()
@@ -542,15 +2394,18 @@ class StorageManager:
         return all_stats
     
     def _get_table_stats(self, table_name):
-        schema = self.schema_manager.get_table_schema(table_name)
+        schema = self._get_table_schema(table_name)
         
         if schema is None:
             return Statistic(n_r=0, b_r=0, l_r=0, f_r=0, v_a_r={}, i_r={})
         
-        table_file = self._get_table_file_path(table_name)
+        # tabel berpartisi: statistik digabung dari semua file partisi
+        partitions = self.get_partitions(table_name)
+        table_files = [self._get_table_file_path(partition) for partition in partitions]
+        table_files = [table_file for table_file in table_files if os.path.exists(table_file)]
         
-        if not os.path.exists(table_file):
-            return Statistic(n_r=0, b_r=0, l_r=0, f_r=0, v_a_r={}, i_r={})
+        if not table_files:
+            return Statistic(n_r=0, b_r=0, l_r=0, f_r=0, v_a_r={}, i_r={}, io=self.get_io_stats(table_name))
         
         n_r = 0
         l_r = 0
@@ -571,35 +2426,47 @@ class StorageManager:
             elif attr_type == 'varchar':
                 l_r += 4 + (attr_size // 2)
         
-        file_size = os.path.getsize(table_file)
-        page_count = file_size // 4096
+        page_count = 0
         
         serializer = RowSerializer(with_lsn=self.row_serializer.with_lsn)
         distinct_values = {attr['name']: set() for attr in attributes}
         
-        try:
-            with open(table_file, 'rb') as f:
-                for page_num in range(page_count):
-                    page_data = f.read(4096)
-                    if len(page_data) < 4096:
-                        break
-                    
-                    page = SlottedPage()
-                    page.load(page_data)
-                    
-                    n_r += page.record_count
-                    
-                    for i in range(page.record_count):
-                        try:
-                            record_bytes = page.get_record(i)
-                            record = serializer.deserialize(schema, record_bytes)
-                            
-                            for attr_name, value in record.items():
-                                distinct_values[attr_name].add(str(value))
-                        except:
-                            pass
-        except:
-            pass
+        for table_file in table_files:
+            self._flush_pages(table_file)
+            file_page_count = os.path.getsize(table_file) // 4096
+            page_count += file_page_count
+            try:
+                with open(table_file, 'rb') as f:
+                    for page_num in range(file_page_count):
+                        page_data = f.read(4096)
+                        if len(page_data) < 4096:
+                            break
+                        
+                        page = SlottedPage()
+                        page.load(page_data)
+                        
+                        live_slots = page.live_slots()
+                        n_r += len(live_slots)
+                        
+                        for i in live_slots:
+                            try:
+                                record = serializer.deserialize(schema, page.get_record(i), page.get_version(i))
+                                
+                                for attr_name, values in distinct_values.items():
+                                    values.add(str(record.get(attr_name)))
+                            except:
+                                pass
+            except:
+                pass
+        
+        # tabel LSM: row ada di memtable dan sorted run, bukan di page .dat
+        tree = self._get_lsm_tree(table_name)
+        if tree is not None:
+            for _, record_bytes in tree.scan():
+                n_r += 1
+                record = serializer.deserialize(schema, record_bytes)
+                for attr_name, values in distinct_values.items():
+                    values.add(str(record.get(attr_name)))
         
         for attr_name, values in distinct_values.items():
             v_a_r[attr_name] = len(values)
@@ -608,13 +2475,15 @@ class StorageManager:
             attr_name = attr['name']
             i_r[attr_name] = {'Type': 'none', 'Value': None}
         
-        hash_indexes = self.hash_index_manager.list_indexes(table_name)
+        # index dibuat seragam di semua partisi, cukup lihat partisi pertama
+        index_table = partitions[0]
+        hash_indexes = self.hash_index_manager.list_indexes(index_table)
         for idx in hash_indexes:
             column_name = idx['column']
             index_type = idx['type']
             
             if index_type == 'hash':
-                index_data = self.hash_index_manager.load_index(table_name, column_name)
+                index_data = self.hash_index_manager.load_index(index_table, column_name)
                 if index_data:
                     num_buckets = index_data.get('num_buckets', 200)  # Default 200 if not found
                     i_r[column_name] = {'Type': 'hash', 'Value': num_buckets}
@@ -622,13 +2491,13 @@ class StorageManager:
                     i_r[column_name] = {'Type': 'hash', 'Value': 200}
         
         # Collect B+ tree indexes
-        btree_indexes = self.bplus_tree_index_manager.list_indexes(table_name)
+        btree_indexes = self.bplus_tree_index_manager.list_indexes(index_table)
         for idx in btree_indexes:
             column_name = idx['column']
             index_type = idx['type']
             
             if index_type == 'btree':
-                index_data = self.bplus_tree_index_manager.load_index(table_name, column_name)
+                index_data = self.bplus_tree_index_manager.load_index(index_table, column_name)
                 if index_data and index_data.get('root'):
                     depth = self._calculate_tree_depth(index_data['root'])
                     i_r[column_name] = {'Type': 'btree', 'Value': depth}
@@ -648,9 +2517,14 @@ class StorageManager:
         else:
             b_r = page_count
         
-        return Statistic(n_r=n_r, b_r=b_r, l_r=l_r, f_r=f_r, v_a_r=v_a_r, i_r=i_r)
+        return Statistic(n_r=n_r, b_r=b_r, l_r=l_r, f_r=f_r, v_a_r=v_a_r, i_r=i_r, io=self.get_io_stats(table_name))
     
     def flush_buffer_to_disk(self):
+        self.flush_pages()
+        self.zone_map_manager.save_all()
+        self.bloom_filter_manager.save_all()
+        self.lsm_manager.flush_all()
+
         if self.frm_instance is None:
             return
 
@@ -659,6 +2533,10 @@ class StorageManager:
         if not dirty_entries:
             return
 
+        # isi tabel yang di-flush bisa berubah, row cache-nya dibuang
+        for entry in dirty_entries:
+            self.row_cache.invalidate(entry['key'])
+
 
         flushed_entries = []
 
@@ -670,6 +2548,10 @@ class StorageManager:
                 self._write_buffer_row_to_disk(table_name, data)
                 flushed_entries.append(entry)
 
+            # entry baru boleh ditandai bersih setelah isi tabelnya benar-benar sampai disk
+            for table_name in {entry['key'] for entry in flushed_entries}:
+                self._sync_table(table_name)
+
             for entry in flushed_entries:
                 table_name = entry['key']
                 data = entry['data']
@@ -686,7 +2568,7 @@ class StorageManager:
             
 
     def _write_buffer_row_to_disk(self, table_name, row_data):
-        schema = self.schema_manager.get_table_schema(table_name)
+        schema = self._get_table_schema(table_name)
         if schema is None:
             raise ValueError(f"Tabel '{table_name}' tidak ditemukan")
 
@@ -737,7 +2619,7 @@ class StorageManager:
             return None
 
         try:
-            schema = self.schema_manager.get_table_schema(table_name)
+            schema = self._get_table_schema(table_name)
             if schema is None:
                 return None
 
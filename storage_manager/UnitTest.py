@@ -0,0 +1,1159 @@
+#run pake python -m unittest storage_manager.UnitTest -v
+import unittest
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "storage_manager"))
+
+from StorageManager import StorageManager
+from storagemanager_model.data_retrieval import DataRetrieval
+from storagemanager_model.data_write import DataWrite
+from storagemanager_model.data_deletion import DataDeletion
+from storagemanager_model.condition import Condition
+from storagemanager_helper.schema import Schema
+from storagemanager_helper.slotted_page import SlottedPage, PAGE_SIZE, SLOT_SIZE
+from storagemanager_helper.lsm import LSMManager
+from storagemanager_helper.predicate import bind_conditions
+from storagemanager_helper.latch import RWLatch
+from storagemanager_helper import vectorized
+
+
+class StorageManagerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.test_db_path = tempfile.mkdtemp(prefix="sm_test_")
+        self.storage_manager = StorageManager(self.test_db_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_db_path, ignore_errors=True)
+
+    def create_table(self, table_name, attributes):
+        schema = Schema()
+        for name, type_, size in attributes:
+            schema.add_attribute(name, type_, size)
+        self.storage_manager.schema_manager.add_table_schema(table_name, schema)
+        self.storage_manager.schema_manager.save_schemas()
+
+        with open(os.path.join(self.test_db_path, f"{table_name.lower()}.dat"), "wb") as f:
+            f.write(SlottedPage().serialize())
+
+    def insert(self, table_name, row):
+        return self.storage_manager.write_block(DataWrite(table_name, None, [], row))
+
+    def select(self, table_name, conditions=None, column="*"):
+        return self.storage_manager.read_block(DataRetrieval(table_name, column, conditions or []))
+
+    def create_student_table(self, n_rows=300):
+        self.create_table("Student", [("StudentID", "int", 4), ("Name", "varchar", 50), ("GPA", "float", 4)])
+        for i in range(n_rows):
+            self.insert("Student", {"StudentID": i, "Name": f"Student{i}", "GPA": round(2.0 + (i % 20) / 10, 2)})
+
+
+class TestZoneMap(StorageManagerTestCase):
+
+    def test_range_scan_skips_pages(self):
+        self.create_student_table()
+        table_path = self.storage_manager._get_table_file_path("Student")
+        self.assertGreater(os.path.getsize(table_path) // PAGE_SIZE, 3)
+
+        # scan pertama membangun zone map
+        rows = self.select("Student", [Condition("StudentID", ">=", 290)])
+        self.assertEqual(sorted(r["StudentID"] for r in rows), list(range(290, 300)))
+        self.assertTrue(os.path.exists(os.path.join(self.test_db_path, "student.zmap")))
+
+        zone_map = self.storage_manager.zone_map_manager.get_zone_map(table_path)
+        self.assertIsNotNone(zone_map)
+        skipped = [
+            page_id for page_id in zone_map["pages"]
+            if not self.storage_manager.zone_map_manager.page_may_match(
+                zone_map, page_id, [Condition("StudentID", ">=", 290)]
+            )
+        ]
+        self.assertGreater(len(skipped), 0)
+
+        rows = self.select("Student", [Condition("StudentID", ">=", "290")])
+        self.assertEqual(len(rows), 10)
+
+    def test_zone_map_follows_insert_update_delete(self):
+        self.create_student_table()
+        self.select("Student", [Condition("StudentID", "=", 0)])
+
+        self.insert("Student", {"StudentID": 1000, "Name": "Late", "GPA": 4.0})
+        rows = self.select("Student", [Condition("StudentID", ">", 999)])
+        self.assertEqual([r["Name"] for r in rows], ["Late"])
+
+        self.storage_manager.write_block(
+            DataWrite("Student", "StudentID", [Condition("StudentID", "=", 5)], 5000)
+        )
+        rows = self.select("Student", [Condition("StudentID", "=", 5000)])
+        self.assertEqual([r["Name"] for r in rows], ["Student5"])
+
+        self.storage_manager.delete_block(DataDeletion("Student", [Condition("StudentID", "<", 100)]))
+        rows = self.select("Student", [Condition("StudentID", "<", 200)])
+        self.assertEqual(sorted(r["StudentID"] for r in rows), list(range(100, 200)))
+
+    def test_stale_zone_map_is_rebuilt(self):
+        self.create_student_table(50)
+        self.select("Student", [Condition("StudentID", "=", 0)])
+
+        # file tabel diganti di luar StorageManager
+        table_path = self.storage_manager._get_table_file_path("Student")
+        with open(table_path, "wb") as f:
+            f.write(SlottedPage().serialize())
+        other = StorageManager(self.test_db_path)
+        other.write_block(DataWrite("Student", None, [], {"StudentID": 77, "Name": "New", "GPA": 3.0}))
+
+        rows = self.select("Student", [Condition("StudentID", "=", 77)])
+        self.assertEqual([r["Name"] for r in rows], ["New"])
+
+    def test_zone_map_saved_on_flush(self):
+        self.create_student_table(50)
+        self.select("Student", [Condition("StudentID", "=", 0)])
+        self.insert("Student", {"StudentID": 500, "Name": "Flushed", "GPA": 3.5})
+        self.storage_manager.flush_buffer_to_disk()
+
+        reopened = StorageManager(self.test_db_path)
+        table_path = reopened._get_table_file_path("Student")
+        self.assertIsNotNone(reopened.zone_map_manager.get_zone_map(table_path))
+        rows = reopened.read_block(DataRetrieval("Student", "*", [Condition("StudentID", "=", 500)]))
+        self.assertEqual([r["Name"] for r in rows], ["Flushed"])
+
+
+class TestBloomFilter(StorageManagerTestCase):
+
+    def test_bloom_filter_skips_pages_without_value(self):
+        self.create_student_table()
+        self.storage_manager.create_bloom_filter("Student", "Name", false_positive_rate=0.001)
+        self.assertTrue(os.path.exists(os.path.join(self.test_db_path, "student.Name.bloom")))
+
+        table_path = self.storage_manager._get_table_file_path("Student")
+        blooms = self.storage_manager.bloom_filter_manager.get_filters(table_path)
+        schema = self.storage_manager.schema_manager.get_table_schema("Student")
+        manager = self.storage_manager.bloom_filter_manager
+        missing = [Condition("Name", "=", "Nobody")]
+        self.assertFalse(any(manager.page_may_match(blooms, p, missing, schema) for p in blooms["Name"]["pages"]))
+        self.assertEqual(blooms["Name"]["false_positive_rate"], 0.001)
+
+        self.select("Student")
+        self.assertEqual(self.select("Student", missing), [])
+        rows = self.select("Student", [Condition("Name", "=", "Student123")])
+        self.assertEqual([r["StudentID"] for r in rows], [123])
+
+    def test_bloom_filter_maintained_on_insert_and_update(self):
+        self.create_student_table(50)
+        self.assertTrue(self.storage_manager._set_index("Student", "GPA", "bloom"))
+        self.select("Student")
+
+        self.insert("Student", {"StudentID": 900, "Name": "Fresh", "GPA": 1.25})
+        rows = self.select("Student", [Condition("GPA", "=", "1.25")])
+        self.assertEqual([r["Name"] for r in rows], ["Fresh"])
+
+        self.storage_manager.write_block(DataWrite("Student", "GPA", [Condition("StudentID", "=", 3)], 0.5))
+        rows = self.select("Student", [Condition("GPA", "=", 0.5)])
+        self.assertEqual([r["StudentID"] for r in rows], [3])
+
+    def test_stale_bloom_filter_is_rebuilt(self):
+        self.create_student_table(50)
+        self.storage_manager.create_bloom_filter("Student", "StudentID")
+
+        other = StorageManager(self.test_db_path)
+        other.bloom_filter_manager.loaded_filters.clear()
+        table_path = self.storage_manager._get_table_file_path("Student")
+        with open(table_path, "ab") as f:
+            page = SlottedPage()
+            page.add_record(other.row_serializer.serialize(
+                other.schema_manager.get_table_schema("Student"), {"StudentID": 4242, "Name": "Raw", "GPA": 2.0}
+            ))
+            f.write(page.serialize())
+
+        rows = self.select("Student", [Condition("StudentID", "=", 4242)])
+        self.assertEqual([r["Name"] for r in rows], ["Raw"])
+        self.assertEqual(self.storage_manager.bloom_filter_manager.get_stale_filters(table_path), [])
+
+    def test_bloom_filter_used_while_zone_map_rebuilds(self):
+        self.create_student_table()
+        sm = self.storage_manager
+        sm.create_bloom_filter("Student", "Name", false_positive_rate=0.001)
+        table_path = sm._get_table_file_path("Student")
+        sm.zone_map_manager.drop_zone_map(table_path)
+
+        read_page_bytes = sm._read_page_bytes
+        pages_read = []
+
+        def counting_read(f, page_id):
+            pages_read.append(page_id)
+            return read_page_bytes(f, page_id)
+
+        sm._read_page_bytes = counting_read
+        self.assertEqual(self.select("Student", [Condition("Name", "=", "Nobody")]), [])
+        num_pages = os.path.getsize(table_path) // PAGE_SIZE
+        self.assertEqual(pages_read, [num_pages])
+        # page yang dilewati tidak punya batas, zone map baru dipasang oleh scan yang membaca semua page
+        self.assertIsNone(sm.zone_map_manager.get_zone_map(table_path))
+
+        rows = self.select("Student", [Condition("Name", "=", "Student123")])
+        self.assertEqual([r["StudentID"] for r in rows], [123])
+        self.assertEqual(len(self.select("Student", [Condition("GPA", ">", 0)])), 300)
+        self.assertIsNotNone(sm.zone_map_manager.get_zone_map(table_path))
+
+
+class TestIndexDrivenDML(StorageManagerTestCase):
+
+    def assert_index_consistent(self, column, index_manager):
+        table_path = self.storage_manager._get_table_file_path("Student")
+        schema = self.storage_manager.schema_manager.get_table_schema("Student")
+        with open(table_path, "rb") as f:
+            for page_id, page, slot_ids in self.storage_manager._iter_target_pages(f):
+                for slot_id in slot_ids:
+                    row = self.storage_manager.row_serializer.deserialize(schema, page.get_record(slot_id))
+                    home = page.get_home(slot_id) or (page_id, slot_id)
+                    self.assertIn(home, index_manager.search("Student", column, row[column]))
+
+    def test_update_uses_hash_index(self):
+        self.create_student_table()
+        self.storage_manager._set_index("Student", "StudentID", "hash")
+
+        schema = self.storage_manager.schema_manager.get_table_schema("Student")
+        locations = self.storage_manager._index_lookup("Student", schema, [Condition("StudentID", "=", "5")])
+        self.assertEqual(len(locations), 1)
+
+        affected = self.storage_manager.write_block(DataWrite(
+            "Student", ["Name", "GPA"], [Condition("StudentID", "=", 5)], {"Name": "Updated", "GPA": 3.95}
+        ))
+        self.assertEqual(affected, 1)
+        rows = self.select("Student", [Condition("StudentID", "=", 5)])
+        self.assertEqual((rows[0]["Name"], rows[0]["GPA"]), ("Updated", 3.95))
+
+        self.storage_manager.write_block(DataWrite("Student", "StudentID", [Condition("StudentID", "=", 5)], 5005))
+        self.assertEqual(self.select("Student", [Condition("StudentID", "=", 5)]), [])
+        self.assertEqual(len(self.select("Student", [Condition("StudentID", "=", 5005)])), 1)
+        self.assert_index_consistent("StudentID", self.storage_manager.hash_index_manager)
+
+    def test_delete_maintains_indexes(self):
+        self.create_student_table()
+        self.storage_manager._set_index("Student", "StudentID", "hash")
+        self.storage_manager._set_index("Student", "GPA", "btree")
+
+        deleted = self.storage_manager.delete_block(DataDeletion("Student", [Condition("StudentID", "=", 10)]))
+        self.assertEqual(deleted, 1)
+        deleted = self.storage_manager.delete_block(DataDeletion("Student", [Condition("GPA", ">=", 3.8)]))
+        self.assertEqual(deleted, 30)
+
+        self.assertEqual(self.select("Student", [Condition("StudentID", "=", 10)]), [])
+        self.assertEqual(self.select("Student", [Condition("GPA", ">", 3.7)]), [])
+        self.assertEqual(len(self.select("Student")), 269)
+        self.assert_index_consistent("StudentID", self.storage_manager.hash_index_manager)
+        self.assert_index_consistent("GPA", self.storage_manager.bplus_tree_index_manager)
+
+        self.insert("Student", {"StudentID": 10, "Name": "Back", "GPA": 3.9})
+        rows = self.select("Student", [Condition("StudentID", "=", 10)])
+        self.assertEqual([r["Name"] for r in rows], ["Back"])
+
+    def test_btree_duplicate_keys_across_splits(self):
+        # banyak key duplikat: separator yang sama muncul berulang di node internal
+        self.create_table("Student", [("StudentID", "int", 4), ("Name", "varchar", 50), ("GPA", "float", 4)])
+        self.storage_manager._set_index("Student", "GPA", "btree")
+        rng = random.Random(3)
+        gpas = [round(1.0 + rng.randint(0, 60) / 10, 2) for _ in range(2000)]
+        for i, gpa in enumerate(gpas):
+            self.insert("Student", {"StudentID": i, "Name": f"Student{i}", "GPA": gpa})
+
+        for gpa in sorted(set(gpas)):
+            rows = self.select("Student", [Condition("GPA", "=", gpa)])
+            self.assertEqual(sorted(r["StudentID"] for r in rows), [i for i, g in enumerate(gpas) if g == gpa])
+
+        deleted = self.storage_manager.delete_block(DataDeletion("Student", [Condition("GPA", "=", 6.8)]))
+        self.assertEqual(deleted, gpas.count(6.8))
+        self.assertEqual(len(self.select("Student")), 2000 - gpas.count(6.8))
+        self.assert_index_consistent("GPA", self.storage_manager.bplus_tree_index_manager)
+
+
+class TestSlottedPage(unittest.TestCase):
+
+    def test_delete_keeps_slot_ids_stable(self):
+        page = SlottedPage()
+        slots = [page.add_record(bytes([i]) * 100) for i in range(5)]
+        self.assertEqual(slots, [0, 1, 2, 3, 4])
+
+        page.delete_record(1)
+        self.assertEqual(page.live_slots(), [0, 2, 3, 4])
+        self.assertEqual(page.get_record(3), bytes([3]) * 100)
+
+        # tombstone dipakai ulang, record lain tetap di slot yang sama
+        self.assertEqual(page.add_record(b"x" * 50), 1)
+        self.assertEqual(page.get_record(4), bytes([4]) * 100)
+
+        loaded = SlottedPage()
+        loaded.load(page.serialize())
+        self.assertEqual([loaded.get_record(i) for i in loaded.live_slots()],
+                         [page.get_record(i) for i in page.live_slots()])
+
+    def test_compaction_is_lazy(self):
+        page = SlottedPage()
+        record_size = 400
+        count = 0
+        while page.free_space() >= record_size + SLOT_SIZE:
+            page.add_record(bytes([count]) * record_size)
+            count += 1
+
+        page.delete_record(0)
+        page.delete_record(2)
+        self.assertLess(page.free_space(), 2 * record_size)
+
+        # slot 0 tumbuh dua kali lipat: hanya muat setelah compact
+        self.assertEqual(page.add_record(b"a" * record_size), 0)
+        self.assertTrue(page.update_record(0, b"b" * (2 * record_size)))
+        self.assertEqual(page.get_record(0), b"b" * (2 * record_size))
+        self.assertEqual(page.get_record(count - 1), bytes([count - 1]) * record_size)
+        self.assertFalse(page.update_record(1, b"c" * PAGE_SIZE))
+        self.assertEqual(page.get_record(1), bytes([1]) * record_size)
+
+    def test_forward_and_moved_records(self):
+        page = SlottedPage()
+        slot_id = page.add_record(b"r" * 20)
+        page.set_forward(slot_id, 7, 3)
+        self.assertEqual(page.get_forward(slot_id), (7, 3))
+        self.assertEqual(page.live_slots(), [])
+
+        moved = page.add_record(b"m" * 20, home=(2, 5))
+        self.assertEqual(page.get_home(moved), (2, 5))
+        self.assertEqual(page.get_record(moved), b"m" * 20)
+        self.assertTrue(page.update_record(moved, b"n" * 20))
+        self.assertEqual(page.get_home(moved), (2, 5))
+
+
+class TestForwardedRows(StorageManagerTestCase):
+
+    def test_relocated_row_keeps_rid(self):
+        self.create_student_table(120)
+        self.storage_manager._set_index("Student", "StudentID", "hash")
+        table_path = self.storage_manager._get_table_file_path("Student")
+        schema = self.storage_manager.schema_manager.get_table_schema("Student")
+        home = self.storage_manager.hash_index_manager.search("Student", "StudentID", 3)[0]
+
+        with open(table_path, "rb+") as f:
+            f.seek(home[0] * PAGE_SIZE)
+            page = self.storage_manager._load_page(f.read(PAGE_SIZE))
+            record_bytes = self.storage_manager.row_serializer.serialize(
+                schema, {"StudentID": 3, "Name": "Moved", "GPA": 2.5}
+            )
+            new_location = self.storage_manager._relocate_record(f, page, home[0], home[1], record_bytes)
+            f.seek(home[0] * PAGE_SIZE)
+            f.write(page.serialize())
+        self.assertNotEqual(new_location, home)
+
+        self.assertEqual(self.storage_manager.hash_index_manager.search("Student", "StudentID", 3), [home])
+        self.assertEqual([r["Name"] for r in self.select("Student", [Condition("StudentID", "=", 3)])], ["Moved"])
+        self.assertEqual(len([r for r in self.select("Student") if r["StudentID"] == 3]), 1)
+
+        self.storage_manager.write_block(DataWrite("Student", "Name", [Condition("Name", "=", "Moved")], "Again"))
+        self.assertEqual([r["Name"] for r in self.select("Student", [Condition("StudentID", "=", 3)])], ["Again"])
+
+        self.assertEqual(self.storage_manager.delete_block(DataDeletion("Student", [Condition("Name", "=", "Again")])), 1)
+        self.assertEqual(self.select("Student", [Condition("StudentID", "=", 3)]), [])
+        with open(table_path, "rb") as f:
+            f.seek(home[0] * PAGE_SIZE)
+            page = self.storage_manager._load_page(f.read(PAGE_SIZE))
+        self.assertTrue(home[1] >= page.record_count or page.get_forward(home[1]) is None)
+        self.assertEqual(len(self.select("Student")), 119)
+
+
+class TestClusteredTable(StorageManagerTestCase):
+
+    def test_cluster_and_binary_search_pages(self):
+        self.create_table("Student", [("StudentID", "int", 4), ("Name", "varchar", 50), ("GPA", "float", 4)])
+        for i in reversed(range(200)):
+            self.insert("Student", {"StudentID": i, "Name": f"Student{i}", "GPA": 3.0})
+        self.assertTrue(self.storage_manager._set_index("Student", "StudentID", "clustered"))
+        self.assertEqual(
+            self.storage_manager.schema_manager.get_table_options("Student"), {"clustered_by": "StudentID"}
+        )
+
+        table_path = self.storage_manager._get_table_file_path("Student")
+        schema = self.storage_manager.schema_manager.get_table_schema("Student")
+        num_pages = os.path.getsize(table_path) // PAGE_SIZE
+        pages = self.storage_manager._clustered_pages("Student", table_path, schema, [Condition("StudentID", "=", 150)])
+        self.assertEqual(len(pages), 1)
+        pages = self.storage_manager._clustered_pages(
+            "Student", table_path, schema, [Condition("StudentID", ">=", 10), Condition("StudentID", "<", 20)]
+        )
+        self.assertLess(len(pages), num_pages)
+
+        rows = self.select("Student", [Condition("StudentID", ">", 189)])
+        self.assertEqual(sorted(r["StudentID"] for r in rows), list(range(190, 200)))
+
+    def test_insert_splits_pages_and_keeps_indexes(self):
+        self.create_table("Student", [("StudentID", "int", 4), ("Name", "varchar", 50), ("GPA", "float", 4)])
+        self.storage_manager.cluster_table("Student", "StudentID")
+        self.storage_manager._set_index("Student", "Name", "hash")
+        self.storage_manager.create_bloom_filter("Student", "GPA")
+
+        for i in range(0, 400, 2):
+            self.insert("Student", {"StudentID": i, "Name": f"Student{i}", "GPA": round(2.0 + (i % 10) / 10, 2)})
+        for i in range(1, 400, 2):
+            self.insert("Student", {"StudentID": i, "Name": f"Student{i}", "GPA": round(2.0 + (i % 10) / 10, 2)})
+
+        table_path = self.storage_manager._get_table_file_path("Student")
+        zone_map = self.storage_manager.zone_map_manager.get_zone_map(table_path)
+        directory = self.storage_manager.zone_map_manager.get_fence_directory(zone_map, "StudentID")
+        for i in range(1, len(directory)):
+            self.assertLess(directory.max_keys[i - 1], directory.min_keys[i])
+
+        for key in (0, 77, 201, 399):
+            rows = self.select("Student", [Condition("StudentID", "=", key)])
+            self.assertEqual([r["Name"] for r in rows], [f"Student{key}"])
+            rows = self.select("Student", [Condition("Name", "=", f"Student{key}")])
+            self.assertEqual([r["StudentID"] for r in rows], [key])
+        # row yang pindah saat split harus tercatat di bloom filter page barunya
+        for gpa in (2.0, 2.5, 2.9):
+            rows = self.select("Student", [Condition("GPA", "=", gpa)])
+            self.assertEqual(len(rows), 40)
+
+        self.assertEqual(len(self.select("Student")), 400)
+        deleted = self.storage_manager.delete_block(DataDeletion("Student", [Condition("StudentID", "<=", 99)]))
+        self.assertEqual(deleted, 100)
+        self.assertEqual(len(self.select("Student", [Condition("StudentID", "<", 150)])), 50)
+
+
+class TestPartitionedTable(StorageManagerTestCase):
+
+    def test_hash_partitions_route_and_prune(self):
+        self.create_student_table(120)
+        self.storage_manager._set_index("Student", "Name", "hash")
+        self.storage_manager.create_partitions("Student", "hash", "StudentID", partitions=4)
+
+        self.assertFalse(os.path.exists(os.path.join(self.test_db_path, "student.dat")))
+        partitions = self.storage_manager.get_partitions("Student")
+        self.assertEqual(partitions, [f"Student__p{i}" for i in range(4)])
+        self.assertEqual(len(self.storage_manager.get_partitions("Student", [Condition("StudentID", "=", "7")])), 1)
+        self.assertEqual(self.storage_manager.get_stats("Student").n_r, 120)
+
+        # setiap partisi punya index sendiri
+        for partition in partitions:
+            self.assertEqual(len(self.storage_manager.hash_index_manager.list_indexes(partition)), 1)
+
+        self.insert("Student", {"StudentID": 500, "Name": "Student500", "GPA": 3.5})
+        rows = self.select("Student", [Condition("StudentID", "=", 500)])
+        self.assertEqual([r["Name"] for r in rows], ["Student500"])
+        rows = self.select("Student", [Condition("Name", "=", "Student42")])
+        self.assertEqual([r["StudentID"] for r in rows], [42])
+
+        # update kolom partisi memindahkan row ke partisi lain
+        updated = self.storage_manager.write_block(
+            DataWrite("Student", ["StudentID"], [Condition("StudentID", "=", 3)], {"StudentID": 1003})
+        )
+        self.assertEqual(updated, 1)
+        self.assertEqual(self.select("Student", [Condition("StudentID", "=", 3)]), [])
+        self.assertEqual([r["Name"] for r in self.select("Student", [Condition("StudentID", "=", 1003)])], ["Student3"])
+
+        deleted = self.storage_manager.delete_block(DataDeletion("Student", [Condition("GPA", ">=", 3.5)]))
+        self.assertEqual(deleted, 31)
+        self.assertEqual(len(self.select("Student")), 90)
+
+        self.assertTrue(self.storage_manager.drop_partitions("Student"))
+        self.assertEqual(self.storage_manager.get_partitions("Student"), ["Student"])
+        self.assertFalse(any(name.startswith("student__p") for name in os.listdir(self.test_db_path)))
+
+    def test_range_partitions_prune_by_bounds(self):
+        self.create_table("Student", [("StudentID", "int", 4), ("Name", "varchar", 50), ("GPA", "float", 4)])
+        self.storage_manager.create_partitions("Student", "range", "StudentID", bounds=["100", "200"])
+        for i in range(300):
+            self.insert("Student", {"StudentID": i, "Name": f"Student{i}", "GPA": 3.0})
+
+        get_partitions = self.storage_manager.get_partitions
+        self.assertEqual(get_partitions("Student", [Condition("StudentID", "<", 100)]), ["Student__p0"])
+        self.assertEqual(get_partitions("Student", [Condition("StudentID", "=", 100)]), ["Student__p1"])
+        self.assertEqual(
+            get_partitions("Student", [Condition("StudentID", ">=", 150), Condition("StudentID", "<=", 200)]),
+            ["Student__p1", "Student__p2"],
+        )
+
+        rows = self.select("Student__p1")
+        self.assertEqual(sorted(r["StudentID"] for r in rows), list(range(100, 200)))
+        rows = self.select("Student", [Condition("StudentID", ">", 250)])
+        self.assertEqual(sorted(r["StudentID"] for r in rows), list(range(251, 300)))
+
+
+class TestVacuum(StorageManagerTestCase):
+
+    assert_index_consistent = TestIndexDrivenDML.assert_index_consistent
+
+    def test_vacuum_full_moves_rows_and_remaps_indexes(self):
+        self.create_student_table()
+        self.storage_manager._set_index("Student", "StudentID", "hash")
+        self.storage_manager._set_index("Student", "GPA", "btree")
+        table_path = self.storage_manager._get_table_file_path("Student")
+
+        # row 3 dipindah ke page terakhir, slot asalnya jadi forwarding pointer
+        schema = self.storage_manager.schema_manager.get_table_schema("Student")
+        home = self.storage_manager.hash_index_manager.search("Student", "StudentID", 3)[0]
+        with open(table_path, "rb+") as f:
+            f.seek(home[0] * PAGE_SIZE)
+            page = self.storage_manager._load_page(f.read(PAGE_SIZE))
+            record_bytes = self.storage_manager.row_serializer.serialize(
+                schema, {"StudentID": 3, "Name": "Moved", "GPA": 2.5}
+            )
+            self.storage_manager._relocate_record(f, page, home[0], home[1], record_bytes)
+            f.seek(home[0] * PAGE_SIZE)
+            f.write(page.serialize())
+
+        self.storage_manager.delete_block(DataDeletion("Student", [Condition("GPA", "<", 3.5)]))
+        pages_before = os.path.getsize(table_path) // PAGE_SIZE
+
+        result = self.storage_manager.vacuum_table("Student", full=True, batch_size=8)
+        self.assertEqual(result["pages_before"], pages_before)
+        self.assertLess(result["pages_after"], pages_before)
+        self.assertGreater(result["rows_moved"], 8)
+        self.assertEqual(result["stats"].n_r, 75)
+        self.assertEqual(os.path.getsize(table_path) // PAGE_SIZE, result["pages_after"])
+
+        self.assert_index_consistent("StudentID", self.storage_manager.hash_index_manager)
+        self.assert_index_consistent("GPA", self.storage_manager.bplus_tree_index_manager)
+        self.assertEqual(len(self.select("Student")), 75)
+        self.assertEqual(self.select("Student", [Condition("StudentID", "=", 3)]), [])
+        rows = self.select("Student", [Condition("StudentID", "=", 299)])
+        self.assertEqual([r["Name"] for r in rows], ["Student299"])
+        self.assertEqual(len(self.select("Student", [Condition("GPA", ">=", 3.9)])), 15)
+
+    def test_lazy_vacuum_keeps_rids(self):
+        self.create_student_table()
+        self.storage_manager._set_index("Student", "StudentID", "hash")
+        before = {i: self.storage_manager.hash_index_manager.search("Student", "StudentID", i) for i in range(0, 300, 7)}
+
+        self.storage_manager.delete_block(DataDeletion("Student", [Condition("StudentID", ">=", 150)]))
+        self.storage_manager.delete_block(DataDeletion("Student", [Condition("GPA", ">", 3.0)]))
+        result = self.storage_manager.vacuum_table("Student", batch_size=2)
+        self.assertEqual(result["rows_moved"], 0)
+        self.assertLess(result["pages_after"], result["pages_before"])
+
+        for i, locations in before.items():
+            rows = self.select("Student", [Condition("StudentID", "=", i)])
+            if rows:
+                self.assertEqual(self.storage_manager.hash_index_manager.search("Student", "StudentID", i), locations)
+        self.assertEqual(len(self.select("Student")), 87)
+
+
+class TestLSMTable(StorageManagerTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.storage_manager.lsm_manager = LSMManager(
+            self.test_db_path, memtable_limit=32, compaction_trigger=3, background_compaction=False
+        )
+
+    def run_files(self):
+        return sorted(name for name in os.listdir(self.test_db_path) if name.endswith(".sst"))
+
+    def test_writes_go_to_memtable_and_sorted_runs(self):
+        self.create_student_table(50)
+        self.assertTrue(self.storage_manager.set_table_engine("Student", "lsm"))
+        self.assertEqual(len(self.run_files()), 2)
+        self.assertEqual(os.path.getsize(self.storage_manager._get_table_file_path("Student")), PAGE_SIZE)
+
+        for i in range(50, 150):
+            self.insert("Student", {"StudentID": i, "Name": f"Student{i}", "GPA": 3.0})
+
+        # setiap 32 key memtable di-flush; run ke-3 memicu compaction jadi satu run
+        tree = self.storage_manager._get_lsm_tree("Student")
+        self.assertLess(len(tree.runs), 3)
+        self.assertGreater(len(tree.memtable), 0)
+
+        rows = self.select("Student", [Condition("StudentID", "=", "77")])
+        self.assertEqual([r["Name"] for r in rows], ["Student77"])
+        rows = self.select("Student", [Condition("StudentID", ">=", 140)], column=["StudentID"])
+        self.assertEqual([r["StudentID"] for r in rows], list(range(140, 150)))
+
+        updated = self.storage_manager.write_block(
+            DataWrite("Student", ["StudentID", "Name"], [Condition("StudentID", "=", 5)], {"StudentID": 500, "Name": "Moved"})
+        )
+        self.assertEqual(updated, 1)
+        deleted = self.storage_manager.delete_block(DataDeletion("Student", [Condition("StudentID", "<", 10)]))
+        self.assertEqual(deleted, 9)
+
+        self.storage_manager.flush_buffer_to_disk()
+        self.assertEqual(len(tree.memtable), 0)
+
+        # buka ulang dari disk: tombstone dan versi terbaru tetap berlaku
+        reopened = StorageManager(self.test_db_path)
+        rows = reopened.read_block(DataRetrieval("Student", "*", [Condition("StudentID", "=", 500)]))
+        self.assertEqual([r["Name"] for r in rows], ["Moved"])
+        self.assertEqual(reopened.read_block(DataRetrieval("Student", "*", [Condition("StudentID", "=", 3)])), [])
+        self.assertEqual(reopened.get_stats("Student").n_r, 141)
+
+    def test_switch_back_to_heap(self):
+        self.create_student_table(40)
+        self.storage_manager.set_table_engine("Student", "lsm")
+        self.insert("Student", {"StudentID": 1000, "Name": "Late", "GPA": 2.5})
+        self.storage_manager.set_table_engine("Student", "heap")
+
+        self.assertEqual(self.run_files(), [])
+        self.assertEqual(self.storage_manager.schema_manager.get_table_options("Student"), {})
+        self.assertEqual(len(self.select("Student")), 41)
+        self.assertEqual(len(self.select("Student", [Condition("Name", "=", "Late")])), 1)
+
+
+class TestLikePrefix(StorageManagerTestCase):
+
+    def test_prefix_like_uses_btree_range(self):
+        self.create_student_table()
+        schema = self.storage_manager.schema_manager.get_table_schema("Student")
+        expected = len(self.select("Student", [Condition("Name", "LIKE", "Student1%")]))
+        self.assertEqual(expected, 111)  # 1, 10-19, 100-199
+
+        self.storage_manager._set_index("Student", "Name", "btree")
+        locations = self.storage_manager._index_lookup("Student", schema, [Condition("Name", "LIKE", "Student1%")])
+        self.assertEqual(len(locations), 111)
+        self.assertEqual(len(self.select("Student", [Condition("Name", "LIKE", "Student1%")])), 111)
+
+        # range dari prefix 'Student1', sisa pola dicek per row
+        rows = self.select("Student", [Condition("Name", "LIKE", "Student1_5")])
+        self.assertEqual(sorted(r["StudentID"] for r in rows), list(range(105, 200, 10)))
+
+        # tanpa prefix literal tidak bisa pakai range
+        self.assertIsNone(self.storage_manager._index_lookup("Student", schema, [Condition("Name", "LIKE", "%9")]))
+        self.assertEqual(len(self.select("Student", [Condition("Name", "LIKE", "%9")])), 30)
+
+        self.assertAlmostEqual(self.storage_manager.estimate_like_selectivity("Student", "Name", "Student1%"), 111 / 300)
+        self.assertIsNone(self.storage_manager.estimate_like_selectivity("Student", "Name", "%9"))
+        self.assertIsNone(self.storage_manager.estimate_like_selectivity("Student", "GPA", "3%"))
+
+        deleted = self.storage_manager.delete_block(DataDeletion("Student", [Condition("Name", "LIKE", "Student2%")]))
+        self.assertEqual(deleted, 111)
+        self.assertEqual(self.select("Student", [Condition("Name", "LIKE", "Student2%")]), [])
+
+
+class TestTrigramIndex(StorageManagerTestCase):
+
+    def test_infix_like_uses_trigram_postings(self):
+        self.create_student_table()
+        schema = self.storage_manager.schema_manager.get_table_schema("Student")
+        self.assertTrue(self.storage_manager._set_index("Student", "Name", "trigram"))
+        with self.assertRaises(ValueError):
+            self.storage_manager._set_index("Student", "GPA", "trigram")
+
+        # 'nt12' -> trigram 'nt1', 't12': kandidat hanya row yang mengandung keduanya
+        cond = Condition("Name", "LIKE", "%nt12%")
+        locations = self.storage_manager._index_lookup("Student", schema, [cond])
+        self.assertEqual(len(locations), 11)  # 12, 120-129
+        self.assertEqual(len(self.select("Student", [cond])), 11)
+        self.assertIsNone(self.storage_manager._index_lookup("Student", schema, [Condition("Name", "LIKE", "%12%")]))
+        self.assertAlmostEqual(self.storage_manager.estimate_like_selectivity("Student", "Name", "%nt12%"), 11 / 300)
+
+        self.storage_manager.write_block(DataWrite("Student", "Name", [Condition("StudentID", "=", 7)], "Transient12"))
+        self.assertEqual(self.storage_manager.delete_block(DataDeletion("Student", [Condition("Name", "LIKE", "%nt120")])), 1)
+        rows = self.select("Student", [Condition("Name", "LIKE", "%nt12%")])
+        self.assertEqual(sorted(r["StudentID"] for r in rows), [7, 12] + list(range(121, 130)))
+
+        # index tersimpan ke disk dan dibaca ulang oleh manager baru
+        reopened = StorageManager(self.test_db_path)
+        self.assertEqual(sorted(reopened.trigram_index_manager.search_pattern("Student", "Name", "%nt12%")),
+                         sorted(self.storage_manager.trigram_index_manager.search_pattern("Student", "Name", "%nt12%")))
+
+
+class TestBitmapHeapScan(StorageManagerTestCase):
+
+    def test_index_rids_read_each_page_once(self):
+        self.create_student_table()
+        self.storage_manager._set_index("Student", "GPA", "btree")
+        schema = self.storage_manager.schema_manager.get_table_schema("Student")
+        table_path = self.storage_manager._get_table_file_path("Student")
+
+        # RID dari B+ tree terurut menurut GPA, bukan menurut page
+        locations = self.storage_manager._index_lookup("Student", schema, [Condition("GPA", ">=", 3.0)])
+        self.assertEqual(len(locations), 150)
+        self.assertNotEqual(locations, sorted(locations))
+
+        with open(table_path, "rb") as f:
+            visited = [(page_id, slot_ids) for page_id, _, slot_ids in self.storage_manager._iter_target_pages(f, locations)]
+        page_ids = [page_id for page_id, _ in visited]
+        self.assertEqual(page_ids, sorted(set(page_ids)))
+        self.assertEqual(sum(len(slot_ids) for _, slot_ids in visited), 150)
+        self.assertEqual(len(self.select("Student", [Condition("GPA", ">=", 3.0)])), 150)
+
+    def test_read_many_by_key(self):
+        self.create_student_table()
+        self.storage_manager._set_index("Student", "StudentID", "hash")
+        self.storage_manager.write_block(DataWrite("Student", "Name", [Condition("StudentID", "=", 7)], "x" * 50))
+
+        rows = self.storage_manager.read_many_by_key("Student", "StudentID", [5, "7", 250, 999], ["StudentID", "Name"])
+        self.assertEqual(sorted(rows), [5, 7, 250, 999])
+        self.assertEqual(rows[5], [{"StudentID": 5, "Name": "Student5"}])
+        self.assertEqual(rows[7], [{"StudentID": 7, "Name": "x" * 50}])
+        self.assertEqual(rows[999], [])
+
+        # tanpa index: satu full scan untuk semua key
+        rows = self.storage_manager.read_many_by_key("Student", "GPA", [2.0, 3.95])
+        self.assertEqual(len(rows[2.0]), 15)
+        self.assertEqual(rows[3.95], [])
+
+
+class TestAccessPathChoice(StorageManagerTestCase):
+
+    def test_index_scan_falls_back_to_seq_scan(self):
+        self.create_student_table()
+        self.storage_manager._set_index("Student", "StudentID", "hash")
+        self.storage_manager._set_index("Student", "GPA", "btree")
+
+        self.assertEqual(len(self.select("Student", [Condition("StudentID", "=", 42)])), 1)
+        plan = self.storage_manager.last_access_path
+        self.assertEqual((plan["method"], plan["index"], plan["pages"]), ("bitmap_index_scan", "hash", 1))
+
+        # GPA > 0 cocok dengan semua row: index menyentuh semua page, scan berurutan lebih murah
+        wide = [Condition("GPA", ">", 0)]
+        explained = self.storage_manager.explain_access_path(DataRetrieval("Student", "*", wide))
+        self.assertEqual(explained["method"], "seq_scan")
+        self.assertEqual((explained["index"], explained["matches"]), ("btree", 300))
+        self.assertEqual(len(self.select("Student", wide)), 300)
+        self.assertEqual(self.storage_manager.last_access_path, explained)
+
+        self.storage_manager.index_scan_threshold = 1.0
+        self.assertEqual(len(self.select("Student", wide)), 300)
+        self.assertEqual(self.storage_manager.last_access_path["method"], "bitmap_index_scan")
+
+        self.storage_manager.index_scan_threshold = 0.0
+        deleted = self.storage_manager.delete_block(DataDeletion("Student", [Condition("StudentID", "=", 42)]))
+        self.assertEqual(deleted, 1)
+        self.assertEqual(self.storage_manager.hash_index_manager.search("Student", "StudentID", 42), [])
+
+
+class TestBoundPredicate(StorageManagerTestCase):
+
+    def test_bound_predicate_matches_decoded_rows(self):
+        self.create_table("Item", [("ItemID", "int", 4), ("Code", "char", 6), ("Name", "varchar", 20), ("Price", "float", 4)])
+        for i in range(60):
+            self.insert("Item", {"ItemID": i, "Code": f"C{i % 7}", "Name": f"Item{i}", "Price": i / 4})
+
+        sm = self.storage_manager
+        schema = sm.schema_manager.get_table_schema("Item")
+        rows = sm.read_block(DataRetrieval("Item", "*", []))
+        records = [sm.row_serializer.serialize(schema, row) for row in rows]
+
+        cases = [
+            [Condition("ItemID", "=", 7)], [Condition("ItemID", "=", "7")], [Condition("ItemID", "=", 7.5)],
+            [Condition("ItemID", "<>", 3)], [Condition("ItemID", ">=", "50")], [Condition("ItemID", "<", 2.5)],
+            [Condition("Code", "=", "C3")], [Condition("Code", "<>", "C3")], [Condition("Code", "=", "C3xxxxx")],
+            [Condition("Name", "=", "Item12")], [Condition("Name", ">", "Item5")], [Condition("Name", "LIKE", "Item1%")],
+            [Condition("Price", "=", 2.5)], [Condition("Price", "<=", "3.25")],
+            [Condition("ItemID", ">", 10), Condition("Code", "=", "C1"), Condition("Name", "LIKE", "%5")],
+        ]
+        for conditions in cases:
+            matches = bind_conditions(schema, conditions, sm.row_serializer.with_lsn, sm._match)
+            expected = [row for row in rows if sm._match_all(row, conditions)]
+            self.assertEqual([row for row, record in zip(rows, records) if matches(record)], expected)
+            self.assertEqual(sm.read_block(DataRetrieval("Item", "*", conditions)), expected)
+
+        self.assertEqual(len(self.select("Item", [Condition("ItemID", "=", 7)])), 1)
+        deleted = sm.delete_block(DataDeletion("Item", [Condition("Code", "=", "C0")]))
+        self.assertEqual(deleted, 9)
+        self.assertEqual(self.select("Item", [Condition("Code", "=", "C0")]), [])
+
+
+class TestRowCache(StorageManagerTestCase):
+
+    def test_pk_lookup_cached_and_invalidated(self):
+        self.create_student_table(50)
+        sm = self.storage_manager
+        by_id = lambda i: self.select("Student", [Condition("StudentID", "=", i)])
+
+        self.assertEqual(by_id(7)[0]["Name"], "Student7")
+        self.assertEqual(by_id("7")[0]["Name"], "Student7")
+        self.assertEqual(sm.last_access_path["method"], "row_cache")
+        self.assertEqual(self.select("Student", [Condition("StudentID", "=", 7)], ["Name"]), [{"Name": "Student7"}])
+        self.assertEqual(by_id(99), [])
+
+        stats = sm.get_row_cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["size"]), (2, 2, 2))
+        self.assertEqual(stats["hit_ratio"], 0.5)
+
+        # hasil yang dikembalikan boleh diubah pemanggil tanpa merusak cache
+        by_id(7)[0]["Name"] = "dirty"
+        self.assertEqual(by_id(7)[0]["Name"], "Student7")
+
+        sm.write_block(DataWrite("Student", ["Name"], [Condition("StudentID", "=", 7)], {"Name": "Renamed"}))
+        self.assertEqual(by_id(7)[0]["Name"], "Renamed")
+        self.insert("Student", {"StudentID": 99, "Name": "Late", "GPA": 3.0})
+        self.assertEqual(by_id(99)[0]["Name"], "Late")
+        sm.write_block(DataWrite("Student", ["GPA"], [Condition("GPA", ">", 0)], {"GPA": 1.5}))
+        self.assertEqual(by_id(7)[0]["GPA"], 1.5)
+        sm.delete_block(DataDeletion("Student", [Condition("Name", "=", "Late")]))
+        self.assertEqual(by_id(99), [])
+
+        sm.row_cache.resize(2)
+        for i in range(5):
+            by_id(i)
+        self.assertEqual(sm.get_row_cache_stats()["size"], 2)
+        self.assertGreater(sm.get_row_cache_stats()["evictions"], 0)
+
+        # UPDATE yang selesai di antara baca disk dan put: row lama tidak boleh tertinggal di cache
+        read_rows = sm._read_rows
+
+        def read_then_update(*args):
+            rows = read_rows(*args)
+            sm._read_rows = read_rows
+            sm.write_block(DataWrite("Student", ["Name"], [Condition("StudentID", "=", 8)], {"Name": "Raced"}))
+            return rows
+
+        sm.row_cache.clear()
+        sm._read_rows = read_then_update
+        self.assertEqual(by_id(8)[0]["Name"], "Student8")
+        self.assertEqual(by_id(8)[0]["Name"], "Raced")
+        self.assertEqual(self.select("Student", [Condition("Name", "=", "Raced")])[0]["StudentID"], 8)
+
+        disabled = StorageManager(self.test_db_path, row_cache_size=0)
+        self.assertEqual(disabled.read_block(DataRetrieval("Student", "*", [Condition("StudentID", "=", 7)]))[0]["Name"], "Renamed")
+        self.assertEqual(disabled.get_row_cache_stats()["size"], 0)
+
+
+class TestAlterTable(StorageManagerTestCase):
+
+    def rows_by_id(self, table="Student", conditions=None):
+        return {row["StudentID"]: row for row in self.select(table, conditions)}
+
+    def test_add_and_drop_column_without_rewrite(self):
+        self.create_student_table(100)
+        sm = self.storage_manager
+        sm._set_index("Student", "GPA", "btree")
+        table_path = os.path.join(self.test_db_path, "student.dat")
+        with open(table_path, "rb") as f:
+            before = f.read()
+
+        sm.add_column("Student", "Credits", "int", 4, default=20)
+        with open(table_path, "rb") as f:
+            self.assertEqual(f.read(), before)
+        self.assertEqual({row["Credits"] for row in self.select("Student")}, {20})
+        self.assertEqual(len(self.select("Student", [Condition("Credits", "=", 20)])), 100)
+
+        # row yang di-update ditulis ulang dengan layout versi baru
+        sm.write_block(DataWrite("Student", ["Credits"], [Condition("StudentID", "<", 10)], {"Credits": 24}))
+        self.insert("Student", {"StudentID": 100, "Name": "New", "GPA": 3.0, "Credits": 18})
+        self.assertEqual(len(self.select("Student", [Condition("Credits", "=", 24)])), 10)
+        self.assertEqual(self.rows_by_id(conditions=[Condition("Credits", "<", 20)])[100]["Name"], "New")
+        with open(table_path, "rb") as f:
+            page = SlottedPage()
+            page.load(f.read(PAGE_SIZE))
+        self.assertEqual(page.get_version(0), 1)
+        self.assertEqual(page.get_version(page.record_count - 1), 0)
+
+        sm.drop_column("Student", "GPA")
+        self.assertEqual(sm.bplus_tree_index_manager.list_indexes("Student"), [])
+        with self.assertRaises(ValueError):
+            self.select("Student", [Condition("GPA", ">", 0)])
+        with self.assertRaises(ValueError):
+            sm.drop_column("Student", "StudentID")
+
+        # kolom yang di-drop lalu ditambah lagi tidak membawa nilai lama
+        sm.add_column("Student", "GPA", "float", 4)
+        rows = self.rows_by_id()
+        self.assertEqual(set(rows[5]), {"_lsn", "StudentID", "Name", "Credits", "GPA"})
+        self.assertEqual((rows[5]["GPA"], rows[5]["Credits"], rows[50]["Credits"]), (0.0, 24, 20))
+
+        reopened = StorageManager(self.test_db_path)
+        self.assertEqual(reopened.read_block(DataRetrieval("Student", "*", [])), self.select("Student"))
+        self.assertEqual(reopened.schema_manager.get_table_schema("Student").version, 3)
+
+        sm.delete_block(DataDeletion("Student", [Condition("StudentID", "<", 90)]))
+        sm.vacuum_table("Student", full=True)
+        self.assertEqual(sorted(self.rows_by_id()), list(range(90, 101)))
+        self.assertEqual(self.rows_by_id()[95]["Credits"], 20)
+
+    def test_insert_without_added_column_uses_default(self):
+        self.create_student_table(10)
+        sm = self.storage_manager
+        sm.add_column("Student", "Credits", "int", 4, default=7)
+        sm.add_column("Student", "Major", "varchar", 20)
+
+        # INSERT lama yang hanya menyebut kolom awal tetap jalan
+        self.insert("Student", {"StudentID": 10, "Name": "Late", "GPA": 3.0})
+        row = self.rows_by_id()[10]
+        self.assertEqual((row["Name"], row["Credits"], row["Major"]), ("Late", 7, ""))
+        self.assertEqual(len(self.select("Student", [Condition("Credits", "=", 7)])), 11)
+
+    def test_lsm_table_is_rewritten(self):
+        self.create_student_table(30)
+        sm = self.storage_manager
+        sm.set_table_engine("Student", "lsm")
+        sm.add_column("Student", "Major", "varchar", 10, default="CS")
+        self.assertEqual({row["Major"] for row in self.select("Student")}, {"CS"})
+        self.assertEqual(self.select("Student", [Condition("StudentID", "=", 3)])[0]["Major"], "CS")
+        sm.set_table_engine("Student", "heap")
+        self.assertEqual(len(self.select("Student", [Condition("Major", "=", "CS")])), 30)
+
+
+class TestLatches(StorageManagerTestCase):
+
+    def test_rw_latch(self):
+        latch = RWLatch()
+        events = []
+
+        def exclusive():
+            with latch.exclusive():
+                with latch.shared():
+                    events.append("writer")
+
+        with latch.shared():
+            with latch.shared():
+                pass
+            writer = threading.Thread(target=exclusive)
+            writer.start()
+            writer.join(0.1)
+            self.assertEqual(events, [])
+        writer.join(1)
+        self.assertEqual(events, ["writer"])
+        self.assertEqual(latch.waits, 1)
+        with self.assertRaises(RuntimeError):
+            with latch.shared():
+                latch.acquire_exclusive()
+
+    def test_concurrent_writers_and_readers(self):
+        self.create_student_table(0)
+        sm = self.storage_manager
+        sm._set_index("Student", "StudentID", "hash")
+        errors = []
+
+        def write(offset):
+            try:
+                for i in range(offset, 400, 4):
+                    self.insert("Student", {"StudentID": i, "Name": f"Student{i}", "GPA": 3.0})
+                sm.write_block(DataWrite("Student", ["GPA"], [Condition("StudentID", "=", offset)], {"GPA": 1.0}))
+            except Exception as e:
+                errors.append(e)
+
+        def read():
+            try:
+                for i in range(100):
+                    for row in self.select("Student", [Condition("StudentID", "=", i)]):
+                        self.assertEqual(row["Name"], f"Student{i}")
+                    self.select("Student", [Condition("GPA", ">", 2.0)])
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=write, args=(i,)) for i in range(4)]
+        threads += [threading.Thread(target=read) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # tanpa mutex writer per tabel, insert paralel ke page terakhir saling menimpa
+        self.assertEqual(errors, [])
+        self.assertEqual(sorted(row["StudentID"] for row in self.select("Student")), list(range(400)))
+        self.assertEqual(len(self.select("Student", [Condition("GPA", "=", 1.0)])), 4)
+        self.assertEqual(self.select("Student", [Condition("StudentID", "=", 321)])[0]["Name"], "Student321")
+        self.assertGreater(sm.latches.get_stats()["page"]["exclusive"], 0)
+
+
+class TestIOStats(StorageManagerTestCase):
+
+    def test_counters_per_table_and_index(self):
+        self.create_student_table(200)
+        sm = self.storage_manager
+        sm._set_index("Student", "GPA", "btree")
+        num_pages = os.path.getsize(sm._get_table_file_path("Student")) // PAGE_SIZE
+
+        sm.reset_io_stats()
+        self.select("Student")
+        io = sm.get_io_stats("Student")
+        self.assertEqual(io["tables"]["student"]["pages_read"], num_pages)
+        self.assertEqual(io["tables"]["student"]["bytes_read"], num_pages * PAGE_SIZE)
+        self.assertEqual(io["tables"]["student"]["pages_written"], 0)
+
+        self.insert("Student", {"StudentID": 999, "Name": "New", "GPA": 3.9})
+        io = sm.get_io_stats("Student")
+        self.assertEqual(io["tables"]["student"]["pages_written"], 1)
+        index_io = io["indexes"]["student.GPA:btree"]
+        self.assertGreater(index_io["bytes_written"], 0)
+        self.assertEqual(io["total"]["pages_written"], 1 + index_io["pages_written"])
+
+        sm._sync_table("Student")
+        self.assertEqual(sm.get_io_stats()["tables"]["student"]["fsyncs"], 1)
+        self.assertEqual(sm.get_stats("Student").io["tables"]["student"]["fsyncs"], 1)
+
+        fresh = StorageManager(self.test_db_path)
+        fresh.read_block(DataRetrieval("Student", "*", [Condition("GPA", "=", 3.9)]))
+        self.assertGreater(fresh.get_io_stats("Student")["indexes"]["student.GPA:btree"]["pages_read"], 0)
+
+        sm.reset_io_stats("Student")
+        self.assertEqual(sm.get_io_stats("Student")["tables"], {})
+        self.assertEqual(sm.get_io_stats("Student")["total"]["pages_read"], 0)
+
+
+class TestCreateIndex(StorageManagerTestCase):
+
+    def test_concurrent_build_with_writes(self):
+        self.create_student_table(1500)
+        sm = self.storage_manager
+        errors = []
+
+        def write():
+            try:
+                for i in range(1500, 1700):
+                    self.insert("Student", {"StudentID": i, "Name": f"Student{i}", "GPA": 3.0})
+                sm.write_block(DataWrite("Student", ["StudentID"], [Condition("StudentID", "<", 50)], {"StudentID": 5000}))
+                sm.delete_block(DataDeletion("Student", [Condition("StudentID", ">=", 1650), Condition("StudentID", "<", 1700)]))
+            except Exception as e:
+                errors.append(e)
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        sm.create_index("student_id_idx", "Student", "StudentID", "btree", concurrently=True)
+        writer.join()
+        self.assertTrue(sm.wait_for_index("student_id_idx"))
+        self.assertEqual(errors, [])
+
+        # setiap row hidup ada di index, dan RID yang sudah dihapus/diubah tidak tersisa
+        index = sm.bplus_tree_index_manager
+        rows = self.select("Student")
+        self.assertEqual(len(index.search("Student", "StudentID", 5000)), 50)
+        for i in (0, 49, 1660, 1699):
+            self.assertEqual(index.search("Student", "StudentID", i), [])
+        self.assertEqual(index.load_index("Student", "StudentID")["metadata"]["num_entries"], len(rows))
+        self.assertEqual(len(self.select("Student", [Condition("StudentID", "=", 1600)])), 1)
+        self.assertEqual(sm.list_named_indexes("Student")["student_id_idx"]["valid"], True)
+
+    def test_create_and_drop_index(self):
+        self.create_student_table(100)
+        sm = self.storage_manager
+        sm.create_index("student_name_idx", "Student", "Name", "hash")
+        self.assertEqual(len(sm.hash_index_manager.search("Student", "Name", "Student7")), 1)
+        with self.assertRaises(ValueError):
+            sm.create_index("student_name_idx", "Student", "GPA", "btree")
+        with self.assertRaises(ValueError):
+            sm.create_index("gpa_trgm", "Student", "GPA", "trigram")
+
+        sm.drop_index("student_name_idx")
+        self.assertIsNone(sm.hash_index_manager.load_index("Student", "Name"))
+        self.assertEqual(sm.list_named_indexes(), {})
+        self.assertFalse(sm.drop_index("student_name_idx", if_exists=True))
+
+
+class TestWriteBehind(StorageManagerTestCase):
+
+    class FakeRecovery:
+        def __init__(self):
+            self.log_flushes = 0
+
+        def flush_logs_to_disk(self):
+            self.log_flushes += 1
+
+    def setUp(self):
+        super().setUp()
+        self.recovery = self.FakeRecovery()
+        self.storage_manager = StorageManager(self.test_db_path, frm_instance=self.recovery, write_behind=True)
+        # thread background dihentikan supaya isi antrian bisa diperiksa sebelum flush
+        self.storage_manager.page_writer.stop()
+
+    def test_queue_coalesce_and_flush(self):
+        self.create_student_table(0)
+        sm = self.storage_manager
+        sm._set_index("Student", "StudentID", "hash")
+        table_path = sm._get_table_file_path("Student")
+        size_before = os.path.getsize(table_path)
+
+        for i in range(200):
+            sm.write_block(DataWrite("Student", None, [], {"StudentID": i, "Name": f"Student{i}", "GPA": 3.0, "_lsn": i + 1}))
+        sm.write_block(DataWrite("Student", ["GPA"], [Condition("StudentID", "=", 5)], {"GPA": 1.5}))
+
+        # belum ada page yang sampai file, tapi reader melihat isi antrian
+        self.assertEqual(os.path.getsize(table_path), size_before)
+        self.assertEqual(len(self.select("Student")), 200)
+        self.assertEqual(self.select("Student", [Condition("StudentID", "=", 5)])[0]["GPA"], 1.5)
+        stats = sm.get_write_behind_stats()
+        self.assertGreater(stats["coalesced"], 0)
+        self.assertLess(stats["pending"], 200)
+
+        sm.flush_pages()
+        self.assertEqual(self.recovery.log_flushes, 1)
+        self.assertEqual(sm.page_writer.flushed_lsn, 200)
+        self.assertEqual(sm.get_write_behind_stats()["pending"], 0)
+        self.assertEqual(os.path.getsize(table_path), stats["pending"] * PAGE_SIZE)
+
+        # StorageManager baru (tanpa antrian) membaca file dan index yang sama
+        fresh = StorageManager(self.test_db_path)
+        rows = fresh.read_block(DataRetrieval("Student", "*", [Condition("StudentID", "=", 5)]))
+        self.assertEqual(rows[0]["GPA"], 1.5)
+        self.assertEqual(len(fresh.read_block(DataRetrieval("Student", "*", []))), 200)
+        self.assertEqual(len(fresh.hash_index_manager.search("Student", "StudentID", 199)), 1)
+
+
+class TestVectorizedScan(StorageManagerTestCase):
+
+    @unittest.skipIf(vectorized.np is None, "numpy tidak terpasang")
+    def test_matches_row_at_a_time_scan(self):
+        self.create_student_table(600)
+        sm = self.storage_manager
+        sm.write_block(DataWrite("Student", ["GPA"], [Condition("StudentID", "<", 40)], {"GPA": 2.25}))
+        self.select("Student")  # bangun zone map dulu, scan berikutnya lewat jalur vektor
+
+        cases = [
+            [Condition("StudentID", ">=", "550")],
+            [Condition("StudentID", "<>", 7), Condition("GPA", "=", 2.3)],
+            [Condition("GPA", "<", 2.25)],
+            [Condition("GPA", "<=", 2.25), Condition("Name", "LIKE", "Student1%")],
+            [Condition("GPA", ">", 3.85)],
+            [Condition("StudentID", "=", 2.5)],
+        ]
+        for conditions in cases:
+            sm.vectorized_scan = True
+            vector_rows = self.select("Student", conditions)
+            projected = self.select("Student", conditions, ["Name", "GPA"])
+            sm.vectorized_scan = False
+            expected = self.select("Student", conditions)
+            self.assertEqual(vector_rows, expected)
+            self.assertEqual(projected, [{"Name": row["Name"], "GPA": row["GPA"]} for row in expected])
+
+    @unittest.skipIf(vectorized.np is None, "numpy tidak terpasang")
+    def test_float_bounds_follow_decoded_rounding(self):
+        values = vectorized.np.array([2.244, 2.245, 2.2450001, 2.25, -0.0, 0.004, 0.005, 1e9], dtype="=f4")
+        decoded = [round(float(value), 2) for value in values]
+        for op in (">", ">=", "<", "<=", "=", "<>"):
+            for operand in (2.25, 2.24, 0, 0.01, 1e9):
+                mask = vectorized._float_check(op, operand)(values)
+                expected = [vectorized.COMPARATORS[op](value, operand) for value in decoded]
+                self.assertEqual(mask.tolist(), expected, (op, operand))
+
+
+class TestPrewarm(StorageManagerTestCase):
+
+    def test_hot_set_survives_restart(self):
+        self.create_student_table(300)
+        sm = self.storage_manager
+        sm._set_index("Student", "GPA", "hash")
+        self.select("Student", [Condition("Name", "=", "Student250")])
+        for i in (3, 150):
+            self.select("Student", [Condition("StudentID", "=", i)])
+
+        hot_set = sm.save_hot_set()
+        self.assertEqual(sorted(map(tuple, hot_set["rows"])), [("student", 3), ("student", 150)])
+        self.assertIn(["Student", "GPA", "hash"], hot_set["indexes"])
+        page_count = os.path.getsize(sm._get_table_file_path("Student")) // PAGE_SIZE
+        self.assertEqual(hot_set["pages"]["student"], list(range(page_count)))
+
+        restarted = StorageManager(self.test_db_path)
+        progress = restarted.prewarm(background=False, report=None)
+        self.assertEqual(progress["state"], "done")
+        self.assertEqual((progress["pages"], progress["indexes"], progress["rows"]), (page_count, 1, 2))
+        self.assertIn(("Student", "GPA"), restarted.hash_index_manager.loaded_indexes)
+        self.assertEqual(restarted.get_row_cache_stats()["size"], 2)
+        self.assertGreaterEqual(restarted.get_io_stats("Student")["tables"]["student"]["pages_read"], page_count)
+
+        self.assertEqual(restarted.read_block(DataRetrieval("Student", "*", [Condition("StudentID", "=", 150)]))[0]["Name"], "Student150")
+        self.assertEqual(restarted.last_access_path["method"], "row_cache")
+
+    def test_missing_or_corrupt_dump_is_ignored(self):
+        sm = self.storage_manager
+        self.assertEqual(sm.prewarm(background=False, report=None)["state"], "done")
+        with open(sm.prewarmer.path, "w") as f:
+            f.write("{not json")
+        sm.prewarm(background=True, report=None).join()
+        self.assertEqual(sm.get_prewarm_progress()["pages_total"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
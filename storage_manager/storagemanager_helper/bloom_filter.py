@@ -0,0 +1,265 @@
+import hashlib
+import math
+import os
+import struct
+
+DEFAULT_FALSE_POSITIVE_RATE = 0.01
+
+
+class BloomFilter:
+    def __init__(self, num_bits, num_hashes, bits=None):
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.bits = bytearray(bits) if bits is not None else bytearray(num_bits // 8)
+
+    @staticmethod
+    def optimal_size(capacity, false_positive_rate):
+        # m = -n ln p / (ln 2)^2, k = m/n ln 2
+        capacity = max(1, capacity)
+        num_bits = math.ceil(-capacity * math.log(false_positive_rate) / (math.log(2) ** 2))
+        num_bits = max(64, (num_bits + 7) // 8 * 8)
+        num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        return num_bits, num_hashes
+
+    def _positions(self, key):
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1, h2 = struct.unpack('<QQ', digest)
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key):
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def might_contain(self, key):
+        for pos in self._positions(key):
+            if not self.bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+
+class BloomFilterManager:
+    """
+    Bloom filter per kolom per page untuk equality lookup pada kolom tanpa index.
+    Disimpan di samping file tabel ({table}.{column}.bloom). Kalau filter page
+    bilang nilai tidak ada, full scan boleh melewati page itu tanpa decode.
+
+    Seperti zone map, filter diberi stamp file .dat. Filter yang stale tetap
+    terdaftar (file-nya ada) tapi tidak dipakai sampai dibangun ulang.
+    """
+
+    def __init__(self, base_path='data', false_positive_rate=DEFAULT_FALSE_POSITIVE_RATE):
+        self.base_path = base_path
+        self.false_positive_rate = false_positive_rate
+        self.loaded_filters = {}
+
+    def _get_filter_filename(self, table_path, column_name):
+        return f"{os.path.splitext(table_path)[0]}.{column_name}.bloom"
+
+    def _file_stamp(self, table_path):
+        try:
+            st = os.stat(table_path)
+        except OSError:
+            return None
+        return (st.st_size, st.st_mtime_ns)
+
+    def list_filters(self, table_path):
+        directory = os.path.dirname(table_path) or '.'
+        prefix = os.path.basename(os.path.splitext(table_path)[0]) + '.'
+        if not os.path.exists(directory):
+            return []
+
+        columns = []
+        for filename in os.listdir(directory):
+            if filename.startswith(prefix) and filename.endswith('.bloom'):
+                column_name = filename[len(prefix):-6]
+                if column_name and '.' not in column_name:
+                    columns.append(column_name)
+        return sorted(columns)
+
+    def _serialize_filter(self, bloom):
+        size, mtime_ns = bloom['stamp'] if bloom['stamp'] else (0, 0)
+        result = struct.pack('qq', size, mtime_ns)
+        result += struct.pack('d', bloom['false_positive_rate'])
+        result += struct.pack('III', bloom['capacity'], bloom['num_bits'], bloom['num_hashes'])
+        result += struct.pack('I', len(bloom['pages']))
+        for page_id, page_filter in sorted(bloom['pages'].items()):
+            result += struct.pack('I', page_id)
+            result += bytes(page_filter.bits)
+        return result
+
+    def _deserialize_filter(self, data):
+        offset = 0
+        size, mtime_ns = struct.unpack_from('qq', data, offset)
+        offset += 16
+        false_positive_rate = struct.unpack_from('d', data, offset)[0]
+        offset += 8
+        capacity, num_bits, num_hashes = struct.unpack_from('III', data, offset)
+        offset += 12
+        num_pages = struct.unpack_from('I', data, offset)[0]
+        offset += 4
+
+        pages = {}
+        num_bytes = num_bits // 8
+        for _ in range(num_pages):
+            page_id = struct.unpack_from('I', data, offset)[0]
+            offset += 4
+            pages[page_id] = BloomFilter(num_bits, num_hashes, data[offset:offset + num_bytes])
+            offset += num_bytes
+
+        return {
+            'stamp': (size, mtime_ns),
+            'false_positive_rate': false_positive_rate,
+            'capacity': capacity,
+            'num_bits': num_bits,
+            'num_hashes': num_hashes,
+            'pages': pages,
+            'dirty': False,
+        }
+
+    def load_filter(self, table_path, column_name):
+        key = (table_path, column_name)
+        if key in self.loaded_filters:
+            return self.loaded_filters[key]
+
+        filter_file = self._get_filter_filename(table_path, column_name)
+        if not os.path.exists(filter_file):
+            return None
+        try:
+            with open(filter_file, 'rb') as f:
+                bloom = self._deserialize_filter(f.read())
+        except (OSError, struct.error):
+            return None
+        self.loaded_filters[key] = bloom
+        return bloom
+
+    def get_filters(self, table_path):
+        # return {column: filter} yang stamp-nya masih cocok dengan file tabel
+        stamp = self._file_stamp(table_path)
+        valid = {}
+        for column_name in self.list_filters(table_path):
+            bloom = self.load_filter(table_path, column_name)
+            if bloom is not None and stamp is not None and bloom['stamp'] == stamp:
+                valid[column_name] = bloom
+        return valid
+
+    def get_stale_filters(self, table_path):
+        stamp = self._file_stamp(table_path)
+        stale = []
+        for column_name in self.list_filters(table_path):
+            bloom = self.load_filter(table_path, column_name)
+            if bloom is None or bloom['stamp'] != stamp:
+                stale.append(column_name)
+        return stale
+
+    def build_filter(self, table_path, column_name, pages, capacity, false_positive_rate=None):
+        # pages: {page_id: [nilai kolom]}; capacity: perkiraan jumlah row per page (dari statistik)
+        if false_positive_rate is None:
+            previous = self.load_filter(table_path, column_name)
+            false_positive_rate = previous['false_positive_rate'] if previous else self.false_positive_rate
+        if not 0 < false_positive_rate < 1:
+            raise ValueError(f"False positive rate harus di antara 0 dan 1, bukan {false_positive_rate}")
+
+        capacity = max([capacity] + [len(values) for values in pages.values()])
+        num_bits, num_hashes = BloomFilter.optimal_size(capacity, false_positive_rate)
+
+        bloom = {
+            'stamp': self._file_stamp(table_path),
+            'false_positive_rate': false_positive_rate,
+            'capacity': capacity,
+            'num_bits': num_bits,
+            'num_hashes': num_hashes,
+            'pages': {},
+            'dirty': True,
+        }
+        for page_id, values in pages.items():
+            page_filter = BloomFilter(num_bits, num_hashes)
+            for value in values:
+                page_filter.add(bloom_key(value))
+            bloom['pages'][page_id] = page_filter
+
+        self.loaded_filters[(table_path, column_name)] = bloom
+        self.save_filter(table_path, column_name)
+        return bloom
+
+    def add_value(self, blooms, page_id, row):
+        # blooms: hasil get_filters sebelum file tabel ditulis.
+        # dipanggil setelah insert/update (nilai lama tetap di filter, tetap konservatif)
+        for column_name, bloom in blooms.items():
+            if column_name not in row:
+                continue
+            page_filter = bloom['pages'].get(page_id)
+            if page_filter is None:
+                page_filter = BloomFilter(bloom['num_bits'], bloom['num_hashes'])
+                bloom['pages'][page_id] = page_filter
+            page_filter.add(bloom_key(row[column_name]))
+            bloom['dirty'] = True
+
+    def touch(self, table_path, blooms):
+        # stamp ulang filter yang masih valid sebelum StorageManager menulis file tabel
+        stamp = self._file_stamp(table_path)
+        for bloom in blooms.values():
+            bloom['stamp'] = stamp
+            bloom['dirty'] = True
+
+    def page_may_match(self, blooms, page_id, conditions, schema):
+        for cond in conditions:
+            if cond.operation != '=' or cond.column not in blooms:
+                continue
+            page_filter = blooms[cond.column]['pages'].get(page_id)
+            if page_filter is None:
+                continue
+            operand = _coerce_operand(schema, cond.column, cond.operand)
+            if not page_filter.might_contain(bloom_key(operand)):
+                return False
+        return True
+
+    def save_filter(self, table_path, column_name):
+        bloom = self.loaded_filters.get((table_path, column_name))
+        if bloom is None:
+            return False
+        with open(self._get_filter_filename(table_path, column_name), 'wb') as f:
+            f.write(self._serialize_filter(bloom))
+        bloom['dirty'] = False
+        return True
+
+    def save_all(self):
+        for (table_path, column_name), bloom in list(self.loaded_filters.items()):
+            if bloom['dirty']:
+                self.save_filter(table_path, column_name)
+
+    def drop_filter(self, table_path, column_name):
+        self.loaded_filters.pop((table_path, column_name), None)
+        filter_file = self._get_filter_filename(table_path, column_name)
+        if os.path.exists(filter_file):
+            os.remove(filter_file)
+        return True
+
+    def drop_filters(self, table_path):
+        for column_name in self.list_filters(table_path):
+            self.drop_filter(table_path, column_name)
+
+
+def bloom_key(value):
+    # samakan dengan StorageManager._match: 5, 5.0 dan "5" untuk kolom angka dianggap sama
+    if isinstance(value, bool):
+        value = int(value)
+    if isinstance(value, (int, float)):
+        if float(value).is_integer():
+            return f"n:{int(value)}"
+        return f"n:{float(value)!r}"
+    if value is None:
+        return "null"
+    return f"s:{value}"
+
+
+def _coerce_operand(schema, column_name, operand):
+    try:
+        attr_type = schema.get_attribute(column_name)['type']
+    except ValueError:
+        return operand
+    if attr_type in ('int', 'float') and isinstance(operand, str):
+        s = operand.strip()
+        if s.replace('.', '', 1).lstrip('+-').isdigit():
+            return float(s) if '.' in s else int(s)
+    return operand
@@ -1,7 +1,25 @@
 import os
 import struct
+import time
 from storagemanager_model.index import HashIndexEntry ,BPlusTreeNode, BPlusTreeIndexEntry
-from storagemanager_helper.slotted_page import PAGE_SIZE, SlottedPage
+from storagemanager_helper.like import trigrams, like_trigrams
+from storagemanager_helper.io_stats import IOStats
+
+
+def _read_index_file(io_stats, key, index_file):
+    start = time.perf_counter()
+    with open(index_file, 'rb') as f:
+        data = f.read()
+    io_stats.record_read(key, len(data), time.perf_counter() - start)
+    return data
+
+
+def _write_index_file(io_stats, key, index_file, data):
+    start = time.perf_counter()
+    with open(index_file, 'wb') as f:
+        f.write(data)
+    io_stats.record_write(key, len(data), time.perf_counter() - start)
+
 
 class HashIndexManager:
     def __init__(self, base_path='data'):
@@ -12,6 +30,7 @@ class HashIndexManager:
             os.makedirs(self.index_path)
         
         self.loaded_indexes = {}
+        self.io_stats = IOStats()  # key (tabel, kolom), I/O file .idx
     
     def _get_index_filename(self, table_name, column_name):
         return os.path.join(self.index_path, f"{table_name}_{column_name}_hash.idx")
@@ -167,8 +186,7 @@ class HashIndexManager:
         }
         
         index_file = self._get_index_filename(table_name, column_name)
-        with open(index_file, 'wb') as f:
-            f.write(self._serialize_index(index_data))
+        _write_index_file(self.io_stats, (table_name, column_name), index_file, self._serialize_index(index_data))
         
         self.loaded_indexes[(table_name, column_name)] = index_data
         
@@ -183,8 +201,7 @@ class HashIndexManager:
         if not os.path.exists(index_file):
             return None
         
-        with open(index_file, 'rb') as f:
-            data = f.read()
+        data = _read_index_file(self.io_stats, cache_key, index_file)
         
         index_data = self._deserialize_index(data)
   
@@ -263,8 +280,7 @@ class HashIndexManager:
             return False
         
         index_file = self._get_index_filename(table_name, column_name)
-        with open(index_file, 'wb') as f:
-            f.write(self._serialize_index(index_data))
+        _write_index_file(self.io_stats, (table_name, column_name), index_file, self._serialize_index(index_data))
         
         return True
     
@@ -287,7 +303,7 @@ class HashIndexManager:
         
         self.create_index(table_name, column_name)
         
-        schema = storage_manager.schema_manager.get_table_schema(table_name)
+        schema = storage_manager._get_table_schema(table_name)
         if schema is None:
             raise ValueError(f"Table {table_name} not found")
         
@@ -295,34 +311,22 @@ class HashIndexManager:
         if column_name not in schema_attrs:
             raise ValueError(f"Column {column_name} not found in {table_name}")
         
-        table_path = os.path.join(storage_manager.base_path, f"{table_name}.dat")
+        table_path = storage_manager._get_table_file_path(table_name)
         if not os.path.exists(table_path):
             return True  
         
-        page_id = 0
-        with open(table_path, "rb") as f:
-            while True:
-                page_bytes = f.read(PAGE_SIZE)
-                if not page_bytes:
-                    break
-                
-                if len(page_bytes) < PAGE_SIZE:
-                    page_bytes = page_bytes.ljust(PAGE_SIZE, b"\x00")
-                
-                page = SlottedPage()
-                page.load(page_bytes)
-                
-                for slot_id in range(page.record_count):
+        with storage_manager._open_table(table_path, "rb") as f:
+            for page_id, page, slot_ids in storage_manager._iter_target_pages(f):
+                for slot_id in slot_ids:
                     try:
-                        record_bytes = page.get_record(slot_id)
-                        row = storage_manager.row_serializer.deserialize(schema, record_bytes)
+                        row = storage_manager._decode_slot(schema, page, slot_id)
                         
+                        # row pindahan di-index dengan RID asalnya
+                        home_page_id, home_slot_id = page.get_home(slot_id) or (page_id, slot_id)
                         key_value = row.get(column_name)
-                        self.insert_entry(table_name, column_name, key_value, page_id, slot_id)
+                        self.insert_entry(table_name, column_name, key_value, home_page_id, home_slot_id)
                     except Exception as e:
                         print(f"Warning: Failed to index record at page {page_id}, slot {slot_id}: {e}")
-                
-                page_id += 1
         
         self.save_index(table_name, column_name)
         
@@ -390,6 +394,7 @@ class BPlusTreeIndexManager:
             os.makedirs(self.index_path)
         
         self.loaded_indexes = {}
+        self.io_stats = IOStats()  # key (tabel, kolom), I/O file .idx
     
     def _get_index_filename(self, table_name, column_name):
         return os.path.join(self.index_path, f"{table_name}_{column_name}_btree.idx")
@@ -610,8 +615,7 @@ class BPlusTreeIndexManager:
         }
         
         index_file = self._get_index_filename(table_name, column_name)
-        with open(index_file, 'wb') as f:
-            f.write(self._serialize_index(index_data))
+        _write_index_file(self.io_stats, (table_name, column_name), index_file, self._serialize_index(index_data))
         
         self.loaded_indexes[(table_name, column_name)] = index_data
         
@@ -626,8 +630,7 @@ class BPlusTreeIndexManager:
         if not os.path.exists(index_file):
             return None
         
-        with open(index_file, 'rb') as f:
-            data = f.read()
+        data = _read_index_file(self.io_stats, cache_key, index_file)
         
         index_data = self._deserialize_index(data)
         self.loaded_indexes[cache_key] = index_data
@@ -644,6 +647,18 @@ class BPlusTreeIndexManager:
         
         return self._find_leaf(node.children[i], key)
     
+    def _find_first_leaf(self, node, key):
+        # key duplikat bisa tersebar di beberapa leaf, jadi turun ke leaf paling kiri
+        # yang mungkin berisi key lalu jalan lewat next_leaf
+        if node.is_leaf:
+            return node
+        
+        i = 0
+        while i < len(node.keys) and self._compare_keys(key, node.keys[i]) > 0:
+            i += 1
+        
+        return self._find_first_leaf(node.children[i], key)
+    
     def _insert_in_leaf(self, leaf, key, page_id, slot_id):
         i = 0
         while i < len(leaf.keys) and self._compare_keys(key, leaf.keys[i]) > 0:
@@ -693,11 +708,11 @@ class BPlusTreeIndexManager:
             return new_root
         
         parent = left.parent
-        
-        i = 0
-        while i < len(parent.keys) and self._compare_keys(key, parent.keys[i]) > 0:
-            i += 1
-        
+
+        # posisi diambil dari letak child yang di-split, bukan perbandingan key:
+        # dengan key duplikat separator bisa sama dengan separator lain
+        i = parent.children.index(left)
+
         parent.keys.insert(i, key)
         parent.children.insert(i + 1, right)
         right.parent = parent
@@ -738,12 +753,16 @@ class BPlusTreeIndexManager:
             return []
         
         root = index_data['root']
-        leaf = self._find_leaf(root, key_value)
+        leaf = self._find_first_leaf(root, key_value)
         
         results = []
-        for i, key in enumerate(leaf.keys):
-            if key == key_value:
-                results.append(leaf.values[i])
+        while leaf is not None:
+            for i, key in enumerate(leaf.keys):
+                if key == key_value:
+                    results.append(leaf.values[i])
+                elif self._compare_keys(key, key_value) > 0:
+                    return results
+            leaf = leaf.next_leaf
         
         return results
     
@@ -753,7 +772,7 @@ class BPlusTreeIndexManager:
             return []
         
         root = index_data['root']
-        leaf = self._find_leaf(root, start_key)
+        leaf = self._find_first_leaf(root, start_key)
         
         results = []
         
@@ -768,20 +787,42 @@ class BPlusTreeIndexManager:
         
         return results
     
+    def scan_entries(self, table_name, column_name):
+        # semua (key, (page_id, slot_id)) urut key: turun ke leaf paling kiri lalu jalan lewat next_leaf.
+        # None kalau index tidak ada
+        index_data = self.load_index(table_name, column_name)
+        if index_data is None:
+            return None
+
+        leaf = index_data['root']
+        while not leaf.is_leaf:
+            leaf = leaf.children[0]
+
+        results = []
+        while leaf is not None:
+            results.extend(zip(leaf.keys, leaf.values))
+            leaf = leaf.next_leaf
+
+        return results
+
     def delete_entry(self, table_name, column_name, key_value, page_id, slot_id):
         index_data = self.load_index(table_name, column_name)
         if index_data is None:
             return False
         
         root = index_data['root']
-        leaf = self._find_leaf(root, key_value)
+        leaf = self._find_first_leaf(root, key_value)
         
-        for i, (key, (p_id, s_id)) in enumerate(zip(leaf.keys, leaf.values)):
-            if key == key_value and p_id == page_id and s_id == slot_id:
-                leaf.keys.pop(i)
-                leaf.values.pop(i)
-                index_data['metadata']['num_entries'] -= 1
-                return True
+        while leaf is not None:
+            for i, (key, (p_id, s_id)) in enumerate(zip(leaf.keys, leaf.values)):
+                if key == key_value and p_id == page_id and s_id == slot_id:
+                    leaf.keys.pop(i)
+                    leaf.values.pop(i)
+                    index_data['metadata']['num_entries'] -= 1
+                    return True
+                if self._compare_keys(key, key_value) > 0:
+                    return False
+            leaf = leaf.next_leaf
         
         return False
     
@@ -796,8 +837,7 @@ class BPlusTreeIndexManager:
             return False
         
         index_file = self._get_index_filename(table_name, column_name)
-        with open(index_file, 'wb') as f:
-            f.write(self._serialize_index(index_data))
+        _write_index_file(self.io_stats, (table_name, column_name), index_file, self._serialize_index(index_data))
         
         return True
     
@@ -817,7 +857,7 @@ class BPlusTreeIndexManager:
         self.drop_index(table_name, column_name)
         self.create_index(table_name, column_name, order)
         
-        schema = storage_manager.schema_manager.get_table_schema(table_name)
+        schema = storage_manager._get_table_schema(table_name)
         if schema is None:
             raise ValueError(f"Table {table_name} not found")
         
@@ -825,34 +865,21 @@ class BPlusTreeIndexManager:
         if column_name not in schema_attrs:
             raise ValueError(f"Column {column_name} not found in {table_name}")
         
-        table_path = os.path.join(storage_manager.base_path, f"{table_name}.dat")
+        table_path = storage_manager._get_table_file_path(table_name)
         if not os.path.exists(table_path):
             return True
         
-        page_id = 0
-        with open(table_path, "rb") as f:
-            while True:
-                page_bytes = f.read(PAGE_SIZE)
-                if not page_bytes:
-                    break
-                
-                if len(page_bytes) < PAGE_SIZE:
-                    page_bytes = page_bytes.ljust(PAGE_SIZE, b"\x00")
-                
-                page = SlottedPage()
-                page.load(page_bytes)
-                
-                for slot_id in range(page.record_count):
+        with storage_manager._open_table(table_path, "rb") as f:
+            for page_id, page, slot_ids in storage_manager._iter_target_pages(f):
+                for slot_id in slot_ids:
                     try:
-                        record_bytes = page.get_record(slot_id)
-                        record = storage_manager.row_serializer.deserialize(schema, record_bytes)
+                        record = storage_manager._decode_slot(schema, page, slot_id)
                         key_value = record.get(column_name)
                         
-                        self.insert_entry(table_name, column_name, key_value, page_id, slot_id)
+                        home_page_id, home_slot_id = page.get_home(slot_id) or (page_id, slot_id)
+                        self.insert_entry(table_name, column_name, key_value, home_page_id, home_slot_id)
                     except Exception as e:
                         continue
-                
-                page_id += 1
         
         self.save_index(table_name, column_name)
         
@@ -933,4 +960,250 @@ class BPlusTreeIndexManager:
                             'type': 'btree'
                         })
         
-        return indexes
\ No newline at end of file
+        return indexes
+
+
+class TrigramIndexManager:
+    """
+    Inverted index untuk LIKE substring/infix ('%database%') pada kolom varchar.
+    Setiap trigram (substring 3 karakter) menunjuk posting list RID row yang
+    mengandungnya. Kandidat LIKE = irisan posting list semua trigram dari
+    potongan literal pola; pola tetap dicek ulang pada row kandidat.
+    """
+
+    def __init__(self, base_path='data'):
+        self.base_path = base_path
+        self.index_path = os.path.join(base_path, 'indexes')
+
+        if not os.path.exists(self.index_path):
+            os.makedirs(self.index_path)
+
+        self.loaded_indexes = {}
+        self.io_stats = IOStats()  # key (tabel, kolom), I/O file .idx
+
+    def _get_index_filename(self, table_name, column_name):
+        return os.path.join(self.index_path, f"{table_name}_{column_name}_trigram.idx")
+
+    def _serialize_index(self, index_data):
+        metadata = index_data['metadata']
+
+        table_bytes = metadata['table'].encode('utf-8')
+        column_bytes = metadata['column'].encode('utf-8')
+
+        result = struct.pack('I', len(table_bytes))
+        result += table_bytes
+        result += struct.pack('I', len(column_bytes))
+        result += column_bytes
+        result += struct.pack('I', metadata['num_entries'])
+
+        for gram, postings in index_data['postings'].items():
+            if not postings:
+                continue
+            gram_bytes = gram.encode('utf-8')
+            result += struct.pack('I', len(gram_bytes))
+            result += gram_bytes
+            result += struct.pack('I', len(postings))
+            for page_id, slot_id in sorted(postings):
+                result += struct.pack('II', page_id, slot_id)
+
+        return result
+
+    def _deserialize_index(self, data):
+        offset = 0
+
+        table_len = struct.unpack_from('I', data, offset)[0]
+        offset += 4
+        table_name = data[offset:offset + table_len].decode('utf-8')
+        offset += table_len
+
+        column_len = struct.unpack_from('I', data, offset)[0]
+        offset += 4
+        column_name = data[offset:offset + column_len].decode('utf-8')
+        offset += column_len
+
+        num_entries = struct.unpack_from('I', data, offset)[0]
+        offset += 4
+
+        postings = {}
+        while offset < len(data):
+            gram_len = struct.unpack_from('I', data, offset)[0]
+            offset += 4
+            gram = data[offset:offset + gram_len].decode('utf-8')
+            offset += gram_len
+
+            count = struct.unpack_from('I', data, offset)[0]
+            offset += 4
+            postings[gram] = {struct.unpack_from('II', data, offset + i * 8) for i in range(count)}
+            offset += count * 8
+
+        metadata = {
+            'table': table_name,
+            'column': column_name,
+            'index_type': 'trigram',
+            'num_entries': num_entries
+        }
+        return {'metadata': metadata, 'postings': postings}
+
+    def create_index(self, table_name, column_name):
+        index_data = {
+            'metadata': {
+                'table': table_name,
+                'column': column_name,
+                'index_type': 'trigram',
+                'num_entries': 0
+            },
+            'postings': {}
+        }
+
+        _write_index_file(
+            self.io_stats, (table_name, column_name),
+            self._get_index_filename(table_name, column_name), self._serialize_index(index_data)
+        )
+
+        self.loaded_indexes[(table_name, column_name)] = index_data
+        return True
+
+    def load_index(self, table_name, column_name):
+        cache_key = (table_name, column_name)
+        if cache_key in self.loaded_indexes:
+            return self.loaded_indexes[cache_key]
+
+        index_file = self._get_index_filename(table_name, column_name)
+        if not os.path.exists(index_file):
+            return None
+
+        index_data = self._deserialize_index(_read_index_file(self.io_stats, cache_key, index_file))
+
+        self.loaded_indexes[cache_key] = index_data
+        return index_data
+
+    def insert_entry(self, table_name, column_name, key_value, page_id, slot_id):
+        index_data = self.load_index(table_name, column_name)
+        if index_data is None:
+            raise ValueError(f"Index on {table_name}.{column_name} does not exist")
+
+        for gram in trigrams(key_value):
+            index_data['postings'].setdefault(gram, set()).add((page_id, slot_id))
+        index_data['metadata']['num_entries'] += 1
+        return True
+
+    def delete_entry(self, table_name, column_name, key_value, page_id, slot_id):
+        index_data = self.load_index(table_name, column_name)
+        if index_data is None:
+            return False
+
+        for gram in trigrams(key_value):
+            postings = index_data['postings'].get(gram)
+            if postings is None:
+                continue
+            postings.discard((page_id, slot_id))
+            if not postings:
+                del index_data['postings'][gram]
+        index_data['metadata']['num_entries'] -= 1
+        return True
+
+    def update_entry(self, table_name, column_name, old_key, new_key, page_id, slot_id):
+        self.delete_entry(table_name, column_name, old_key, page_id, slot_id)
+        self.insert_entry(table_name, column_name, new_key, page_id, slot_id)
+        return True
+
+    def search_pattern(self, table_name, column_name, pattern):
+        # return RID kandidat untuk pola LIKE, atau None kalau pola tidak punya trigram
+        # (misal 'ab%') sehingga index tidak bisa mempersempit pencarian
+        index_data = self.load_index(table_name, column_name)
+        if index_data is None:
+            return None
+
+        grams = like_trigrams(pattern)
+        if not grams:
+            return None
+
+        # mulai dari posting list terpendek supaya irisan cepat mengecil
+        posting_lists = sorted((index_data['postings'].get(gram, set()) for gram in grams), key=len)
+        candidates = set(posting_lists[0])
+        for postings in posting_lists[1:]:
+            if not candidates:
+                break
+            candidates &= postings
+        return sorted(candidates)
+
+    def save_index(self, table_name, column_name):
+        index_data = self.loaded_indexes.get((table_name, column_name))
+        if index_data is None:
+            return False
+
+        _write_index_file(
+            self.io_stats, (table_name, column_name),
+            self._get_index_filename(table_name, column_name), self._serialize_index(index_data)
+        )
+        return True
+
+    def drop_index(self, table_name, column_name):
+        index_file = self._get_index_filename(table_name, column_name)
+        if os.path.exists(index_file):
+            os.remove(index_file)
+
+        self.loaded_indexes.pop((table_name, column_name), None)
+        return True
+
+    def rebuild_index(self, table_name, column_name, storage_manager):
+        self.drop_index(table_name, column_name)
+        self.create_index(table_name, column_name)
+
+        schema = storage_manager._get_table_schema(table_name)
+        if schema is None:
+            raise ValueError(f"Table {table_name} not found")
+
+        schema_attrs = [attr["name"] for attr in schema.get_attributes()]
+        if column_name not in schema_attrs:
+            raise ValueError(f"Column {column_name} not found in {table_name}")
+
+        table_path = storage_manager._get_table_file_path(table_name)
+        if not os.path.exists(table_path):
+            return True
+
+        with storage_manager._open_table(table_path, "rb") as f:
+            for page_id, page, slot_ids in storage_manager._iter_target_pages(f):
+                for slot_id in slot_ids:
+                    record = storage_manager._decode_slot(schema, page, slot_id)
+                    home_page_id, home_slot_id = page.get_home(slot_id) or (page_id, slot_id)
+                    self.insert_entry(table_name, column_name, record.get(column_name), home_page_id, home_slot_id)
+
+        self.save_index(table_name, column_name)
+        return True
+
+    def get_index_stats(self, table_name, column_name):
+        index_data = self.load_index(table_name, column_name)
+        if index_data is None:
+            return None
+
+        metadata = index_data['metadata']
+        postings = index_data['postings']
+        total_postings = sum(len(rids) for rids in postings.values())
+
+        return {
+            'table': metadata['table'],
+            'column': metadata['column'],
+            'index_type': 'trigram',
+            'num_entries': metadata['num_entries'],
+            'num_trigrams': len(postings),
+            'avg_posting_length': total_postings / len(postings) if postings else 0
+        }
+
+    def list_indexes(self, table_name=None):
+        indexes = []
+
+        if not os.path.exists(self.index_path):
+            return indexes
+
+        for filename in os.listdir(self.index_path):
+            if filename.endswith('_trigram.idx'):
+                parts = filename[:-12].rsplit('_', 1)
+                if len(parts) >= 2 and (table_name is None or parts[0] == table_name):
+                    indexes.append({
+                        'table': parts[0],
+                        'column': parts[1],
+                        'type': 'trigram'
+                    })
+
+        return indexes
@@ -0,0 +1,45 @@
+import threading
+
+INDEX_BUILD_TYPES = ('hash', 'btree', 'trigram')
+INDEX_BUILD_BATCH = 64  # jumlah page per batch scan; latch tabel dilepas di antara batch
+
+
+class IndexBuild:
+    """
+    Satu CREATE INDEX CONCURRENTLY pada satu unit fisik (tabel atau partisi).
+
+    Index dibangun dari snapshot hasil scan (RID asal -> key) tanpa terlihat
+    oleh reader/writer lain. Selama scan, setiap perubahan index dari DML
+    dicatat ke side log sebagai operasi absolut per RID (set key / hapus),
+    jadi urutan scan terhadap tulisan tidak penting: memutar ulang seluruh
+    log di atas snapshot selalu menghasilkan isi tabel terbaru. Log terakhir
+    diputar di bawah mutex writer tabel lalu index dipasang.
+    """
+
+    def __init__(self, name, table, column, index_type, table_path):
+        self.name = name
+        self.table = table
+        self.column = column
+        self.index_type = index_type
+        self.table_path = table_path
+        self.entries = {}  # RID asal -> key
+        self.aborted = None  # alasan pembatalan (tabel ditulis ulang, index di-drop)
+        self._log = []
+        self._lock = threading.Lock()
+
+    def record(self, rid, row):
+        # dipanggil writer (sudah memegang mutex writer tabel); row None = RID dihapus
+        with self._lock:
+            self._log.append((rid, row is None, None if row is None else row.get(self.column)))
+
+    def drain(self):
+        with self._lock:
+            ops, self._log = self._log, []
+        return ops
+
+    def pending(self):
+        with self._lock:
+            return len(self._log)
+
+    def abort(self, reason):
+        self.aborted = reason
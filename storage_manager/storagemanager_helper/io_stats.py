@@ -0,0 +1,62 @@
+import math
+import threading
+
+from .slotted_page import PAGE_SIZE
+
+IO_FIELDS = ('pages_read', 'pages_written', 'bytes_read', 'bytes_written', 'fsyncs',
+             'read_time', 'write_time', 'fsync_time')
+
+
+class IOStats:
+    # counter I/O kumulatif per objek (nama tabel, atau (tabel, kolom) untuk index).
+    # waktu dalam detik; pages dihitung dari byte kalau caller tidak memberi jumlah page.
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+
+    def _entry(self, name):
+        entry = self._counters.get(name)
+        if entry is None:
+            entry = self._counters[name] = dict.fromkeys(IO_FIELDS, 0)
+        return entry
+
+    def record_read(self, name, nbytes, elapsed, pages=None):
+        with self._lock:
+            entry = self._entry(name)
+            entry['pages_read'] += math.ceil(nbytes / PAGE_SIZE) if pages is None else pages
+            entry['bytes_read'] += nbytes
+            entry['read_time'] += elapsed
+
+    def record_write(self, name, nbytes, elapsed, pages=None):
+        with self._lock:
+            entry = self._entry(name)
+            entry['pages_written'] += math.ceil(nbytes / PAGE_SIZE) if pages is None else pages
+            entry['bytes_written'] += nbytes
+            entry['write_time'] += elapsed
+
+    def record_fsync(self, name, elapsed):
+        with self._lock:
+            entry = self._entry(name)
+            entry['fsyncs'] += 1
+            entry['fsync_time'] += elapsed
+
+    def get(self, name):
+        with self._lock:
+            entry = self._counters.get(name)
+            return self._format(entry) if entry is not None else self._format(dict.fromkeys(IO_FIELDS, 0))
+
+    def snapshot(self):
+        with self._lock:
+            return {name: self._format(entry) for name, entry in self._counters.items()}
+
+    def reset(self, name=None):
+        # name None = semua counter
+        with self._lock:
+            if name is None:
+                self._counters.clear()
+            else:
+                self._counters.pop(name, None)
+
+    def _format(self, entry):
+        return {field: round(value, 6) if field.endswith('_time') else value for field, value in entry.items()}
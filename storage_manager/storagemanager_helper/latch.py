@@ -0,0 +1,149 @@
+import os
+import threading
+from contextlib import contextmanager
+
+PAGE_LATCH_STRIPES = 1024  # latch page dibagi ke sejumlah stripe tetap, bukan satu objek per page
+
+
+class RWLatch:
+    # latch fisik shared/exclusive (bukan lock logis milik CCM), dipegang singkat selama akses struktur.
+    # reentrant untuk thread yang sama: pemegang exclusive boleh ambil shared/exclusive lagi.
+    # writer diprioritaskan supaya reader yang terus berdatangan tidak membuat writer menunggu selamanya.
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = {}  # thread id -> kedalaman shared
+        self._writer = None
+        self._writer_depth = 0
+        self._writers_waiting = 0
+        self.shared_acquired = 0
+        self.exclusive_acquired = 0
+        self.waits = 0
+
+    def acquire_shared(self):
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me or me in self._readers:
+                self._readers[me] = self._readers.get(me, 0) + 1
+                return
+            if self._writer is not None or self._writers_waiting:
+                self.waits += 1
+                while self._writer is not None or self._writers_waiting:
+                    self._cond.wait()
+            self._readers[me] = 1
+            self.shared_acquired += 1
+
+    def release_shared(self):
+        me = threading.get_ident()
+        with self._cond:
+            depth = self._readers[me] - 1
+            if depth:
+                self._readers[me] = depth
+                return
+            del self._readers[me]
+            if not self._readers:
+                self._cond.notify_all()
+
+    def acquire_exclusive(self):
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._writer_depth += 1
+                return
+            if me in self._readers:
+                raise RuntimeError("Upgrade latch shared ke exclusive tidak didukung")
+            if self._writer is not None or self._readers:
+                self.waits += 1
+                self._writers_waiting += 1
+                try:
+                    while self._writer is not None or self._readers:
+                        self._cond.wait()
+                finally:
+                    self._writers_waiting -= 1
+            self._writer = me
+            self._writer_depth = 1
+            self.exclusive_acquired += 1
+
+    def release_exclusive(self):
+        with self._cond:
+            self._writer_depth -= 1
+            if self._writer_depth == 0:
+                self._writer = None
+                self._cond.notify_all()
+
+    @contextmanager
+    def shared(self):
+        self.acquire_shared()
+        try:
+            yield self
+        finally:
+            self.release_shared()
+
+    @contextmanager
+    def exclusive(self):
+        self.acquire_exclusive()
+        try:
+            yield self
+        finally:
+            self.release_exclusive()
+
+
+class LatchManager:
+    # latch per file tabel dan per page untuk server multi-thread yang berbagi satu StorageManager.
+    # - table: shared untuk read/insert/update/delete, exclusive untuk rewrite seluruh file
+    #   (cluster, ganti engine, partisi, vacuum, rebuild index)
+    # - writer: mutex per tabel, DML pada tabel yang sama berjalan satu per satu
+    # - index: shared saat mencari RID lewat index, exclusive saat struktur index diubah
+    # - page: shared selama satu page dibaca dari disk, exclusive selama page ditulis
+
+    def __init__(self, page_stripes=PAGE_LATCH_STRIPES):
+        self._lock = threading.Lock()
+        self._tables = {}
+        self._indexes = {}
+        self._writers = {}
+        self._pages = [RWLatch() for _ in range(max(1, page_stripes))]
+
+    def _key(self, path):
+        return os.path.normcase(os.path.abspath(path))
+
+    def _get(self, latches, path, factory):
+        key = self._key(path)
+        with self._lock:
+            latch = latches.get(key)
+            if latch is None:
+                latch = latches[key] = factory()
+            return latch
+
+    def table(self, path):
+        return self._get(self._tables, path, RWLatch)
+
+    def index(self, path):
+        return self._get(self._indexes, path, RWLatch)
+
+    def writer(self, path):
+        return self._get(self._writers, path, threading.RLock)
+
+    def page(self, path, page_id):
+        return self._pages[hash((self._key(path), page_id)) % len(self._pages)]
+
+    @contextmanager
+    def table_writer(self, path):
+        # DML: tabel shared (tidak bentrok dengan reader) + mutex writer tabel itu
+        with self.table(path).shared(), self.writer(path):
+            yield
+
+    def get_stats(self):
+        with self._lock:
+            groups = {
+                'table': list(self._tables.values()),
+                'index': list(self._indexes.values()),
+                'page': self._pages,
+            }
+        return {
+            name: {
+                'shared': sum(latch.shared_acquired for latch in latches),
+                'exclusive': sum(latch.exclusive_acquired for latch in latches),
+                'waits': sum(latch.waits for latch in latches),
+            }
+            for name, latches in groups.items()
+        }
@@ -0,0 +1,61 @@
+import functools
+import re
+
+# karakter terbesar, batas atas range B+ tree untuk prefix: [prefix, prefix + LIKE_MAX_CHAR]
+LIKE_MAX_CHAR = '\U0010FFFF'
+
+WILDCARDS = ('%', '_')
+
+
+@functools.lru_cache(maxsize=256)
+def like_regex(pattern):
+    # % = nol atau lebih karakter, _ = tepat satu karakter; sisanya literal
+    parts = []
+    for char in str(pattern):
+        if char == '%':
+            parts.append('.*')
+        elif char == '_':
+            parts.append('.')
+        else:
+            parts.append(re.escape(char))
+    return re.compile(''.join(parts), re.DOTALL)
+
+
+def like_match(value, pattern):
+    if value is None or pattern is None:
+        return False
+    return like_regex(str(pattern)).fullmatch(str(value)) is not None
+
+
+def like_prefix(pattern):
+    # bagian literal sebelum wildcard pertama ('' kalau diawali wildcard)
+    pattern = str(pattern)
+    for i, char in enumerate(pattern):
+        if char in WILDCARDS:
+            return pattern[:i]
+    return pattern
+
+
+def like_prefix_range(pattern):
+    # return (start, end) inklusif untuk range scan, atau None kalau tidak ada prefix literal.
+    # row di dalam range tetap harus dicek ulang dengan like_match (residual).
+    prefix = like_prefix(pattern)
+    if not prefix:
+        return None
+    return prefix, prefix + LIKE_MAX_CHAR
+
+
+def trigrams(value):
+    # semua substring 3 karakter (case-sensitive, sama seperti like_match)
+    if value is None:
+        return set()
+    value = str(value)
+    return {value[i:i + 3] for i in range(len(value) - 2)}
+
+
+def like_trigrams(pattern):
+    # trigram yang pasti ada di setiap nilai yang cocok: diambil dari potongan literal di antara wildcard
+    result = set()
+    for segment in re.split(r'[%_]', str(pattern)):
+        result |= trigrams(segment)
+    return result
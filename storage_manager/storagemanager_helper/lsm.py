@@ -0,0 +1,304 @@
+import bisect
+import heapq
+import os
+import re
+import struct
+import threading
+
+from .bloom_filter import BloomFilter, bloom_key, DEFAULT_FALSE_POSITIVE_RATE
+
+MEMTABLE_LIMIT = 256        # jumlah key di memtable sebelum di-flush jadi sorted run
+COMPACTION_TRIGGER = 4      # jumlah sorted run sebelum semuanya di-merge jadi satu
+SPARSE_INTERVAL = 16        # satu entry sparse index untuk setiap 16 key
+
+FOOTER_FORMAT = '<QQI'      # offset sparse index, offset bloom filter, jumlah entry
+FOOTER_SIZE = struct.calcsize(FOOTER_FORMAT)
+
+
+def _pack_key(key):
+    if isinstance(key, bool) or isinstance(key, int):
+        return struct.pack('<Bq', 1, int(key))
+    if isinstance(key, float):
+        return struct.pack('<Bd', 2, key)
+    key_bytes = str(key).encode('utf-8')
+    return struct.pack('<BI', 3, len(key_bytes)) + key_bytes
+
+
+def _unpack_key(data, offset):
+    key_type = data[offset]
+    offset += 1
+    if key_type == 1:
+        return struct.unpack_from('<q', data, offset)[0], offset + 8
+    if key_type == 2:
+        return struct.unpack_from('<d', data, offset)[0], offset + 8
+    length = struct.unpack_from('<I', data, offset)[0]
+    offset += 4
+    return data[offset:offset + length].decode('utf-8'), offset + length
+
+
+def _parse_entries(data):
+    # entry: key, flag (1 = tombstone), panjang record, record
+    entries = []
+    offset = 0
+    while offset < len(data):
+        key, offset = _unpack_key(data, offset)
+        deleted, length = struct.unpack_from('<BI', data, offset)
+        offset += 5
+        entries.append((key, None if deleted else bytes(data[offset:offset + length])))
+        offset += length
+    return entries
+
+
+class SortedRun:
+    """
+    File immutable berisi entry terurut menurut key ({table}.{seq}.sst).
+    Hanya sparse index dan bloom filter yang disimpan di memori; lookup satu
+    key cukup membaca satu blok kecil di antara dua entry sparse index.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.seq = int(path.rsplit('.', 2)[-2])
+
+        with open(path, 'rb') as f:
+            f.seek(-FOOTER_SIZE, os.SEEK_END)
+            footer_offset = f.tell()
+            index_offset, bloom_offset, self.entry_count = struct.unpack(FOOTER_FORMAT, f.read(FOOTER_SIZE))
+            f.seek(index_offset)
+            meta = f.read(footer_offset - index_offset)
+
+        self.data_end = index_offset
+        self.index_keys = []
+        self.index_offsets = []
+        count = struct.unpack_from('<I', meta, 0)[0]
+        offset = 4
+        for _ in range(count):
+            key, offset = _unpack_key(meta, offset)
+            self.index_keys.append(key)
+            self.index_offsets.append(struct.unpack_from('<Q', meta, offset)[0])
+            offset += 8
+
+        offset = bloom_offset - index_offset
+        num_bits, num_hashes = struct.unpack_from('<II', meta, offset)
+        offset += 8
+        self.bloom = BloomFilter(num_bits, num_hashes, meta[offset:offset + num_bits // 8])
+
+    @staticmethod
+    def write(path, entries, false_positive_rate=DEFAULT_FALSE_POSITIVE_RATE):
+        # entries: list (key, record_bytes atau None untuk tombstone), sudah terurut
+        num_bits, num_hashes = BloomFilter.optimal_size(len(entries), false_positive_rate)
+        bloom = BloomFilter(num_bits, num_hashes)
+
+        data = bytearray()
+        sparse = []
+        for i, (key, record_bytes) in enumerate(entries):
+            if i % SPARSE_INTERVAL == 0:
+                sparse.append((key, len(data)))
+            bloom.add(bloom_key(key))
+            data += _pack_key(key)
+            data += struct.pack('<BI', record_bytes is None, len(record_bytes or b''))
+            data += record_bytes or b''
+
+        index_offset = len(data)
+        data += struct.pack('<I', len(sparse))
+        for key, offset in sparse:
+            data += _pack_key(key) + struct.pack('<Q', offset)
+
+        bloom_offset = len(data)
+        data += struct.pack('<II', bloom.num_bits, bloom.num_hashes) + bytes(bloom.bits)
+        data += struct.pack(FOOTER_FORMAT, index_offset, bloom_offset, len(entries))
+
+        # tulis ke file sementara dulu supaya reader tidak pernah melihat run setengah jadi
+        with open(path + '.tmp', 'wb') as f:
+            f.write(data)
+        os.replace(path + '.tmp', path)
+
+    def get(self, key):
+        # return (ditemukan, record_bytes); record_bytes None berarti key sudah dihapus
+        if not self.bloom.might_contain(bloom_key(key)):
+            return False, None
+        i = bisect.bisect_right(self.index_keys, key) - 1
+        if i < 0:
+            return False, None
+
+        start = self.index_offsets[i]
+        end = self.index_offsets[i + 1] if i + 1 < len(self.index_offsets) else self.data_end
+        with open(self.path, 'rb') as f:
+            f.seek(start)
+            block = f.read(end - start)
+
+        for entry_key, record_bytes in _parse_entries(block):
+            if entry_key == key:
+                return True, record_bytes
+            if entry_key > key:
+                break
+        return False, None
+
+    def entries(self):
+        with open(self.path, 'rb') as f:
+            return _parse_entries(f.read(self.data_end))
+
+
+class LSMTree:
+    """
+    Engine log-structured untuk satu tabel (opsi engine = 'lsm').
+
+    Insert/update/delete hanya mengubah memtable (key = kolom pertama schema),
+    tanpa read-modify-write page maupun index. Memtable di-flush menjadi
+    sorted run saat penuh atau saat checkpoint (flush_buffer_to_disk); sebelum
+    itu perubahan dilindungi WAL milik FailureRecoveryManager. Kalau jumlah
+    run mencapai COMPACTION_TRIGGER, run di-merge di thread background.
+
+    Insert dengan key yang sudah ada menimpa row lama (upsert).
+    """
+
+    def __init__(self, table_path, memtable_limit=MEMTABLE_LIMIT, compaction_trigger=COMPACTION_TRIGGER,
+                 background_compaction=True):
+        self.table_path = table_path
+        self.prefix = os.path.splitext(table_path)[0]
+        self.memtable_limit = memtable_limit
+        self.compaction_trigger = compaction_trigger
+        self.background_compaction = background_compaction
+
+        self.memtable = {}
+        self.memtable_keys = []
+        self.lock = threading.RLock()
+        self._compactor = None
+
+        self.runs = [SortedRun(path) for path in self._list_run_files()]
+        self.runs.sort(key=lambda run: run.seq, reverse=True)  # run terbaru di depan
+        self.next_seq = self.runs[0].seq + 1 if self.runs else 1
+
+    def _list_run_files(self):
+        directory = os.path.dirname(self.table_path) or '.'
+        if not os.path.exists(directory):
+            return []
+        pattern = re.compile(re.escape(os.path.basename(self.prefix)) + r'\.(\d+)\.sst$')
+        return [os.path.join(directory, name) for name in os.listdir(directory) if pattern.match(name)]
+
+    def _run_path(self, seq):
+        return f"{self.prefix}.{seq:06d}.sst"
+
+    def put(self, key, record_bytes):
+        if key is None:
+            raise ValueError("Key tabel LSM tidak boleh NULL")
+        with self.lock:
+            if key not in self.memtable:
+                bisect.insort(self.memtable_keys, key)
+            self.memtable[key] = record_bytes
+            full = len(self.memtable) >= self.memtable_limit
+        if full:
+            self.flush()
+
+    def delete(self, key):
+        # tombstone menutupi nilai lama di run yang lebih tua sampai compaction
+        self.put(key, None)
+
+    def get(self, key):
+        with self.lock:
+            if key in self.memtable:
+                return self.memtable[key]
+            for run in self.runs:
+                found, record_bytes = run.get(key)
+                if found:
+                    return record_bytes
+        return None
+
+    def scan(self):
+        # return list (key, record_bytes) terurut, versi terbaru per key, tanpa tombstone
+        with self.lock:
+            sources = [[(key, self.memtable[key]) for key in self.memtable_keys]]
+            sources += [run.entries() for run in self.runs]
+        return [(key, record_bytes) for key, record_bytes in self._merge(sources) if record_bytes is not None]
+
+    def _merge(self, sources):
+        # sources diurutkan dari yang terbaru; untuk key yang sama versi terbaru menang
+        tagged = [[(key, age, record_bytes) for key, record_bytes in source] for age, source in enumerate(sources)]
+        merged = []
+        last_key = object()
+        for key, _, record_bytes in heapq.merge(*tagged, key=lambda entry: (entry[0], entry[1])):
+            if key == last_key:
+                continue
+            last_key = key
+            merged.append((key, record_bytes))
+        return merged
+
+    def flush(self):
+        with self.lock:
+            if not self.memtable:
+                return
+            path = self._run_path(self.next_seq)
+            self.next_seq += 1
+            SortedRun.write(path, [(key, self.memtable[key]) for key in self.memtable_keys])
+            self.runs.insert(0, SortedRun(path))
+            self.memtable = {}
+            self.memtable_keys = []
+        self.maybe_compact()
+
+    def maybe_compact(self):
+        if len(self.runs) < self.compaction_trigger:
+            return
+        if self._compactor is not None and self._compactor.is_alive():
+            return
+        if not self.background_compaction:
+            self.compact()
+            return
+        self._compactor = threading.Thread(target=self.compact, daemon=True)
+        self._compactor.start()
+
+    def compact(self):
+        # merge semua run yang ada saat ini jadi satu; run yang di-flush selama merge tetap lebih baru
+        with self.lock:
+            runs = list(self.runs)
+        if len(runs) < 2:
+            return
+
+        # run tertua ikut di-merge, jadi tombstone tidak perlu disimpan lagi
+        merged = [entry for entry in self._merge([run.entries() for run in runs]) if entry[1] is not None]
+        target = runs[0].path
+        SortedRun.write(target + '.compact', merged)
+
+        with self.lock:
+            os.replace(target + '.compact', target)
+            for run in runs[1:]:
+                os.remove(run.path)
+            self.runs = [run for run in self.runs if run not in runs] + [SortedRun(target)]
+
+    def wait_for_compaction(self):
+        if self._compactor is not None:
+            self._compactor.join()
+
+    def drop(self):
+        self.wait_for_compaction()
+        with self.lock:
+            for path in self._list_run_files():
+                os.remove(path)
+            self.runs = []
+            self.memtable = {}
+            self.memtable_keys = []
+
+
+class LSMManager:
+    def __init__(self, base_path='data', memtable_limit=MEMTABLE_LIMIT, compaction_trigger=COMPACTION_TRIGGER,
+                 background_compaction=True):
+        self.base_path = base_path
+        self.memtable_limit = memtable_limit
+        self.compaction_trigger = compaction_trigger
+        self.background_compaction = background_compaction
+        self.trees = {}
+
+    def get_tree(self, table_path):
+        tree = self.trees.get(table_path)
+        if tree is None:
+            tree = LSMTree(table_path, self.memtable_limit, self.compaction_trigger, self.background_compaction)
+            self.trees[table_path] = tree
+        return tree
+
+    def flush_all(self):
+        for tree in list(self.trees.values()):
+            tree.flush()
+            tree.wait_for_compaction()
+
+    def drop_tree(self, table_path):
+        tree = self.trees.pop(table_path, None) or LSMTree(table_path)
+        tree.drop()
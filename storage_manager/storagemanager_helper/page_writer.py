@@ -0,0 +1,135 @@
+import os
+import threading
+
+WRITE_BEHIND_INTERVAL = 0.05  # detik antar putaran thread writer
+WRITE_BEHIND_MAX_PAGES = 1024  # batas page kotor; lewat batas ini writer DML ikut menulis sendiri
+
+
+class PageWriter:
+    """
+    Antrian write-behind untuk page tabel.
+
+    DML hanya menaruh isi page terbaru di antrian (page yang sama ditimpa,
+    jadi banyak perubahan kecil pada satu page cukup ditulis sekali). Setiap
+    page membawa page LSN = LSN WAL terbesar yang mengubahnya; sebelum page
+    ditulis, WAL sampai LSN itu di-flush dulu. Page tetap ada di antrian
+    sampai benar-benar tertulis, jadi reader selalu melihat versi terbaru
+    lewat get(). Penulisan sendiri dilakukan oleh callback flush_table dari
+    StorageManager (thread background, checkpoint, atau shutdown).
+    """
+
+    def __init__(self, flush_table, interval=WRITE_BEHIND_INTERVAL, max_pages=WRITE_BEHIND_MAX_PAGES):
+        self.flush_table = flush_table
+        self.interval = interval
+        self.max_pages = max_pages
+        self.flushed_lsn = 0  # LSN WAL yang sudah pasti ada di disk
+        self._cond = threading.Condition(threading.Lock())
+        self._pages = {}  # key path -> {page_id: (page_bytes, page_lsn)}
+        self._index_saves = {}  # key path -> {(manager, tabel, kolom)}
+        self._paths = {}  # key path -> path asli untuk dibuka
+        self._stopped = False
+        self.stats = {'queued': 0, 'coalesced': 0, 'written': 0, 'flushes': 0}
+        self._thread = threading.Thread(target=self._run, name="page-writer", daemon=True)
+        self._thread.start()
+
+    def _key(self, path):
+        return os.path.normcase(os.path.abspath(path))
+
+    def put(self, path, page_id, page_bytes, lsn=0):
+        # return jumlah page kotor setelah put, caller boleh flush sendiri kalau melewati max_pages
+        key = self._key(path)
+        with self._cond:
+            pages = self._pages.setdefault(key, {})
+            self._paths[key] = path
+            old = pages.get(page_id)
+            if old is not None:
+                lsn = max(lsn, old[1])
+                self.stats['coalesced'] += 1
+            pages[page_id] = (page_bytes, lsn)
+            self.stats['queued'] += 1
+            return self._pending_locked()
+
+    def save_index_later(self, path, manager, table, column):
+        key = self._key(path)
+        with self._cond:
+            self._index_saves.setdefault(key, set()).add((manager, table, column))
+            self._paths[key] = path
+
+    def get(self, path, page_id):
+        # isi page yang belum tertulis, atau None
+        with self._cond:
+            entry = self._pages.get(self._key(path), {}).get(page_id)
+        return entry[0] if entry is not None else None
+
+    def page_count(self, path):
+        # ujung file logis menurut antrian (page baru bisa belum ada di file)
+        with self._cond:
+            pages = self._pages.get(self._key(path))
+            return max(pages) + 1 if pages else 0
+
+    def pending(self, path):
+        # snapshot [(page_id, page_bytes, lsn)] urut page_id, plus index yang menunggu disimpan
+        key = self._key(path)
+        with self._cond:
+            pages = sorted((page_id, page_bytes, lsn) for page_id, (page_bytes, lsn)
+                           in self._pages.get(key, {}).items())
+            return pages, list(self._index_saves.pop(key, ()))
+
+    def done(self, path, written):
+        # buang page yang sudah tertulis, kecuali sudah diganti versi yang lebih baru
+        key = self._key(path)
+        with self._cond:
+            pages = self._pages.get(key, {})
+            for page_id, page_bytes, _ in written:
+                entry = pages.get(page_id)
+                if entry is not None and entry[0] is page_bytes:
+                    del pages[page_id]
+            if not pages:
+                self._pages.pop(key, None)
+            if key not in self._pages and key not in self._index_saves:
+                self._paths.pop(key, None)
+            self.stats['written'] += len(written)
+            self.stats['flushes'] += 1
+
+    def discard(self, path):
+        # file ditulis ulang utuh atau dihapus: page yang masih antri tidak berlaku lagi
+        key = self._key(path)
+        with self._cond:
+            self._pages.pop(key, None)
+            if key not in self._index_saves:
+                self._paths.pop(key, None)
+
+    def paths(self):
+        with self._cond:
+            return list(self._paths.values())
+
+    def pending_pages(self):
+        with self._cond:
+            return self._pending_locked()
+
+    def _pending_locked(self):
+        return sum(len(pages) for pages in self._pages.values())
+
+    def wake(self):
+        with self._cond:
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if not self._stopped:
+                    self._cond.wait(self.interval)
+                if self._stopped:
+                    return
+            for path in self.paths():
+                try:
+                    self.flush_table(path)
+                except Exception as e:
+                    # page tetap di antrian, dicoba lagi putaran berikutnya
+                    print(f"[SM ERROR] Write-behind flush '{path}' failed: {e}")
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        self._thread.join()
@@ -0,0 +1,103 @@
+import bisect
+import hashlib
+import re
+
+from .bloom_filter import bloom_key
+
+PARTITION_METHODS = ('hash', 'range')
+
+# partisi disimpan sebagai tabel fisik tersembunyi: {table}__p{i}.dat
+_PARTITION_NAME = re.compile(r'^(\w+?)__p(\d+)$')
+
+
+class PartitionScheme:
+    """
+    Aturan partisi satu tabel (opsi 'partition_by' di table_options).
+
+    hash : partisi = hash(nilai kolom) % jumlah partisi
+    range: bounds [b1, ..., bk] terurut membentuk k+1 partisi,
+           p0 = key < b1, p_i = b_i <= key < b_(i+1), p_k = key >= b_k
+
+    Setiap partisi punya file .dat, index, zone map, dan bloom filter sendiri,
+    jadi scan dan vacuum bisa dikerjakan per partisi.
+    """
+
+    def __init__(self, method, column, partitions=None, bounds=None):
+        method = method.lower()
+        if method not in PARTITION_METHODS:
+            raise ValueError(f"Metode partisi '{method}' tidak tersedia.")
+
+        if method == 'hash':
+            if not partitions or int(partitions) < 1:
+                raise ValueError("Jumlah partisi hash harus minimal 1")
+            bounds = None
+            partitions = int(partitions)
+        else:
+            if not bounds:
+                raise ValueError("Partisi range membutuhkan minimal satu batas")
+            bounds = list(bounds)
+            if any(bounds[i] >= bounds[i + 1] for i in range(len(bounds) - 1)):
+                raise ValueError("Batas partisi range harus terurut naik dan unik")
+            partitions = len(bounds) + 1
+
+        self.method = method
+        self.column = column
+        self.num_partitions = partitions
+        self.bounds = bounds
+
+    @classmethod
+    def from_options(cls, options):
+        spec = options.get('partition_by')
+        if spec is None:
+            return None
+        return cls(spec['method'], spec['column'], spec.get('partitions'), spec.get('bounds'))
+
+    def to_option(self):
+        if self.method == 'hash':
+            return {'method': 'hash', 'column': self.column, 'partitions': self.num_partitions}
+        return {'method': 'range', 'column': self.column, 'bounds': self.bounds}
+
+    def partition_names(self, table_name):
+        return [partition_name(table_name, i) for i in range(self.num_partitions)]
+
+    def route(self, key):
+        if self.method == 'hash':
+            # bloom_key menyamakan 5, 5.0 dan "5" seperti perbandingan di StorageManager
+            digest = hashlib.md5(bloom_key(key).encode('utf-8')).digest()
+            return int.from_bytes(digest[:8], 'little') % self.num_partitions
+        if key is None:
+            return 0
+        return bisect.bisect_right(self.bounds, key)
+
+    def prune(self, conditions, coerce=None):
+        # return nomor partisi yang mungkin berisi row untuk kondisi (AND) pada kolom partisi.
+        # coerce(column, operand) menyamakan tipe operand dengan tipe kolom.
+        candidates = set(range(self.num_partitions))
+        for cond in conditions or []:
+            if cond.column != self.column:
+                continue
+            operand = coerce(cond.column, cond.operand) if coerce else cond.operand
+            try:
+                if cond.operation == '=':
+                    candidates &= {self.route(operand)}
+                elif self.method == 'range' and cond.operation in ('>', '>='):
+                    candidates &= set(range(bisect.bisect_right(self.bounds, operand), self.num_partitions))
+                elif self.method == 'range' and cond.operation == '<':
+                    candidates &= set(range(bisect.bisect_left(self.bounds, operand) + 1))
+                elif self.method == 'range' and cond.operation == '<=':
+                    candidates &= set(range(bisect.bisect_right(self.bounds, operand) + 1))
+            except TypeError:
+                continue
+        return sorted(candidates)
+
+
+def partition_name(table_name, partition_id):
+    return f"{table_name}__p{partition_id}"
+
+
+def split_partition_name(name):
+    # return (tabel induk, nomor partisi), atau (None, None) kalau bukan nama partisi
+    match = _PARTITION_NAME.match(name)
+    if match is None:
+        return None, None
+    return match.group(1), int(match.group(2))
@@ -0,0 +1,126 @@
+import operator
+import struct
+
+from .like import like_match
+
+# semua kolom fixed-width: varchar disimpan sebagai 4 byte panjang + max_length byte
+INT_FORMAT = 'i'
+FLOAT_FORMAT = 'f'
+VARCHAR_LENGTH_FORMAT = '<I'
+
+COMPARATORS = {
+    '=': operator.eq,
+    '<>': operator.ne,
+    '!=': operator.ne,
+    '>': operator.gt,
+    '>=': operator.ge,
+    '<': operator.lt,
+    '<=': operator.le,
+}
+
+
+def field_layout(schema, with_lsn=True):
+    # return dict kolom -> (offset, tipe, size) di dalam record hasil RowSerializer
+    offset = 4 if with_lsn else 0
+    layout = {}
+    for attr in schema.get_attributes():
+        attr_type, size = attr['type'], attr['size']
+        layout[attr['name']] = (offset, attr_type, size)
+        if attr_type in ('int', 'float'):
+            offset += 4
+        elif attr_type == 'char':
+            offset += size
+        else:
+            offset += 4 + size
+    return layout
+
+
+def field_decoder(offset, attr_type, size):
+    # decode satu kolom saja, hasilnya sama dengan RowSerializer.deserialize
+    if attr_type == 'int':
+        return lambda record: struct.unpack_from(INT_FORMAT, record, offset)[0]
+    if attr_type == 'float':
+        return lambda record: round(struct.unpack_from(FLOAT_FORMAT, record, offset)[0], 2)
+    if attr_type == 'char':
+        return lambda record: record[offset:offset + size].decode('utf-8').rstrip('\x00')
+
+    def decode_varchar(record):
+        length = struct.unpack_from(VARCHAR_LENGTH_FORMAT, record, offset)[0]
+        return record[offset + 4:offset + 4 + length].decode('utf-8')
+    return decode_varchar
+
+
+def _bind_number(operand):
+    # samakan dengan StorageManager._match: string angka dibandingkan sebagai angka
+    if isinstance(operand, bool):
+        return None
+    if isinstance(operand, str):
+        s = operand.strip()
+        if not s.replace('.', '', 1).lstrip('+-').isdigit():
+            return None
+        operand = float(s) if '.' in s else int(s)
+    if isinstance(operand, float) and operand.is_integer():
+        operand = int(operand)
+    return operand if isinstance(operand, (int, float)) else None
+
+
+def bind_condition(layout, cond, fallback):
+    # return fungsi record_bytes -> bool. operand di-bind sekali ke tipe kolom;
+    # equality int/char/varchar dicek langsung ke byte, sisanya decode satu kolom saja.
+    # fallback(row, cond) = StorageManager._match untuk operand yang tidak bisa di-bind.
+    if cond.column not in layout:
+        return lambda record: fallback({}, cond)
+    offset, attr_type, size = layout[cond.column]
+    decode = field_decoder(offset, attr_type, size)
+    op = cond.operation
+    operand = cond.operand
+
+    def generic(record):
+        return fallback({cond.column: decode(record)}, cond)
+
+    if op == 'LIKE':
+        return lambda record: like_match(decode(record), operand)
+    compare = COMPARATORS.get(op)
+    if compare is None:
+        return generic
+
+    if attr_type in ('int', 'float'):
+        value = _bind_number(operand)
+        if value is None:
+            return generic
+        if attr_type == 'int' and op in ('=', '<>', '!='):
+            if isinstance(value, float) or not -2 ** 31 <= value < 2 ** 31:
+                return (lambda record: False) if op == '=' else (lambda record: True)
+            packed = struct.pack(INT_FORMAT, value)
+            if op == '=':
+                return lambda record: record.startswith(packed, offset)
+            return lambda record: not record.startswith(packed, offset)
+        return lambda record: compare(decode(record), value)
+
+    if not isinstance(operand, str):
+        return generic
+
+    if op in ('=', '<>', '!='):
+        encoded = operand.encode('utf-8')
+        if len(encoded) > size or encoded.endswith(b'\x00'):
+            return generic
+        if attr_type == 'char':
+            packed = encoded.ljust(size, b'\x00')
+        else:
+            packed = struct.pack(VARCHAR_LENGTH_FORMAT, len(encoded)) + encoded
+        if op == '=':
+            return lambda record: record.startswith(packed, offset)
+        return lambda record: not record.startswith(packed, offset)
+
+    return lambda record: compare(decode(record), operand)
+
+
+def bind_conditions(schema, conditions, with_lsn, fallback):
+    # return fungsi record_bytes -> bool untuk AND semua kondisi
+    layout = field_layout(schema, with_lsn)
+    checks = [bind_condition(layout, cond, fallback) for cond in conditions]
+    if not checks:
+        return lambda record: True
+    if len(checks) == 1:
+        return checks[0]
+    return lambda record: all(check(record) for check in checks)
@@ -0,0 +1,144 @@
+import json
+import os
+import threading
+from collections import Counter
+
+PREWARM_FILE = 'prewarm.json'
+PREWARM_INTERVAL = 60  # detik antar dump hot set
+PREWARM_MAX_PAGES = 4096  # page terpanas yang dicatat
+PREWARM_REPORT_EVERY = 256  # progres dicetak setiap sekian page
+
+
+class Prewarmer:
+    """
+    Hot set untuk prewarm setelah restart.
+
+    Yang disimpan hanya identitas: (file tabel, page_id) yang paling sering
+    dibaca, index yang sedang dimuat, dan key row cache (tabel, pk) - bukan
+    isi datanya. Saat startup page dibaca ulang berurutan per file (mengisi
+    page cache OS), index dimuat ke memori, dan row cache diisi lewat lookup
+    primary key biasa, jadi data yang dipakai selalu versi terbaru di disk.
+    Hitungan akses dibagi dua setiap dump supaya page yang sudah dingin
+    perlahan keluar dari daftar.
+    """
+
+    def __init__(self, storage_manager, path, interval=PREWARM_INTERVAL, max_pages=PREWARM_MAX_PAGES):
+        self.storage_manager = storage_manager
+        self.path = path
+        self.interval = interval
+        self.max_pages = max_pages
+        self._heat = Counter()  # (nama file tabel, page_id) -> jumlah baca
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._dumper = None
+        self.progress = {'state': 'idle', 'pages': 0, 'pages_total': 0, 'indexes': 0, 'indexes_total': 0,
+                         'rows': 0, 'rows_total': 0}
+
+    def touch_page(self, name, page_id):
+        with self._lock:
+            self._heat[(name, page_id)] += 1
+
+    def snapshot(self):
+        sm = self.storage_manager
+        with self._lock:
+            hottest = self._heat.most_common(self.max_pages)
+            self._heat = Counter({key: count // 2 for key, count in self._heat.items() if count > 1})
+        pages = {}
+        for (name, page_id), _ in hottest:
+            pages.setdefault(name, []).append(page_id)
+
+        indexes = [
+            [table, column, index_type]
+            for manager, index_type in sm._index_io_managers()
+            for table, column in list(manager.loaded_indexes)
+        ]
+        rows = [[table, pk] for table, pk in sm.row_cache.keys()]
+        return {'pages': {name: sorted(page_ids) for name, page_ids in pages.items()}, 'indexes': indexes, 'rows': rows}
+
+    def dump(self):
+        # ditulis ke file sementara lalu di-rename, supaya crash di tengah dump tidak merusak hot set lama
+        hot_set = self.snapshot()
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(hot_set, f)
+        os.replace(tmp_path, self.path)
+        return hot_set
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def start_dumping(self):
+        if self._dumper is not None:
+            return
+        self._stop.clear()
+        self._dumper = threading.Thread(target=self._dump_loop, name="prewarm-dump", daemon=True)
+        self._dumper.start()
+
+    def _dump_loop(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.dump()
+            except OSError as e:
+                print(f"[SM ERROR] Prewarm dump failed: {e}")
+
+    def stop(self):
+        if self._dumper is not None:
+            self._stop.set()
+            self._dumper.join()
+            self._dumper = None
+
+    def warm(self, report=print):
+        # baca ulang hot set; report(msg) dipanggil untuk progres (None = diam)
+        hot_set = self.load()
+        if not hot_set:
+            self.progress['state'] = 'done'
+            return self.progress
+
+        sm = self.storage_manager
+        tables = {table.lower(): table for table in sm.schema_manager.list_tables()}
+        pages = hot_set.get('pages', {})
+        indexes = hot_set.get('indexes', [])
+        rows = hot_set.get('rows', [])
+        self.progress.update(state='warming', pages=0, pages_total=sum(len(ids) for ids in pages.values()),
+                             indexes=0, indexes_total=len(indexes), rows=0, rows_total=len(rows))
+        if report:
+            report(f"[SM] Prewarm: {self.progress['pages_total']} pages, {len(indexes)} indexes, {len(rows)} rows")
+
+        managers = {index_type: manager for manager, index_type in sm._index_io_managers()}
+        for table, column, index_type in indexes:
+            manager = managers.get(index_type)
+            if manager is not None and sm.schema_manager.get_table_schema(sm._logical_table(table)) is not None:
+                table_path = sm._get_table_file_path(table)
+                with sm.latches.index(table_path).shared():
+                    manager.load_index(table, column)
+            self.progress['indexes'] += 1
+
+        for name, page_ids in sorted(pages.items()):
+            table_path = os.path.join(sm.base_path, f"{name}.dat")
+            if os.path.exists(table_path):
+                with sm.latches.table(table_path).shared(), sm._open_table(table_path, "rb") as f:
+                    for page_id in page_ids:
+                        sm._read_page_bytes(f, page_id)
+                        self.progress['pages'] += 1
+                        if report and self.progress['pages'] % PREWARM_REPORT_EVERY == 0:
+                            report(f"[SM] Prewarm: {self.progress['pages']}/{self.progress['pages_total']} pages")
+            else:
+                self.progress['pages'] += len(page_ids)
+
+        for table, pk in rows:
+            table = tables.get(table.lower())
+            if table is not None:
+                sm._prewarm_row(table, pk)
+            self.progress['rows'] += 1
+
+        self.progress['state'] = 'done'
+        if report:
+            report(f"[SM] Prewarm done: {self.progress['pages']} pages, {self.progress['indexes']} indexes, "
+                   f"{self.progress['rows']} rows")
+        return self.progress
@@ -0,0 +1,104 @@
+import threading
+from collections import OrderedDict
+
+ROW_CACHE_SIZE = 4096  # jumlah key (table, pk) maksimal, terpisah dari buffer FRM
+
+
+class RowCache:
+    # LRU row hasil decode untuk lookup equality pada primary key (kolom pertama schema).
+    # value = list row (pk tidak dipaksa unik, list kosong juga di-cache sebagai negative hit).
+    # generasi per tabel naik setiap invalidate/clear; put membawa generasi yang dibaca sebelum
+    # row diambil dari disk, jadi hasil baca yang didahului tulisan tidak pernah masuk cache.
+
+    def __init__(self, capacity=ROW_CACHE_SIZE):
+        self.capacity = capacity
+        self._entries = OrderedDict()
+        self._keys_by_table = {}
+        self._generations = {}  # tabel -> generasi
+        self._epoch = 0  # naik setiap clear
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _key(self, table, pk):
+        return (table.lower(), pk)
+
+    def generation(self, table):
+        with self._lock:
+            return self._epoch, self._generations.get(table.lower(), 0)
+
+    def get(self, table, pk):
+        key = self._key(table, pk)
+        with self._lock:
+            rows = self._entries.get(key)
+            if rows is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return rows
+
+    def put(self, table, pk, rows, generation=None):
+        # generation dari generation() sebelum row dibaca; kalau sudah berubah, rows bisa basi
+        if self.capacity <= 0:
+            return
+        key = self._key(table, pk)
+        with self._lock:
+            if generation is not None and generation != (self._epoch, self._generations.get(key[0], 0)):
+                return
+            self._entries[key] = rows
+            self._entries.move_to_end(key)
+            self._keys_by_table.setdefault(key[0], set()).add(pk)
+            while len(self._entries) > self.capacity:
+                (evicted_table, evicted_pk), _ = self._entries.popitem(last=False)
+                self._keys_by_table[evicted_table].discard(evicted_pk)
+                self.evictions += 1
+
+    def invalidate(self, table, pks=None):
+        # pks None = buang semua key milik tabel
+        table = table.lower()
+        with self._lock:
+            self._generations[table] = self._generations.get(table, 0) + 1
+            table_keys = self._keys_by_table.get(table)
+            if not table_keys:
+                return
+            targets = list(table_keys) if pks is None else [pk for pk in pks if pk in table_keys]
+            for pk in targets:
+                del self._entries[(table, pk)]
+                table_keys.discard(pk)
+                self.invalidations += 1
+
+    def keys(self):
+        # key (table, pk) urut dari yang paling lama tidak dipakai, untuk hot set prewarm
+        with self._lock:
+            return list(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._epoch += 1
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._keys_by_table.clear()
+
+    def resize(self, capacity):
+        with self._lock:
+            self.capacity = capacity
+            while len(self._entries) > max(capacity, 0):
+                (evicted_table, evicted_pk), _ = self._entries.popitem(last=False)
+                self._keys_by_table[evicted_table].discard(evicted_pk)
+                self.evictions += 1
+
+    def get_stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'capacity': self.capacity,
+                'size': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+            }
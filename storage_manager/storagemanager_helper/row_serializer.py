@@ -30,7 +30,12 @@ class RowSerializer:
 
         return bytes(byte_array)
 
-    def deserialize(self, schema, byte_data):
+    def deserialize(self, schema, byte_data, version=None):
+        # version = versi schema record (dari slot); record versi lama didecode dengan
+        # layout lamanya lalu dinaikkan ke schema sekarang
+        if version is not None and version != getattr(schema, 'version', 0):
+            return schema.upgrade(self.deserialize(schema.layout(version), byte_data), version)
+
         record = {}
         offset = 0
 
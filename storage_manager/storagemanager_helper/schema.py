@@ -1,8 +1,16 @@
 from typing import Any, Dict, List, Optional
 
+# nilai kolom baru untuk row lama kalau ALTER TABLE ADD COLUMN tanpa DEFAULT
+TYPE_DEFAULTS = {'int': 0, 'float': 0.0, 'char': '', 'varchar': ''}
+
 class Schema:
     def __init__(self, attributes: Optional[List[Dict[str, Any]]] = None):
         self.attributes = attributes if attributes is not None else []
+        # ALTER TABLE hanya mengubah katalog: row lama tetap memakai layout versinya sendiri
+        self.version = 0
+        self.versions: Dict[int, 'Schema'] = {}  # versi lama -> layout record versi itu
+        self.defaults: Dict[str, Any] = {}  # default kolom hasil ADD COLUMN
+        self._carried: Dict[int, set] = {}
 
     def add_attribute(self, name, type, size):
         if any(attr['name'] == name for attr in self.attributes):
@@ -18,6 +26,40 @@ class Schema:
                 return attr
         raise ValueError(f"Attribute '{name}' not found in the schema.")
     
+    def layout(self, version):
+        # schema yang dipakai untuk encode record versi `version`
+        if version == self.version:
+            return self
+        if version not in self.versions:
+            raise ValueError(f"Schema version {version} not found.")
+        return self.versions[version]
+
+    def carried_columns(self, version):
+        # kolom yang ada terus-menerus sejak versi `version` sampai sekarang (drop lalu add ulang = kolom baru)
+        if version in self._carried:
+            return self._carried[version]
+        carried = {(attr['name'], attr['type'], attr['size']) for attr in self.layout(version).attributes}
+        for v in range(version + 1, self.version + 1):
+            carried &= {(attr['name'], attr['type'], attr['size']) for attr in self.layout(v).attributes}
+        self._carried[version] = {name for name, _, _ in carried}
+        return self._carried[version]
+
+    def upgrade(self, row, version):
+        # row hasil decode layout versi lama -> kolom schema sekarang
+        carried = self.carried_columns(version)
+        upgraded = {'_lsn': row.get('_lsn', 0)}
+        for attr in self.attributes:
+            name = attr['name']
+            if name in carried:
+                upgraded[name] = row[name]
+            else:
+                upgraded[name] = self.default_value(attr)
+        return upgraded
+
+    def default_value(self, attr):
+        # DEFAULT kolom dari ADD COLUMN, kalau tidak ada default tipenya
+        return self.defaults.get(attr['name'], TYPE_DEFAULTS.get(attr['type']))
+
     def get_metadata(self):
         return [(attr['name'], attr['type'], attr['size']) for attr in self.attributes]
     
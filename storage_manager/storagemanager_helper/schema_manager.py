@@ -1,4 +1,6 @@
 from .schema import Schema
+from .slotted_page import MAX_SCHEMA_VERSION
+import json
 import struct
 import os
 
@@ -6,9 +8,13 @@ class SchemaManager:
     def __init__(self, base_path='data'):
         self.schemas = {}
         self.base_path = base_path
+        self.table_options = None
+        self.schema_versions = None
 
     def add_table_schema(self, table_name, schema):
         self.schemas[table_name] = schema
+        # tabel baru (misal dibuat ulang setelah DROP) mulai dari versi 0 lagi
+        self.remove_schema_versions(table_name)
 
     def save_schemas(self):
         path = os.path.join(self.base_path, 'schema.dat')
@@ -42,6 +48,7 @@ class SchemaManager:
                 schema_data = f.read(schema_data_len)
 
                 schema = Schema().deserialize(schema_data)
+                self._attach_versions(table_name, schema)
                 self.schemas[table_name] = schema
 
     def get_table_schema(self, table_name):
@@ -50,4 +57,95 @@ class SchemaManager:
     def list_tables(self):
         return list(self.schemas.keys())
 
-   
\ No newline at end of file
+   
+
+    # opsi fisik per tabel (misal clustered_by), disimpan terpisah dari schema.dat
+    def _load_table_options(self):
+        if self.table_options is None:
+            path = os.path.join(self.base_path, 'table_options.json')
+            self.table_options = {}
+            if os.path.exists(path):
+                with open(path, 'r') as f:
+                    self.table_options = json.load(f)
+        return self.table_options
+
+    def save_table_options(self):
+        path = os.path.join(self.base_path, 'table_options.json')
+        with open(path, 'w') as f:
+            json.dump(self._load_table_options(), f, indent=2)
+
+    def get_table_options(self, table_name):
+        return dict(self._load_table_options().get(table_name, {}))
+
+    def set_table_option(self, table_name, key, value):
+        options = self._load_table_options().setdefault(table_name, {})
+        if value is None:
+            options.pop(key, None)
+        else:
+            options[key] = value
+        if not options:
+            self.table_options.pop(table_name, None)
+        self.save_table_options()
+
+    def remove_table_options(self, table_name):
+        if self._load_table_options().pop(table_name, None) is not None:
+            self.save_table_options()
+
+    # versi schema hasil ALTER TABLE, disimpan terpisah dari schema.dat.
+    # format: {table: {"version": n, "layouts": {"0": [[name, type, size], ...], ...}, "defaults": {...}}}
+    def _load_schema_versions(self):
+        if self.schema_versions is None:
+            path = os.path.join(self.base_path, 'schema_versions.json')
+            self.schema_versions = {}
+            if os.path.exists(path):
+                with open(path, 'r') as f:
+                    self.schema_versions = json.load(f)
+        return self.schema_versions
+
+    def save_schema_versions(self):
+        path = os.path.join(self.base_path, 'schema_versions.json')
+        with open(path, 'w') as f:
+            json.dump(self._load_schema_versions(), f, indent=2)
+
+    def _attach_versions(self, table_name, schema):
+        entry = self._load_schema_versions().get(table_name)
+        if entry is None:
+            return
+        schema.version = entry['version']
+        schema.defaults = dict(entry.get('defaults', {}))
+        schema.versions = {
+            int(version): Schema([{'name': name, 'type': type_, 'size': size} for name, type_, size in layout])
+            for version, layout in entry['layouts'].items()
+        }
+
+    def remove_schema_versions(self, table_name):
+        if self._load_schema_versions().pop(table_name, None) is not None:
+            self.save_schema_versions()
+
+    def alter_table_schema(self, table_name, new_schema, defaults=None):
+        # catat schema baru sebagai versi berikutnya; record lama tidak ditulis ulang
+        current = self.schemas.get(table_name)
+        if current is None:
+            raise ValueError(f"Table '{table_name}' not found.")
+        version = current.version + 1
+        if version > MAX_SCHEMA_VERSION:
+            raise ValueError(
+                f"Table '{table_name}' already has {MAX_SCHEMA_VERSION} schema versions; rebuild the table first."
+            )
+
+        layouts = {str(v): layout.get_metadata() for v, layout in current.versions.items()}
+        layouts[str(current.version)] = current.get_metadata()
+        merged_defaults = {
+            name: value for name, value in current.defaults.items()
+            if any(attr['name'] == name for attr in new_schema.get_attributes())
+        }
+        merged_defaults.update(defaults or {})
+
+        self._load_schema_versions()[table_name] = {
+            'version': version, 'layouts': layouts, 'defaults': merged_defaults,
+        }
+        self._attach_versions(table_name, new_schema)
+        self.schemas[table_name] = new_schema
+        self.save_schemas()
+        self.save_schema_versions()
+        return new_schema
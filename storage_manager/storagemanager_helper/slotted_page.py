@@ -1,134 +1,228 @@
 import struct
 
-PAGE_SIZE = 4096 
+PAGE_SIZE = 4096
 HEADER_SIZE = 4
 SLOT_SIZE = 8
 
+# bit atas field length pada slot dipakai untuk flag, bit 16-23 untuk versi schema record,
+# 16 bit bawah untuk panjang record
+SLOT_LENGTH_MASK = 0xFFFF
+SLOT_VERSION_SHIFT = 16
+SLOT_VERSION_MASK = 0x00FF0000
+MAX_SCHEMA_VERSION = 0xFF
+SLOT_FLAG_DELETED = 1 << 24   # tombstone, nomor slot boleh dipakai ulang
+SLOT_FLAG_FORWARD = 1 << 25   # isi slot adalah pointer (page_id, slot_id) ke lokasi baru row
+SLOT_FLAG_MOVED = 1 << 26     # row pindahan, diawali RID asal (home) supaya index tetap valid
+SLOT_FLAGS_MASK = 0xFF000000
+
+POINTER_FORMAT = '<II'
+POINTER_SIZE = 8
+
 class SlottedPage:
+    """
+    Slot bersifat stabil: delete hanya menandai tombstone dan update yang
+    tidak muat lagi dipindah ke page lain dengan meninggalkan forwarding
+    pointer, jadi RID (page_id, slot_id) yang disimpan index tidak berubah.
+    Ruang yang terbuang baru dirapikan (compact) saat ruang kosong di tengah
+    page cukup tapi tidak kontigu.
+    """
+
     def __init__(self):
         self.data = bytearray(PAGE_SIZE)
-        self.record_count = 0
+        self.record_count = 0  # jumlah slot, termasuk tombstone
         self.free_space_offset = HEADER_SIZE
         self.free_record_offset = PAGE_SIZE
         self.slots = []
 
-    def add_record(self, record_bytes):
-        record_length = len(record_bytes)
-        
-        record_start = self.free_record_offset - record_length
-        if record_start < self.free_space_offset + SLOT_SIZE:
+    def _write_slot(self, slot_index):
+        start, length, flags = self.slots[slot_index]
+        offset = HEADER_SIZE + slot_index * SLOT_SIZE
+        self.data[offset:offset + SLOT_SIZE] = struct.pack('<II', start, length | flags)
+
+    def free_space(self):
+        return self.free_record_offset - self.free_space_offset
+
+    def reclaimable_space(self):
+        used = sum(length for _, length, flags in self.slots if not flags & SLOT_FLAG_DELETED)
+        return PAGE_SIZE - self.free_space_offset - used
+
+    def _allocate(self, length, new_slot):
+        # cari ruang untuk `length` byte; compact hanya kalau ruang kontigu tidak cukup
+        needed = length + (SLOT_SIZE if new_slot else 0)
+        if self.free_space() < needed:
+            if self.reclaimable_space() < needed:
+                return None
+            self.compact()
+        self.free_record_offset -= length
+        return self.free_record_offset
+
+    def add_record(self, record_bytes, home=None, version=0):
+        # version = versi schema yang dipakai untuk encode record (lihat ALTER TABLE)
+        payload = record_bytes
+        flags = version << SLOT_VERSION_SHIFT
+        if home is not None:
+            payload = struct.pack(POINTER_FORMAT, *home) + record_bytes
+            flags |= SLOT_FLAG_MOVED
+
+        slot_index = next(
+            (i for i, (_, _, slot_flags) in enumerate(self.slots) if slot_flags & SLOT_FLAG_DELETED), None
+        )
+
+        record_start = self._allocate(len(payload), new_slot=slot_index is None)
+        if record_start is None:
             raise Exception("Not enough space to add record")
 
-        self.data[record_start:self.free_record_offset] = record_bytes
+        self.data[record_start:record_start + len(payload)] = payload
 
-        self.data[self.free_space_offset:self.free_space_offset + SLOT_SIZE] = struct.pack('<II', record_start, record_length)
+        if slot_index is None:
+            slot_index = self.record_count
+            self.slots.append((record_start, len(payload), flags))
+            self.free_space_offset += SLOT_SIZE
+            self.record_count += 1
+        else:
+            self.slots[slot_index] = (record_start, len(payload), flags)
 
-        self.slots.append((record_start, record_length))
-        self.free_space_offset += SLOT_SIZE
-        self.free_record_offset = record_start
-        self.record_count += 1
+        self._write_slot(slot_index)
+        return slot_index
 
-    
     def serialize(self):
         header = struct.pack("<HH", self.record_count, self.free_space_offset)
         self.data[0:HEADER_SIZE] = header
         return bytes(self.data)
-    
+
     def load(self, byte_data):
         self.data = bytearray(byte_data)
         self.record_count, self.free_space_offset = struct.unpack("<HH", self.data[:HEADER_SIZE])
         self.slots = []
         for i in range(self.record_count):
             offset = HEADER_SIZE + i * SLOT_SIZE
-            record_start, record_length = struct.unpack("<II", self.data[offset:offset + SLOT_SIZE])
-            self.slots.append((record_start, record_length))
-        
-        if self.slots:
-            self.free_record_offset = min(start for start, _ in self.slots)
-        else:
-            self.free_record_offset = PAGE_SIZE
-
-    def get_record(self, slot_index):  
-        record_start, record_length = self.slots[slot_index]
+            record_start, raw_length = struct.unpack("<II", self.data[offset:offset + SLOT_SIZE])
+            # elemen ketiga = flag + versi schema, ikut tersalin setiap record digeser di dalam page
+            self.slots.append((record_start, raw_length & SLOT_LENGTH_MASK, raw_length & ~SLOT_LENGTH_MASK))
+
+        occupied = [start for start, length, flags in self.slots if length and not flags & SLOT_FLAG_DELETED]
+        self.free_record_offset = min(occupied) if occupied else PAGE_SIZE
+
+    def is_live(self, slot_index):
+        # slot berisi row yang harus dibaca scan (bukan tombstone / forwarding pointer)
+        _, _, flags = self.slots[slot_index]
+        return not flags & (SLOT_FLAG_DELETED | SLOT_FLAG_FORWARD)
+
+    def live_slots(self):
+        return [i for i in range(self.record_count) if self.is_live(i)]
+
+    def get_forward(self, slot_index):
+        start, _, flags = self.slots[slot_index]
+        if not flags & SLOT_FLAG_FORWARD:
+            return None
+        return struct.unpack_from(POINTER_FORMAT, self.data, start)
+
+    def get_home(self, slot_index):
+        start, _, flags = self.slots[slot_index]
+        if not flags & SLOT_FLAG_MOVED:
+            return None
+        return struct.unpack_from(POINTER_FORMAT, self.data, start)
+
+    def clear_home(self, slot_index):
+        # row pindahan jadi row biasa di slot ini (dipakai vacuum setelah index di-remap ke RID baru)
+        start, length, flags = self.slots[slot_index]
+        if not flags & SLOT_FLAG_MOVED:
+            return
+        self.data[start:start + POINTER_SIZE] = b'\x00' * POINTER_SIZE
+        self.slots[slot_index] = (start + POINTER_SIZE, length - POINTER_SIZE, flags & ~SLOT_FLAG_MOVED)
+        self._write_slot(slot_index)
+
+    def get_version(self, slot_index):
+        _, _, flags = self.slots[slot_index]
+        return (flags & SLOT_VERSION_MASK) >> SLOT_VERSION_SHIFT
+
+    def get_record(self, slot_index):
+        record_start, record_length, flags = self.slots[slot_index]
+        if flags & (SLOT_FLAG_DELETED | SLOT_FLAG_FORWARD):
+            raise ValueError(f"Slot {slot_index} tidak berisi record")
+        if flags & SLOT_FLAG_MOVED:
+            record_start += POINTER_SIZE
+            record_length -= POINTER_SIZE
         return bytes(self.data[record_start:record_start + record_length])
-    
-    def update_record(self, slot_index, new_record_bytes):
-        new_length = len(new_record_bytes)
-        old_start, old_length = self.slots[slot_index]
-
-        if new_length == old_length:
-            self.data[old_start:old_start + new_length] = new_record_bytes
-            return True
-        
-        if new_length < old_length:
-            diff = old_length - new_length
-            self.data[old_start:old_start + new_length] = new_record_bytes
-
-            upper_data_start = old_start + new_length
-            upper_data_length = self.free_record_offset - upper_data_start
-            if upper_data_length > 0:
-                self.data[old_start + new_length : old_start + new_length + upper_data_length] = self.data[upper_data_start : upper_data_start + upper_data_length]
-
-            self.free_record_offset += diff
-
-            self.slots[slot_index] = (old_start, new_length)
-
-            for i, (start, length) in enumerate(self.slots):
-                if start < old_start:
-                    continue
-                self.slots[i] = (start + diff, length)
 
+    def update_record(self, slot_index, new_record_bytes, version=None):
+        # return False kalau record baru tidak muat di page ini (caller memindahkan row).
+        # version None = versi schema record tidak berubah
+        old_start, old_length, old_flags = self.slots[slot_index]
+        if old_flags & (SLOT_FLAG_DELETED | SLOT_FLAG_FORWARD):
+            raise ValueError(f"Slot {slot_index} tidak berisi record")
+        flags = old_flags
+        if version is not None:
+            flags = (flags & ~SLOT_VERSION_MASK) | (version << SLOT_VERSION_SHIFT)
+
+        payload = new_record_bytes
+        if flags & SLOT_FLAG_MOVED:
+            payload = bytes(self.data[old_start:old_start + POINTER_SIZE]) + new_record_bytes
+
+        if len(payload) <= old_length:
+            self.data[old_start:old_start + len(payload)] = payload
+            self.slots[slot_index] = (old_start, len(payload), flags)
+            self._write_slot(slot_index)
             return True
-        
-        extra_space_needed = new_length - old_length
 
-        if self.free_record_offset - extra_space_needed < self.free_space_offset + SLOT_SIZE:
+        # record lama boleh ikut dibuang kalau page perlu di-compact
+        self.slots[slot_index] = (0, 0, SLOT_FLAG_DELETED)
+        record_start = self._allocate(len(payload), new_slot=False)
+        if record_start is None:
+            self.slots[slot_index] = (old_start, old_length, old_flags)
             return False
-        
-        upper_data_start = old_start + old_length
-        upper_data_length = self.free_record_offset - upper_data_start
-        if upper_data_length > 0:
-            self.data[old_start + new_length : old_start + new_length + upper_data_length] = self.data[upper_data_start : upper_data_start + upper_data_length]
-
-        self.data[old_start:old_start + new_length] = new_record_bytes
-
-        self.free_record_offset -= extra_space_needed
-
-        self.slots[slot_index] = (old_start, new_length)
-
-        for i, (start, length) in enumerate(self.slots):
-            if start < old_start:
-                continue
-            self.slots[i] = (start - extra_space_needed, length)
 
+        self.data[record_start:record_start + len(payload)] = payload
+        self.slots[slot_index] = (record_start, len(payload), flags)
+        self._write_slot(slot_index)
         return True
-    
-    def delete_record(self, slot_index):
-        old_start, old_length = self.slots[slot_index]
-
-        upper_data_length = old_start - self.free_record_offset
-        
-        if upper_data_length > 0:
-            self.data[self.free_record_offset + old_length : old_start + old_length] = self.data[self.free_record_offset : old_start]
 
-        # Update free_record_offset
-        self.free_record_offset += old_length
+    def set_forward(self, slot_index, page_id, target_slot_id):
+        pointer = struct.pack(POINTER_FORMAT, page_id, target_slot_id)
+        old_start, old_length, _ = self.slots[slot_index]
 
-        del self.slots[slot_index]
-        self.record_count -= 1
-        self.free_space_offset -= SLOT_SIZE
-
-        for i, (start, length) in enumerate(self.slots):
-            if start < old_start:  # Records physically above (lower offset)
-                self.slots[i] = (start + old_length, length)
-
-        for i, (start, length) in enumerate(self.slots):
-            offset = HEADER_SIZE + i * SLOT_SIZE
-            self.data[offset:offset + SLOT_SIZE] = struct.pack('<II', start, length)
-        
-        old_last_slot_offset = HEADER_SIZE + self.record_count * SLOT_SIZE
-        self.data[old_last_slot_offset:old_last_slot_offset + SLOT_SIZE] = b'\x00' * SLOT_SIZE
+        if old_length >= POINTER_SIZE:
+            record_start = old_start
+        else:
+            self.slots[slot_index] = (0, 0, SLOT_FLAG_DELETED)
+            record_start = self._allocate(POINTER_SIZE, new_slot=False)
+            if record_start is None:
+                raise Exception("Not enough space to add forwarding pointer")
 
+        self.data[record_start:record_start + POINTER_SIZE] = pointer
+        self.slots[slot_index] = (record_start, POINTER_SIZE, SLOT_FLAG_FORWARD)
+        self._write_slot(slot_index)
 
+    def delete_record(self, slot_index):
+        # O(1): tandai tombstone, record lain tidak digeser
+        self.slots[slot_index] = (0, 0, SLOT_FLAG_DELETED)
+        self._write_slot(slot_index)
+
+        # tombstone di ujung directory tidak dirujuk siapa pun, jadi boleh dibuang
+        while self.slots and self.slots[-1][2] & SLOT_FLAG_DELETED:
+            self.slots.pop()
+            self.record_count -= 1
+            self.free_space_offset -= SLOT_SIZE
+            offset = HEADER_SIZE + self.record_count * SLOT_SIZE
+            self.data[offset:offset + SLOT_SIZE] = b'\x00' * SLOT_SIZE
+
+        occupied = [start for start, length, flags in self.slots if length and not flags & SLOT_FLAG_DELETED]
+        self.free_record_offset = min(occupied) if occupied else PAGE_SIZE
+
+    def compact(self):
+        # rapatkan semua record ke ujung page, nomor slot tetap
+        payloads = []
+        for i, (start, length, flags) in enumerate(self.slots):
+            if flags & SLOT_FLAG_DELETED:
+                continue
+            payloads.append((i, bytes(self.data[start:start + length]), flags))
 
+        offset = PAGE_SIZE
+        for i, payload, flags in payloads:
+            offset -= len(payload)
+            self.data[offset:offset + len(payload)] = payload
+            self.slots[i] = (offset, len(payload), flags)
+            self._write_slot(i)
 
+        self.data[self.free_space_offset:offset] = b'\x00' * (offset - self.free_space_offset)
+        self.free_record_offset = offset
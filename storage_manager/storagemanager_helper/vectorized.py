@@ -0,0 +1,145 @@
+import struct
+
+try:
+    import numpy as np
+except ImportError:  # numpy opsional: tanpa numpy scan tetap row-at-a-time
+    np = None
+
+from .predicate import COMPARATORS, field_layout, field_decoder, bind_conditions, _bind_number
+
+VECTOR_MIN_ROWS = 16  # page dengan row lebih sedikit tidak sebanding dengan overhead numpy
+NUMPY_FORMATS = {'int': '=i4', 'float': '=f4'}  # sama dengan struct 'i' / 'f' di DataEncoder
+
+# urutan float32 sebagai bilangan bulat (tanpa NaN), dipakai mencari batas round(x, 2)
+_FLOAT32_FIRST = 0x007FFFFF  # -inf
+_FLOAT32_LAST = 0xFF800000  # +inf
+
+
+def _ordinal_to_float32(ordinal):
+    bits = ordinal & 0x7FFFFFFF if ordinal & 0x80000000 else ~ordinal & 0xFFFFFFFF
+    return struct.unpack('<f', struct.pack('<I', bits))[0]
+
+
+def _first_float32(predicate):
+    # float32 terkecil yang memenuhi predicate monoton (False... lalu True), None kalau tidak ada
+    low, high = _FLOAT32_FIRST, _FLOAT32_LAST + 1
+    while low < high:
+        middle = (low + high) // 2
+        if predicate(_ordinal_to_float32(middle)):
+            high = middle
+        else:
+            low = middle + 1
+    return _ordinal_to_float32(low) if low <= _FLOAT32_LAST else None
+
+
+def _at_least(values, bound):
+    return values >= bound if bound is not None else np.zeros(len(values), dtype=bool)
+
+
+def _below(values, bound):
+    return values < bound if bound is not None else ~np.isnan(values)
+
+
+def _int_check(compare, value):
+    # int64 supaya operand di luar rentang int32 tetap dibandingkan dengan benar
+    return lambda values: compare(values.astype(np.int64), value)
+
+
+def _float_check(op, value):
+    # row didecode sebagai round(float32, 2); round monoton, jadi setiap perbandingan dengan
+    # hasil round setara dengan perbandingan float32 mentah terhadap batas yang dicari sekali
+    ge = _first_float32(lambda x: round(x, 2) >= value)
+    gt = _first_float32(lambda x: round(x, 2) > value)
+    if op == '>=':
+        return lambda values: _at_least(values, ge)
+    if op == '>':
+        return lambda values: _at_least(values, gt)
+    if op == '<':
+        return lambda values: _below(values, ge)
+    if op == '<=':
+        return lambda values: _below(values, gt)
+    if op == '=':
+        return lambda values: _at_least(values, ge) & _below(values, gt)
+    return lambda values: ~(_at_least(values, ge) & _below(values, gt))
+
+
+def _vector_check(layout, cond):
+    # return fungsi array kolom -> mask bool, atau None kalau kondisi harus dicek per row
+    if cond.column not in layout or cond.operation not in COMPARATORS:
+        return None
+    _, attr_type, _ = layout[cond.column]
+    if attr_type not in NUMPY_FORMATS:
+        return None
+    value = _bind_number(cond.operand)
+    if value is None:
+        return None
+    if attr_type == 'int':
+        return _int_check(COMPARATORS[cond.operation], value)
+    return _float_check(cond.operation, value)
+
+
+class VectorFilter:
+    """
+    Filter scan per page dengan numpy untuk kolom int/float.
+
+    Semua record satu versi schema punya panjang tetap, jadi record live satu
+    page digabung lalu dibaca sebagai structured array lewat np.frombuffer.
+    Kondisi int/float dievaluasi sebagai mask boolean; kondisi lain (char,
+    varchar, LIKE) dicek per record pada byte (bind_conditions) hanya untuk
+    row yang lolos mask. Row baru didecode setelah lolos semua kondisi.
+    """
+
+    def __init__(self, schema, conditions, with_lsn, fallback):
+        self.layout = field_layout(schema, with_lsn)
+        self.checks = []
+        residual = []
+        for cond in conditions:
+            check = _vector_check(self.layout, cond)
+            if check is None:
+                residual.append(cond)
+            else:
+                self.checks.append((cond.column, check))
+        self.residual = bind_conditions(schema, residual, with_lsn, fallback) if residual else None
+
+        columns = [name for name, (_, attr_type, _) in self.layout.items() if attr_type in NUMPY_FORMATS]
+        self.dtype = np.dtype({
+            'names': columns,
+            'formats': [NUMPY_FORMATS[self.layout[name][1]] for name in columns],
+            'offsets': [self.layout[name][0] for name in columns],
+            'itemsize': self._record_size(),
+        })
+
+    def _record_size(self):
+        size = 0
+        for offset, attr_type, attr_size in self.layout.values():
+            width = 4 if attr_type in ('int', 'float') else attr_size if attr_type == 'char' else 4 + attr_size
+            size = max(size, offset + width)
+        return size
+
+    def filter(self, records):
+        # return index record (urut) yang memenuhi semua kondisi
+        values = np.frombuffer(b''.join(records), dtype=self.dtype)
+        mask = None
+        for column, check in self.checks:
+            column_mask = check(values[column])
+            mask = column_mask if mask is None else mask & column_mask
+        keep = np.flatnonzero(mask).tolist()
+        if self.residual is not None:
+            keep = [i for i in keep if self.residual(records[i])]
+        return keep
+
+    def column_decoders(self, columns):
+        # projection: kolom yang diminta saja yang didecode; None = decode seluruh row
+        if columns == "*" or columns is None:
+            return None
+        if isinstance(columns, str):
+            columns = [columns]
+        return [(column, field_decoder(*self.layout[column])) for column in columns]
+
+
+def bind_vector_filter(schema, conditions, with_lsn, fallback):
+    # None kalau numpy tidak ada atau tidak ada kondisi int/float yang bisa divektorisasi
+    if np is None or not conditions:
+        return None
+    vector_filter = VectorFilter(schema, conditions, with_lsn, fallback)
+    return vector_filter if vector_filter.checks else None
@@ -0,0 +1,328 @@
+import bisect
+import os
+import struct
+
+from .like import like_prefix_range
+
+
+class ZoneMapManager:
+    """
+    Zone map per tabel: min/max setiap kolom untuk setiap page.
+    Disimpan di samping file tabel ({table}.zmap) dan dipakai full scan
+    untuk melewati page yang rentang nilainya tidak mungkin memenuhi kondisi.
+
+    Zone map diberi stamp (ukuran file, mtime) dari file .dat. Kalau file
+    tabel berubah di luar StorageManager (misal init.py), stamp tidak cocok
+    dan zone map dibuang lalu dibangun ulang pada full scan berikutnya.
+    """
+
+    def __init__(self, base_path='data'):
+        self.base_path = base_path
+        self.loaded_zone_maps = {}
+
+    def _get_zone_map_filename(self, table_path):
+        return os.path.splitext(table_path)[0] + '.zmap'
+
+    def _file_stamp(self, table_path):
+        try:
+            st = os.stat(table_path)
+        except OSError:
+            return None
+        return (st.st_size, st.st_mtime_ns)
+
+    def _serialize_value(self, value):
+        if value is None:
+            return struct.pack('B', 0)
+        if isinstance(value, bool) or isinstance(value, int):
+            return struct.pack('B', 1) + struct.pack('q', int(value))
+        if isinstance(value, float):
+            # pakai double supaya batas tidak bergeser saat dibaca ulang
+            return struct.pack('B', 2) + struct.pack('d', value)
+        value_bytes = str(value).encode('utf-8')
+        return struct.pack('B', 3) + struct.pack('I', len(value_bytes)) + value_bytes
+
+    def _deserialize_value(self, data, offset):
+        value_type = struct.unpack_from('B', data, offset)[0]
+        offset += 1
+        if value_type == 0:
+            return None, offset
+        if value_type == 1:
+            return struct.unpack_from('q', data, offset)[0], offset + 8
+        if value_type == 2:
+            return struct.unpack_from('d', data, offset)[0], offset + 8
+        length = struct.unpack_from('I', data, offset)[0]
+        offset += 4
+        return data[offset:offset + length].decode('utf-8'), offset + length
+
+    def _serialize_zone_map(self, zone_map):
+        size, mtime_ns = zone_map['stamp'] if zone_map['stamp'] else (0, 0)
+        result = struct.pack('qq', size, mtime_ns)
+        result += struct.pack('I', len(zone_map['pages']))
+
+        for page_id, bounds in sorted(zone_map['pages'].items()):
+            result += struct.pack('I', page_id)
+            result += struct.pack('I', len(bounds))
+            for column, (min_val, max_val) in bounds.items():
+                column_bytes = column.encode('utf-8')
+                result += struct.pack('I', len(column_bytes))
+                result += column_bytes
+                result += self._serialize_value(min_val)
+                result += self._serialize_value(max_val)
+
+        return result
+
+    def _deserialize_zone_map(self, data):
+        offset = 0
+        size, mtime_ns = struct.unpack_from('qq', data, offset)
+        offset += 16
+
+        num_pages = struct.unpack_from('I', data, offset)[0]
+        offset += 4
+
+        pages = {}
+        for _ in range(num_pages):
+            page_id = struct.unpack_from('I', data, offset)[0]
+            offset += 4
+            num_columns = struct.unpack_from('I', data, offset)[0]
+            offset += 4
+
+            bounds = {}
+            for _ in range(num_columns):
+                column_len = struct.unpack_from('I', data, offset)[0]
+                offset += 4
+                column = data[offset:offset + column_len].decode('utf-8')
+                offset += column_len
+                min_val, offset = self._deserialize_value(data, offset)
+                max_val, offset = self._deserialize_value(data, offset)
+                bounds[column] = (min_val, max_val)
+
+            pages[page_id] = bounds
+
+        return {'stamp': (size, mtime_ns), 'pages': pages, 'dirty': False}
+
+    def get_zone_map(self, table_path):
+        # return zone map yang masih valid untuk file tabel, atau None
+        stamp = self._file_stamp(table_path)
+        if stamp is None:
+            return None
+
+        zone_map = self.loaded_zone_maps.get(table_path)
+        if zone_map is None:
+            zone_map_file = self._get_zone_map_filename(table_path)
+            if not os.path.exists(zone_map_file):
+                return None
+            try:
+                with open(zone_map_file, 'rb') as f:
+                    zone_map = self._deserialize_zone_map(f.read())
+            except (OSError, struct.error, UnicodeDecodeError):
+                return None
+            self.loaded_zone_maps[table_path] = zone_map
+
+        if zone_map['stamp'] != stamp:
+            self.drop_zone_map(table_path)
+            return None
+
+        return zone_map
+
+    def install(self, table_path, pages):
+        zone_map = {'stamp': self._file_stamp(table_path), 'pages': pages, 'dirty': True}
+        self.loaded_zone_maps[table_path] = zone_map
+        self.save_zone_map(table_path)
+        return zone_map
+
+    def compute_page_bounds(self, rows):
+        bounds = {}
+        for row in rows:
+            self._widen(bounds, row)
+        return bounds
+
+    def _widen(self, bounds, row):
+        # return True kalau ada batas yang berubah
+        changed = False
+        for column, value in row.items():
+            if column == '_lsn' or value is None:
+                continue
+            current = bounds.get(column)
+            if current is None:
+                bounds[column] = (value, value)
+                changed = True
+                continue
+            min_val, max_val = current
+            try:
+                if value < min_val:
+                    min_val = value
+                if value > max_val:
+                    max_val = value
+            except TypeError:
+                continue
+            if (min_val, max_val) != current:
+                bounds[column] = (min_val, max_val)
+                changed = True
+        return changed
+
+    def extend(self, table_path, page_id, row):
+        # dipanggil setelah insert/update; batas hanya melebar (tetap konservatif)
+        zone_map = self.loaded_zone_maps.get(table_path)
+        if zone_map is None:
+            return
+        bounds = zone_map['pages'].setdefault(page_id, {})
+        if self._widen(bounds, row):
+            zone_map.pop('fences', None)
+        zone_map['dirty'] = True
+
+    def set_page_bounds(self, table_path, page_id, rows):
+        # hitung ulang batas satu page (misal setelah page split)
+        zone_map = self.loaded_zone_maps.get(table_path)
+        if zone_map is None:
+            return
+        zone_map['pages'][page_id] = self.compute_page_bounds(rows)
+        zone_map.pop('fences', None)
+        zone_map['dirty'] = True
+
+    def get_fence_directory(self, zone_map, column):
+        # fence key (min/max kolom key) per page untuk clustered table, di-cache sampai batas berubah
+        fences = zone_map.setdefault('fences', {})
+        if column not in fences:
+            fences[column] = FenceDirectory.from_zone_map(zone_map, column)
+        return fences[column]
+
+    def touch(self, table_path):
+        # stamp ulang setelah StorageManager sendiri menulis file tabel
+        zone_map = self.loaded_zone_maps.get(table_path)
+        if zone_map is None:
+            return
+        zone_map['stamp'] = self._file_stamp(table_path)
+        zone_map['dirty'] = True
+
+    def forget_pages_from(self, table_path, first_page_id):
+        zone_map = self.loaded_zone_maps.get(table_path)
+        if zone_map is None:
+            return
+        for page_id in [p for p in zone_map['pages'] if p >= first_page_id]:
+            del zone_map['pages'][page_id]
+        zone_map.pop('fences', None)
+        zone_map['dirty'] = True
+
+    def page_may_match(self, zone_map, page_id, conditions):
+        bounds = zone_map['pages'].get(page_id)
+        if bounds is None:
+            return True
+
+        for cond in conditions:
+            column_bounds = bounds.get(cond.column)
+            if column_bounds is None:
+                # page tanpa nilai untuk kolom ini (page kosong) tidak mungkin match
+                if not bounds:
+                    return False
+                continue
+            if not self._bounds_may_match(column_bounds, cond.operation, cond.operand):
+                return False
+
+        return True
+
+    def _bounds_may_match(self, column_bounds, op, operand):
+        min_val, max_val = column_bounds
+        if op == "LIKE":
+            # hanya prefix literal yang bisa dibandingkan dengan min/max page
+            bounds = like_prefix_range(operand) if isinstance(min_val, str) else None
+            if bounds is None:
+                return True
+            return max_val >= bounds[0] and min_val <= bounds[1]
+        operand = _coerce_operand(min_val, operand)
+
+        try:
+            if op == "=":
+                return min_val <= operand <= max_val
+            if op in ("<>", "!="):
+                return not (min_val == max_val == operand)
+            if op == ">":
+                return max_val > operand
+            if op == ">=":
+                return max_val >= operand
+            if op == "<":
+                return min_val < operand
+            if op == "<=":
+                return min_val <= operand
+        except TypeError:
+            return True
+        return True
+
+    def save_zone_map(self, table_path):
+        zone_map = self.loaded_zone_maps.get(table_path)
+        if zone_map is None:
+            return False
+
+        zone_map_file = self._get_zone_map_filename(table_path)
+        with open(zone_map_file, 'wb') as f:
+            f.write(self._serialize_zone_map(zone_map))
+        zone_map['dirty'] = False
+        return True
+
+    def save_all(self):
+        for table_path, zone_map in list(self.loaded_zone_maps.items()):
+            if zone_map['dirty']:
+                self.save_zone_map(table_path)
+
+    def drop_zone_map(self, table_path):
+        self.loaded_zone_maps.pop(table_path, None)
+        zone_map_file = self._get_zone_map_filename(table_path)
+        try:
+            os.remove(zone_map_file)
+        except FileNotFoundError:
+            pass  # reader lain bisa membuang zone map stale yang sama bersamaan
+        return True
+
+
+class FenceDirectory:
+    """
+    Direktori sparse (min_key, max_key, page_id) yang diurutkan menurut min_key.
+    Untuk clustered table batas antar page hampir tidak overlap, jadi pencarian
+    page cukup binary search. prefix_max dipakai supaya tetap benar kalau ada
+    overlap (misal key di-update).
+    """
+
+    def __init__(self, entries):
+        entries = sorted(entries, key=lambda entry: (entry[0], entry[2]))
+        self.min_keys = [entry[0] for entry in entries]
+        self.max_keys = [entry[1] for entry in entries]
+        self.page_ids = [entry[2] for entry in entries]
+        self.prefix_max = []
+        for max_key in self.max_keys:
+            self.prefix_max.append(max_key if not self.prefix_max else max(self.prefix_max[-1], max_key))
+
+    @classmethod
+    def from_zone_map(cls, zone_map, column):
+        entries = []
+        for page_id, bounds in zone_map['pages'].items():
+            if column in bounds:
+                min_key, max_key = bounds[column]
+                entries.append((min_key, max_key, page_id))
+        return cls(entries)
+
+    def __len__(self):
+        return len(self.page_ids)
+
+    def pages_in_range(self, low=None, high=None):
+        # page yang rentangnya beririsan dengan [low, high]; None berarti tidak dibatasi
+        right = bisect.bisect_right(self.min_keys, high) if high is not None else len(self.page_ids)
+        left = bisect.bisect_left(self.prefix_max, low) if low is not None else 0
+        return sorted(
+            self.page_ids[i] for i in range(left, right)
+            if low is None or self.max_keys[i] >= low
+        )
+
+    def page_for_key(self, key):
+        # page terakhir yang min_key-nya <= key (page pertama kalau key lebih kecil dari semua)
+        if not self.page_ids:
+            return None
+        i = bisect.bisect_right(self.min_keys, key) - 1
+        return self.page_ids[max(i, 0)]
+
+
+def _coerce_operand(sample, operand):
+    # samakan dengan StorageManager._match: operand string angka dibandingkan sebagai angka
+    if isinstance(sample, (int, float)) and isinstance(operand, str):
+        s = operand.strip()
+        if s.replace('.', '', 1).lstrip('+-').isdigit():
+            return float(s) if '.' in s else int(s)
+    return operand
@@ -1,6 +1,6 @@
 class Condition:
     def __init__(self, column, operation, operand):
-        valid_ops = {'=', '<>', '>', '>=', '<', '<='}
+        valid_ops = {'=', '<>', '>', '>=', '<', '<=', 'LIKE'}
         if operation not in valid_ops:
             raise ValueError(f"Invalid operation: {operation}")
         self.column = column
@@ -1,5 +1,5 @@
 class Statistic:
-    def __init__(self, n_r, b_r, l_r, f_r, v_a_r, i_r):
+    def __init__(self, n_r, b_r, l_r, f_r, v_a_r, i_r, io=None):
         """
         nr: number of tuples in a relation r.
         br: number of blocks containing tuples of r.
@@ -7,6 +7,7 @@ class Statistic:
         fr: blocking factor of r - i.e., the number of tuples of r that fit into one block.
         V(A,r): number of distinct values that appear in r for attribute A; same as the size of A(r).
         ir: indexes on relation r.
+        io: cumulative I/O counters of r and its indexes (see StorageManager.get_io_stats).
         """
         
         self.n_r = n_r
@@ -14,4 +15,5 @@ class Statistic:
         self.l_r = l_r
         self.f_r = f_r
         self.v_a_r = v_a_r
-        self.i_r = i_r
\ No newline at end of file
+        self.i_r = i_r
+        self.io = io or {}